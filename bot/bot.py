@@ -37,6 +37,10 @@ class Bot(discord.Bot):
 
         return cog
 
+    async def close(self):
+        await support.HTTPClient.close()
+        await super().close()
+
     @property
     def pending_application_commands(self):
         return [
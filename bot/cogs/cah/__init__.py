@@ -4,6 +4,10 @@
 #                                      For more information, see the COPYING file.                                     #
 ########################################################################################################################
 
+from cogs.cah.corpus import *
+from cogs.cah.engine import *
 from cogs.cah.helpers import *
 from cogs.cah.models import *
+from cogs.cah.render import *
+from cogs.cah.uploads import *
 from cogs.cah.views import *
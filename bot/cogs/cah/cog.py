@@ -7,13 +7,14 @@
 import discord
 import inflect as ifl
 from discord import Option
-from discord.ext import commands
+from discord.ext import commands, tasks
 from llist import dllistnode
 
 import shrine
 import support
 from bot import bot
 from cogs import Cog, cah
+from settings import settings
 from support import SlashCommandGroup
 
 inflect = ifl.engine()
@@ -74,7 +75,35 @@ class CAHCog(Cog):
             choices=["Card Czar", "Popular Vote"],
             default="Card Czar",
         ),
+        packs: Option(
+            str,
+            description="Packs to play with, separated by commas. Leave blank to pick from a list.",
+            autocomplete=cah.pack_autocomplete,
+            required=False,
+        ),
+        cards: Option(
+            discord.Attachment,
+            description="Upload your own cards as a CSV or JSON file.",
+            required=False,
+        ),
     ):
+        if packs:
+            packs, unknown = cah.CAHPackIndex.bundled().resolve(packs)
+
+            if unknown:
+                msg = (
+                    f"I don't have any packs called {inflect.join([f'**{pack}**' for pack in unknown])}. "
+                    f"Pick packs from the suggestions and try again."
+                )
+                embed = discord.Embed(
+                    title="Unknown packs.",
+                    description=msg,
+                    color=support.Color.error(),
+                )
+                await ctx.respond(embed=embed, ephemeral=True)
+
+                return
+
         msg = (
             "Cards Against Humanity is a pretty vulgar game. You're likely to see content that may gross you out, "
             "offend you, or violate your server's rules. Are you cool with that?"
@@ -114,7 +143,9 @@ class CAHCog(Cog):
             )
 
             if confirmation:
-                deck = await cah.CAHPackSelectView(ctx=ctx).get_packs()
+                deck = await cah.CAHPackSelectView(ctx=ctx).get_packs(
+                    packs, upload=cards
+                )
 
                 if not deck:
                     return
@@ -489,6 +520,24 @@ class CAHCog(Cog):
 
         await cah_game.transfer_host(player.user)
 
+    @commands.Cog.listener(name="on_ready")
+    async def rehydrate_games(self):
+        await support.GameSnapshots.rehydrate(self.bot, cah.CAHGame)
+
+    @commands.Cog.listener(name="on_ready")
+    async def start_corpus_refresh(self):
+        if settings.cah_refresh_hours and not self.refresh_corpus.is_running():
+            self.refresh_corpus.change_interval(hours=settings.cah_refresh_hours)
+            self.refresh_corpus.start()
+
+    @tasks.loop(hours=24)
+    async def refresh_corpus(self):
+        try:
+            await cah.refresh_corpus()
+        except ConnectionError:
+            # the card file we already have is still perfectly good, so we'll just try again next time
+            pass
+
     @commands.Cog.listener(name="on_raw_thread_delete")
     async def on_raw_thread_delete(self, thread: discord.RawThreadDeleteEvent):
         cah_game: cah.CAHGame = cah.CAHGame.retrieve_game(thread.thread_id)
@@ -497,7 +546,7 @@ class CAHCog(Cog):
 
     @commands.Cog.listener(name="on_guild_channel_delete")
     async def on_guild_channel_delete(self, channel: discord.TextChannel):
-        for thread in [thread for thread in channel.threads]:
-            cah_game = cah.CAHGame.retrieve_game(thread.id)
-            if cah_game:
-                await cah_game.force_close(reason="channel_deletion")
+        for cah_game in support.GameRegistry.in_channel(
+            channel.id, game_class=cah.CAHGame
+        ):
+            await cah_game.force_close(reason="channel_deletion")
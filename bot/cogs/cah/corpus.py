@@ -0,0 +1,579 @@
+########################################################################################################################
+#                         Copyright (C) 2023-present celsius narhwal <hello@celsiusnarhwal.dev>                        #
+#  This notice may not be altered or removed except by or with the express written permission of the copyright holder. #
+#                                      For more information, see the COPYING file.                                     #
+########################################################################################################################
+
+"""
+Cards Against Humanity cards are shipped as a single packed, memory-mapped file (``assets/cards.bin``) so that
+creating a game never has to wait on REST Against Humanity. This module deliberately doesn't depend on the rest of the
+bot so that Kurisu can build the file without loading it, and so that it can be run on its own to do the same, which is
+how the file is built for the Docker image (from the ``bot`` directory, ``PYTHONPATH=. python cogs/cah/corpus.py``).
+
+The file is laid out as follows. All integers are little-endian.
+
+=============  ================================================================================================
+Header         ``<8sHHII``: the magic bytes ``3515CAH1``, the format version, the number of packs (P), the number
+               of black cards (B), and the number of white cards (W).
+Packs          ``P`` records of ``<64sIIII``: the pack's NUL-padded UTF-8 name, followed by the start and length of
+               its black cards and the start and length of its white cards. Each pack's cards are contiguous.
+Black cards    ``B`` records of ``<IHB``: the offset and length of the card's text in the data section, and the
+               number of white cards it asks for.
+White cards    ``W`` records of ``<IH``: the offset and length of the card's text in the data section.
+Data           UTF-8 card text.
+=============  ================================================================================================
+"""
+
+from __future__ import annotations
+
+import bisect
+import mmap
+import os
+import re
+import struct
+import urllib.parse
+import urllib.request
+from array import array
+from functools import cache
+
+import discord.utils
+import orjson
+from attrs import define
+from elysia import Fields
+from path import Path
+
+from keyboard import *
+
+__all__ = ["CAHCorpus", "CAHPack", "CAHPackIndex"]
+
+
+@define(slots=False)
+class CAHCorpus:
+    """
+    A memory-mapped view of a packed card file.
+
+    Parameters
+    ----------
+    path : str
+        The path to the card file.
+    """
+
+    API_URL: ClassVar[str] = "https://restagainsthumanity.com/api/v2/cards"
+    CATALOG_URL: ClassVar[str] = "https://restagainsthumanity.com/api/v2/packs"
+
+    MAGIC: ClassVar[bytes] = b"3515CAH1"
+    VERSION: ClassVar[int] = 1
+
+    HEADER: ClassVar[struct.Struct] = struct.Struct("<8sHHII")
+    PACK: ClassVar[struct.Struct] = struct.Struct("<64sIIII")
+    BLACK: ClassVar[struct.Struct] = struct.Struct("<IHB")
+    WHITE: ClassVar[struct.Struct] = struct.Struct("<IH")
+
+    path: str = Fields.field(frozen=True)
+
+    def __attrs_post_init__(self):
+        with open(self.path, "rb") as file:
+            self.buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, pack_count, black_count, white_count = self.HEADER.unpack_from(
+            self.buffer
+        )
+
+        if magic != self.MAGIC or version != self.VERSION:
+            raise ValueError(f"{self.path} is not a version {self.VERSION} card file")
+
+        self.packs: dict[str, tuple[int, int, int, int]] = {}
+
+        for i in range(pack_count):
+            name, *spans = self.PACK.unpack_from(
+                self.buffer, self.HEADER.size + i * self.PACK.size
+            )
+            self.packs[name.rstrip(b"\0").decode()] = tuple(spans)
+
+        self._black_offset = self.HEADER.size + pack_count * self.PACK.size
+        self._white_offset = self._black_offset + black_count * self.BLACK.size
+        self._data_offset = self._white_offset + white_count * self.WHITE.size
+
+    @classmethod
+    @cache
+    def bundled(cls) -> Self | None:
+        """
+        The card file that ships with 3515.games, or None if it hasn't been built. It's only mapped once.
+        """
+        path = cls.bundled_path()
+        return cls(path) if path.exists() else None
+
+    @staticmethod
+    def bundled_path() -> Path:
+        return Path(__file__).parent / "assets" / "cards.bin"
+
+    def __contains__(self, pack: str) -> bool:
+        return pack in self.packs
+
+    def black(self, pack: str) -> list[tuple[str, int]]:
+        """
+        Get the text and pick count of every black card in a pack.
+        """
+        start, length, *_ = self.packs[pack]
+
+        cards = []
+
+        for i in range(start, start + length):
+            offset, size, pick = self.BLACK.unpack_from(
+                self.buffer, self._black_offset + i * self.BLACK.size
+            )
+            cards.append((self._text(offset, size), pick))
+
+        return cards
+
+    def white(self, pack: str) -> list[str]:
+        """
+        Get the text of every white card in a pack.
+        """
+        *_, start, length = self.packs[pack]
+
+        return [
+            self._text(
+                *self.WHITE.unpack_from(
+                    self.buffer, self._white_offset + i * self.WHITE.size
+                )
+            )
+            for i in range(start, start + length)
+        ]
+
+    def _text(self, offset: int, size: int) -> str:
+        start = self._data_offset + offset
+        return self.buffer[start : start + size].decode()
+
+    @classmethod
+    def pack(cls, packs: dict[str, tuple[list[tuple[str, int]], list[str]]], path: str):
+        """
+        Write a card file. The file is written alongside its destination first and then moved into place, so a
+        corpus that's already mapped is never left looking at a half-written file.
+
+        Parameters
+        ----------
+        packs : dict[str, tuple[list[tuple[str, int]], list[str]]]
+            A mapping of each pack's name to its black cards, as pairs of text and pick count, and its white cards.
+        path : str
+            The path to write the file to.
+        """
+        pack_records, black_records, white_records = [], [], []
+        data = bytearray()
+
+        def add_text(text: str) -> tuple[int, int]:
+            encoded = text.encode()
+            offset = len(data)
+            data.extend(encoded)
+            return offset, len(encoded)
+
+        for name, (black, white) in packs.items():
+            if len(name.encode()) > 64:
+                raise ValueError(f"Pack names can't exceed 64 bytes: {name}")
+
+            pack_records.append(
+                cls.PACK.pack(
+                    name.encode(),
+                    len(black_records),
+                    len(black),
+                    len(white_records),
+                    len(white),
+                )
+            )
+
+            for text, pick in black:
+                black_records.append(cls.BLACK.pack(*add_text(text), pick))
+
+            for text in white:
+                white_records.append(cls.WHITE.pack(*add_text(text)))
+
+        temp = f"{path}.tmp"
+
+        with open(temp, "wb") as file:
+            file.write(
+                cls.HEADER.pack(
+                    cls.MAGIC,
+                    cls.VERSION,
+                    len(pack_records),
+                    len(black_records),
+                    len(white_records),
+                )
+            )
+            file.writelines(pack_records)
+            file.writelines(black_records)
+            file.writelines(white_records)
+            file.write(data)
+
+        os.replace(temp, path)
+
+    @classmethod
+    def build(cls, path: str = None, *, progress: Callable[[str], Any] = None):
+        """
+        Download every pack in REST Against Humanity's catalog and pack them into a card file.
+
+        Parameters
+        ----------
+        path : str
+            The path to write the file to. Defaults to :meth:`bundled_path`.
+        progress : Callable[[str], Any]
+            Called with the name of each pack as it's downloaded.
+        """
+
+        def fetch(url: str, **params):
+            if params:
+                url += f"?{urllib.parse.urlencode(params)}"
+
+            request = urllib.request.Request(url, headers={"User-Agent": "3515.games"})
+
+            with urllib.request.urlopen(request, timeout=30) as resp:
+                return orjson.loads(resp.read())
+
+        packs = {}
+
+        for pack in cls.catalog(fetch(cls.CATALOG_URL)):
+            if progress:
+                progress(pack)
+
+            packs[pack] = cls.from_api(fetch(cls.API_URL, packs=pack))
+
+        cls.pack(packs, path or cls.bundled_path())
+
+    @staticmethod
+    def from_api(data: dict) -> tuple[list[tuple[str, int]], list[str]]:
+        """
+        Convert a response from REST Against Humanity's ``/v2/cards`` endpoint into the black and white cards
+        :meth:`pack` expects.
+        """
+        return (
+            [(card["text"], card["pick"]) for card in data["black"]],
+            [card["text"] for card in data["white"]],
+        )
+
+    @staticmethod
+    def pack_names() -> list[str]:
+        """
+        The names of the packs offered in :class:`cah.CAHPackSelectView`, and the packs players can choose from when
+        the card file hasn't been built.
+        """
+        packs = (
+            (Path(__file__).parent / "assets" / "packs.txt").read_text().splitlines()
+        )
+        return ["CAH Base Set", *packs]
+
+    @classmethod
+    def catalog(cls, data: list[str]) -> list[str]:
+        """
+        Convert a response from REST Against Humanity's ``/v2/packs`` endpoint into the names of the packs the card
+        file is built from: every pack in the catalog, led by the packs from :meth:`pack_names`. Packs whose names
+        are too long to fit in the file are left out.
+        """
+        return [
+            pack
+            for pack in dict.fromkeys([*cls.pack_names(), *data])
+            if len(pack.encode()) <= 64
+        ]
+
+
+@define(frozen=True)
+class CAHPack:
+    """
+    The normalized cards of one or more packs, stored column by column: the text of each black card, the pick count
+    of each black card, and the text of each white card. A card's integer ID is its index in its column.
+
+    Packs may also carry, in ``white_proper``, whether each white card begins with a proper noun. That column is
+    empty until it's filled in by :meth:`cah.CAHPacks.tag`.
+
+    Use :meth:`from_columns` (or one of the constructors built on it) to create a pack from raw card data.
+    """
+
+    black_text: tuple[str, ...]
+    black_pick: array
+    white_text: tuple[str, ...]
+    white_proper: array = Fields.field(factory=lambda: array("B"))
+
+    SENTENCE_END: ClassVar[re.Pattern] = re.compile(r"\b$")
+    LINE_END: ClassVar[re.Pattern] = re.compile(r"\b$", re.MULTILINE)
+    MAX_WHITE_LENGTH: ClassVar[int] = 60
+
+    # the punctuation stripped from white cards played into the middle of a sentence
+    PUNCTUATION: ClassVar[str] = ".?!:"
+
+    @classmethod
+    def from_columns(
+        cls,
+        black_text: Iterable[str],
+        black_pick: Iterable[int],
+        white_text: Iterable[str],
+    ) -> Self:
+        """
+        Create a pack from raw card text and pick counts, normalizing every card.
+
+        Black cards get a blank at the end if they don't have one, every blank is widened to five underscores, and
+        Markdown is escaped. White cards are capitalized and given a trailing period if they end in a word; white
+        cards longer than 60 characters once normalized, or with nothing but punctuation, are dropped.
+        """
+        black_text = [
+            (text if "_" in text else f"{text} _").replace("_", "_" * 5)
+            for text in black_text
+        ]
+
+        white_text = cls._batch(
+            lambda text: cls.LINE_END.sub(".", text),
+            [text[:1].upper() + text[1:] for text in white_text],
+            fallback=lambda text: cls.SENTENCE_END.sub(".", text),
+        )
+
+        return cls(
+            # links and URLs are the only Markdown that can span lines
+            black_text=tuple(
+                cls._batch(discord.utils.escape_markdown, black_text, unsafe="[<")
+            ),
+            black_pick=array("B", black_pick),
+            white_text=tuple(
+                text
+                for text in white_text
+                if len(text) <= cls.MAX_WHITE_LENGTH
+                and text.strip().rstrip(cls.PUNCTUATION)
+            ),
+        )
+
+    @classmethod
+    def from_api(cls, data: dict) -> Self:
+        """
+        Create a pack from a decoded response from REST Against Humanity's ``/v2/cards`` endpoint.
+        """
+        return cls.from_columns(
+            [card["text"] for card in data["black"]],
+            [card["pick"] for card in data["black"]],
+            [card["text"] for card in data["white"]],
+        )
+
+    @classmethod
+    def from_json(cls, body: bytes | str) -> Self:
+        """
+        Create a pack from a raw response from REST Against Humanity's ``/v2/cards`` endpoint.
+        """
+        return cls.from_api(orjson.loads(body))
+
+    @classmethod
+    def from_corpus(cls, corpus: CAHCorpus, pack: str) -> Self:
+        """
+        Create a pack from one of the packs in a card file.
+        """
+        black = corpus.black(pack)
+
+        return cls.from_columns(
+            [text for text, _ in black],
+            [pick for _, pick in black],
+            corpus.white(pack),
+        )
+
+    @classmethod
+    def concat(cls, packs: Iterable[CAHPack]) -> Self:
+        """
+        Combine several packs into one. Black cards that appear in more than one pack are only included once.
+        """
+        packs = list(packs)
+
+        black = dict.fromkeys(
+            (text, pick)
+            for pack in packs
+            for text, pick in zip(pack.black_text, pack.black_pick)
+        )
+
+        return cls(
+            black_text=tuple(text for text, _ in black),
+            black_pick=array("B", (pick for _, pick in black)),
+            white_text=tuple(text for pack in packs for text in pack.white_text),
+            # packs that haven't been tagged are treated as having no proper nouns
+            white_proper=array(
+                "B",
+                (
+                    flag
+                    for pack in packs
+                    for flag in (pack.white_proper or bytes(len(pack.white_text)))
+                ),
+            ),
+        )
+
+    def snapshot(self) -> dict:
+        """
+        Serialize the pack's columns.
+        """
+        return {
+            "black_text": list(self.black_text),
+            "black_pick": self.black_pick.tolist(),
+            "white_text": list(self.white_text),
+            "white_proper": self.white_proper.tolist(),
+        }
+
+    @classmethod
+    def from_snapshot(cls, data: dict) -> Self:
+        """
+        Recreate a pack from a snapshot made by :meth:`snapshot`. The pack's cards aren't normalized again.
+        """
+        return cls(
+            black_text=tuple(data["black_text"]),
+            black_pick=array("B", data["black_pick"]),
+            white_text=tuple(data["white_text"]),
+            white_proper=array("B", data["white_proper"]),
+        )
+
+    @staticmethod
+    def _batch(
+        transform: Callable[[str], str],
+        texts: list[str],
+        unsafe: str = "",
+        fallback: Callable[[str], str] = None,
+    ) -> list[str]:
+        # line-oriented transformations can be run over many texts at once by joining them with newlines, which is far
+        # faster than running them once per text. texts containing newlines, or any other character that could make
+        # the transformation match across the join, are passed to the fallback (or the transformation) one at a time.
+        unsafe += "\n"
+        fallback = fallback or transform
+        batchable = [not any(char in text for char in unsafe) for text in texts]
+
+        batched = iter(
+            transform(
+                "\n".join(text for text, ok in zip(texts, batchable) if ok)
+            ).split("\n")
+        )
+
+        return [
+            next(batched) if ok else fallback(text)
+            for text, ok in zip(texts, batchable)
+        ]
+
+
+@define(frozen=True)
+class CAHPackIndex:
+    """
+    An in-memory index of the packs players can choose from, for autocompleting pack names.
+
+    Each word in each pack's name is stored, along with the rest of the name after it, in a sorted list, so the packs
+    with a word that starts with a query are found by binary search. Packs whose names merely contain the query
+    somewhere are found by scanning every name, but only if there weren't already enough prefix matches.
+
+    Parameters
+    ----------
+    names : tuple[str]
+        The packs' names.
+    counts : tuple[tuple[int, int] | None]
+        The number of black and white cards in each pack, or None where that isn't known.
+    """
+
+    names: tuple[str, ...]
+    counts: tuple[tuple[int, int] | None, ...]
+
+    folded: tuple[str, ...] = Fields.attr(eq=False)
+    keys: list[tuple[str, int, int]] = Fields.attr(eq=False)
+    positions: dict[str, int] = Fields.attr(eq=False)
+
+    @folded.default
+    def _folded(self):
+        return tuple(name.casefold() for name in self.names)
+
+    @keys.default
+    def _keys(self):
+        # (the name from the start of a word onward, the word's position in the name, the pack's position)
+        return sorted(
+            (name[match.start() :], position, i)
+            for i, name in enumerate(self.folded)
+            for position, match in enumerate(re.finditer(r"\w+", name))
+        )
+
+    @positions.default
+    def _positions(self):
+        return {folded: i for i, folded in enumerate(self.folded)}
+
+    @classmethod
+    @cache
+    def bundled(cls) -> Self:
+        """
+        An index of the packs in the bundled card file, or of :meth:`CAHCorpus.pack_names` if it hasn't been built.
+        It's only built once.
+        """
+        corpus = CAHCorpus.bundled()
+
+        if corpus:
+            return cls(
+                tuple(corpus.packs),
+                tuple((black, white) for _, black, _, white in corpus.packs.values()),
+            )
+
+        names = CAHCorpus.pack_names()
+        return cls(tuple(names), (None,) * len(names))
+
+    def __len__(self):
+        return len(self.names)
+
+    def search(self, query: str, limit: int = 25) -> list[str]:
+        """
+        Find packs by name, case-insensitively. Packs with a name that starts with the query come first, followed by
+        packs with a word in their name that does, followed by packs with a name that contains it anywhere.
+
+        Parameters
+        ----------
+        query : str
+            The query. If it's empty, the first ``limit`` packs are returned.
+        limit : int, default=25
+            The maximum number of packs to return.
+        """
+        query = query.strip().casefold()
+
+        if not query:
+            return list(self.names[:limit])
+
+        prefixed = []
+
+        for n in range(bisect.bisect_left(self.keys, (query,)), len(self.keys)):
+            key, position, i = self.keys[n]
+
+            if not key.startswith(query):
+                break
+
+            prefixed.append((position, i))
+
+        matches = dict.fromkeys(i for _, i in sorted(prefixed))
+
+        if len(matches) < limit:
+            matches.update(
+                dict.fromkeys(i for i, name in enumerate(self.folded) if query in name)
+            )
+
+        return [self.names[i] for i in list(matches)[:limit]]
+
+    def describe(self, pack: str) -> str:
+        """
+        Describe a pack by its name and, if they're known, the number of cards in it.
+        """
+        counts = self.counts[self.positions[pack.casefold()]]
+
+        if not counts:
+            return pack
+
+        black, white = counts
+        return f"{pack} ({black} black, {white} white)"
+
+    def resolve(self, packs: str) -> tuple[list[str], list[str]]:
+        """
+        Resolve a comma-separated list of pack names, which needn't match the packs' names' capitalization.
+
+        Returns
+        -------
+        tuple[list[str], list[str]]
+            The exact names of the packs that were found, and the names that weren't.
+        """
+        found, missing = [], []
+
+        for name in filter(None, (name.strip() for name in packs.split(","))):
+            if (i := self.positions.get(name.casefold())) is not None:
+                found.append(self.names[i])
+            else:
+                missing.append(name)
+
+        return list(dict.fromkeys(found)), missing
+
+
+if __name__ == "__main__":
+    CAHCorpus.build()
@@ -0,0 +1,828 @@
+########################################################################################################################
+#                         Copyright (C) 2023-present celsius narhwal <hello@celsiusnarhwal.dev>                        #
+#  This notice may not be altered or removed except by or with the express written permission of the copyright holder. #
+#                                      For more information, see the COPYING file.                                     #
+########################################################################################################################
+
+"""
+The rules of Cards Against Humanity, without Discord.
+
+:class:`CAHEngine` holds the state of a game and changes it in response to commands (``submit``, ``vote``,
+``time_out``, and so on), each of which returns the events that resulted. Nothing here awaits, sends a message, or
+sleeps; :class:`cah.CAHGame` turns the events into messages, and :class:`CAHSimulator` plays games out as fast as the
+rules allow.
+"""
+
+from __future__ import annotations
+
+import random
+import string
+import time
+
+from attrs import define
+from elysia import Fields
+
+import support
+from cogs.cah.corpus import CAHCorpus, CAHPack
+from cogs.cah.models.cards import CAHBlackCard, CAHDeck, CAHWhiteCard
+from keyboard import *
+
+__all__ = [
+    "CAHEvent",
+    "CardsDealt",
+    "RoundStarted",
+    "CardsSubmitted",
+    "VotingStarted",
+    "VoteCast",
+    "RoundWon",
+    "GameWon",
+    "PlayerTimedOut",
+    "PlayerRemoved",
+    "CzarChanged",
+    "GameClosed",
+    "CAHSubmission",
+    "CAHTally",
+    "CAHEngine",
+    "CAHSimulation",
+    "CAHSimulator",
+]
+
+
+# events
+
+
+@define(frozen=True)
+class CAHEvent:
+    """
+    Something that happened in a game.
+    """
+
+
+@define(frozen=True)
+class CardsDealt(CAHEvent):
+    player: Hashable
+    cards: tuple[CAHWhiteCard, ...]
+
+
+@define(frozen=True)
+class RoundStarted(CAHEvent):
+    black_card: CAHBlackCard
+    czar: Hashable | None
+
+
+@define(frozen=True)
+class CardsSubmitted(CAHEvent):
+    submission: CAHSubmission
+    forced: bool
+
+
+@define(frozen=True)
+class VotingStarted(CAHEvent):
+    submissions: tuple[CAHSubmission, ...]
+
+
+@define(frozen=True)
+class VoteCast(CAHEvent):
+    voter: Hashable
+    player: Hashable
+    forced: bool
+
+
+@define(frozen=True)
+class RoundWon(CAHEvent):
+    submission: CAHSubmission
+    points: int
+
+
+@define(frozen=True)
+class GameWon(CAHEvent):
+    player: Hashable
+
+
+@define(frozen=True)
+class PlayerTimedOut(CAHEvent):
+    player: Hashable
+    timeouts: int
+
+
+@define(frozen=True)
+class PlayerRemoved(CAHEvent):
+    player: Hashable
+    reason: str
+
+
+@define(frozen=True)
+class CzarChanged(CAHEvent):
+    czar: Hashable
+
+
+@define(frozen=True)
+class GameClosed(CAHEvent):
+    reason: str
+
+
+# state
+
+
+@define(frozen=True)
+class CAHSubmission:
+    """
+    The white cards a player played into the black card, and the text that resulted.
+    """
+
+    player: Hashable
+    white_cards: tuple[CAHWhiteCard, ...]
+    text: str
+
+
+@define
+class CAHTally:
+    """
+    A popular vote tally that keeps track of which candidates are in the lead as votes come in.
+
+    Adding a vote is O(1). Withdrawing a candidate is O(1) unless the candidate was in the lead, in which case the
+    leaders are recounted.
+
+    Parameters
+    ----------
+    votes : dict
+        The number of votes each candidate has.
+    """
+
+    votes: dict[Hashable, int] = Fields.field(factory=dict)
+
+    leading_votes: int = Fields.attr(default=0)
+    leaders: dict[Hashable, None] = Fields.attr(factory=dict)
+
+    def __attrs_post_init__(self):
+        self.recount()
+
+    @classmethod
+    def of(cls, candidates: Iterable[Hashable]) -> Self:
+        """
+        Create a tally in which none of the candidates have any votes yet.
+        """
+        return cls(dict.fromkeys(candidates, 0))
+
+    def add(self, candidate: Hashable):
+        """
+        Count a vote for a candidate.
+        """
+        votes = self.votes[candidate] = self.votes.get(candidate, 0) + 1
+
+        if votes > self.leading_votes:
+            self.leading_votes = votes
+            self.leaders = {candidate: None}
+        elif votes == self.leading_votes:
+            self.leaders[candidate] = None
+
+    def discard(self, candidate: Hashable):
+        """
+        Withdraw a candidate, along with their votes, if they're in the tally.
+        """
+        self.votes.pop(candidate, None)
+
+        if candidate in self.leaders:
+            self.recount()
+
+    def recount(self):
+        """
+        Work out the leaders from scratch.
+        """
+        self.leading_votes = max(self.votes.values(), default=0)
+        self.leaders = {
+            candidate: None
+            for candidate, votes in self.votes.items()
+            if votes == self.leading_votes
+        }
+
+    def winners(self) -> list[Hashable]:
+        """
+        The candidates with the most votes, in the order they entered the tally.
+        """
+        return list(self.leaders)
+
+
+@define
+class CAHEngine:
+    """
+    A Cards Against Humanity game, reduced to its rules.
+
+    Players can be any hashable objects, such as :class:`cah.CAHPlayer`. Each command checks that it's allowed, raising ``ValueError`` if it isn't,
+    and returns the events that resulted from it. Commands never wait on anyone: it's up to the caller to start each
+    round (see :meth:`start_round`) and to call :meth:`time_out` when a turn's time runs out.
+
+    Parameters
+    ----------
+    deck : CAHDeck
+        The deck to play with.
+    points_to_win : int
+        The number of points required to win.
+    use_czar : bool, default=True
+        Whether each round's winner is picked by a Card Czar rather than by popular vote.
+    min_players : int, default=3
+        The number of players below which a game that's started is closed.
+    rng : random.Random, optional
+        The random number generator used to make choices on players' behalf.
+    """
+
+    HAND_SIZE: ClassVar[int] = 10
+    MAX_TIMEOUTS: ClassVar[int] = 3
+
+    deck: CAHDeck
+    points_to_win: int
+    use_czar: bool = True
+    min_players: int = 3
+    rng: random.Random = Fields.field(factory=random.Random)
+
+    players: list[Hashable] = Fields.attr(factory=list)
+    host: Hashable = Fields.attr(default=None)
+    hands: dict[Hashable, list[CAHWhiteCard]] = Fields.attr(factory=dict)
+    points: dict[Hashable, int] = Fields.attr(factory=dict)
+    leaderboard: support.Leaderboard = Fields.attr(factory=support.Leaderboard)
+    timeouts: dict[Hashable, int] = Fields.attr(factory=dict)
+
+    # lobby, playing, voting, between (rounds), or over
+    phase: str = Fields.attr(default="lobby")
+    czar: Hashable = Fields.attr(default=None)
+    black_card: CAHBlackCard = Fields.attr(default=None)
+    submissions: dict[Hashable, CAHSubmission] = Fields.attr(factory=dict)
+    # the players who still have to submit (while playing) or vote (while voting)
+    outstanding: dict[Hashable, None] = Fields.attr(factory=dict)
+    tally: CAHTally = Fields.attr(factory=CAHTally)
+    # the player each voter voted for this round
+    ballots: dict[Hashable, Hashable] = Fields.attr(factory=dict)
+
+    def join(self, player: Hashable) -> list[CAHEvent]:
+        """
+        Add a player to the game's lobby. The first player to join is the host.
+        """
+        self.require("lobby")
+
+        if player in self.hands:
+            raise ValueError(f"{player!r} is already in the game")
+
+        self.players.append(player)
+        self.hands[player] = []
+        self.points[player] = 0
+        self.leaderboard.add(player)
+        self.timeouts[player] = 0
+        self.host = self.host if self.host is not None else player
+
+        return []
+
+    def start(self, order: Iterable[Hashable] = None) -> list[CAHEvent]:
+        """
+        Start the game, dealing every player a hand and starting the first round.
+
+        Parameters
+        ----------
+        order : Iterable[Hashable], optional
+            The players in the order the Card Czar passes between them. Defaults to the order they joined in.
+        """
+        self.require("lobby")
+
+        if order is not None:
+            order = list(order)
+
+            if len(order) != len(self.players) or set(order) != set(self.players):
+                raise ValueError("The order must include every player once")
+
+            self.players = order
+
+        if len(self.players) < self.min_players:
+            raise ValueError(f"At least {self.min_players} players are needed")
+
+        events = [self.deal(player, self.HAND_SIZE) for player in self.players]
+        self.phase = "between"
+
+        return events + self.start_round()
+
+    def start_round(self) -> list[CAHEvent]:
+        """
+        Start a new round: the Card Czar moves to the next player, and a black card is drawn.
+        """
+        self.require("between")
+
+        if self.use_czar:
+            self.czar = self.next_player(self.czar)
+
+        self.black_card = self.deck.get_random_black()
+        self.submissions.clear()
+        self.outstanding = dict.fromkeys(p for p in self.players if p != self.czar)
+        self.phase = "playing"
+
+        return [RoundStarted(self.black_card, self.czar)]
+
+    def candidates(self, player: Hashable, cards: Iterable[int]) -> list[str]:
+        """
+        The texts a player can choose between if they play some of their white cards.
+
+        Parameters
+        ----------
+        player : Hashable
+            The player.
+        cards : Iterable[int]
+            The positions in the player's hand of the white cards, in the order they're played.
+        """
+        hand = self.hands[player]
+        return self.black_card.compose(*(hand[i] for i in cards))
+
+    def submit(
+        self, player: Hashable, cards: Iterable[int], order: int = 0
+    ) -> list[CAHEvent]:
+        """
+        Play white cards into the black card.
+
+        Parameters
+        ----------
+        player : Hashable
+            The player.
+        cards : Iterable[int]
+            The positions in the player's hand of the white cards, in the order they're played.
+        order : int, default=0
+            Which of :meth:`candidates` to submit.
+        """
+        self.require("playing")
+        events = self.play(player, list(cards), order, forced=False)
+        self.timeouts[player] = 0
+
+        return events + self.maybe_start_voting()
+
+    def force_pick(self, player: Hashable) -> list[CAHEvent]:
+        """
+        Play random white cards on a player's behalf.
+        """
+        self.require("playing")
+        return self.play_randomly(player) + self.maybe_start_voting()
+
+    def vote(self, voter: Hashable, player: Hashable) -> list[CAHEvent]:
+        """
+        Vote for a player's submission. In Card Czar games, only the Card Czar votes, and their vote decides the round.
+        """
+        self.require("voting")
+
+        if voter not in self.outstanding:
+            raise ValueError(f"{voter!r} can't vote right now")
+
+        if player not in self.submissions:
+            raise ValueError(f"{player!r} hasn't made a submission")
+
+        if not self.use_czar and voter == player:
+            raise ValueError("Players can't vote for their own submissions")
+
+        self.timeouts[voter] = 0
+
+        return self.cast(voter, player, forced=False)
+
+    def force_vote(self, voter: Hashable) -> list[CAHEvent]:
+        """
+        Vote for a random submission on a player's behalf.
+        """
+        self.require("voting")
+
+        if voter not in self.outstanding:
+            raise ValueError(f"{voter!r} can't vote right now")
+
+        return self.vote_randomly(voter)
+
+    def time_out(self) -> list[CAHEvent]:
+        """
+        End the current phase on behalf of everyone who hasn't acted in it yet.
+
+        Each of them has their timeout count increased. Players on their third consecutive timeout are removed; the
+        others have cards played or votes cast for them.
+        """
+        self.require("playing", "voting")
+
+        events = []
+        kicked = []
+
+        for player in list(self.outstanding):
+            self.timeouts[player] += 1
+            events.append(PlayerTimedOut(player, self.timeouts[player]))
+
+            if self.timeouts[player] >= self.MAX_TIMEOUTS:
+                kicked.append(player)
+            elif self.phase == "playing":
+                events.extend(self.play_randomly(player))
+            else:
+                events.extend(self.vote_randomly(player))
+
+        for player in kicked:
+            if self.phase == "over":
+                break
+
+            if player in self.hands:
+                events.extend(self.remove(player, reason="inactive"))
+
+        if self.phase == "playing":
+            events.extend(self.maybe_start_voting())
+
+        return events
+
+    def remove(self, player: Hashable, reason: str = "left") -> list[CAHEvent]:
+        """
+        Remove a player from the game.
+
+        A player who leaves mid-round has their submission, if they made one, withdrawn. If the Card Czar leaves while
+        players are submitting, the next player becomes the Card Czar; if they leave while voting, a random submission
+        wins the round. The game is closed if the host leaves or if too few players are left.
+
+        Parameters
+        ----------
+        player : Hashable
+            The player.
+        reason : str, default="left"
+            Why the player is being removed (e.g. "left", "kicked", or "inactive").
+        """
+        if player not in self.hands:
+            raise ValueError(f"{player!r} isn't in the game")
+
+        if self.phase == "over":
+            raise ValueError("The game is over")
+
+        started = self.phase != "lobby"
+        index = self.players.index(player)
+        successor = self.next_player(player) if player == self.czar else None
+
+        if player == self.czar and self.phase == "between":
+            # the next round's Card Czar is whoever comes after this one
+            self.czar = self.players[index - 1]
+
+        del self.players[index]
+        del self.hands[player], self.points[player], self.timeouts[player]
+        self.leaderboard.remove(player)
+        self.outstanding.pop(player, None)
+        self.submissions.pop(player, None)
+        self.tally.discard(player)
+        # a departed voter's vote stays in the tally
+        self.ballots.pop(player, None)
+
+        events = [PlayerRemoved(player, reason)]
+
+        if player == self.host:
+            return events + self.close("host_left")
+
+        if started and len(self.players) < self.min_players:
+            return events + self.close("insufficient_players")
+
+        if self.phase == "playing":
+            if player == self.czar:
+                self.czar = successor
+                self.outstanding.pop(successor, None)
+                self.submissions.pop(successor, None)
+                events.append(CzarChanged(successor))
+
+            events.extend(self.maybe_start_voting())
+        elif self.phase == "voting":
+            if not self.submissions:
+                self.phase = "between"
+            elif player == self.czar:
+                self.czar = successor
+                events.extend(self.win_round(self.rng.choice(list(self.submissions))))
+            elif not self.use_czar and not self.outstanding:
+                events.extend(self.finish_popular_vote())
+
+        return events
+
+    def standings(self) -> list[list[Hashable]]:
+        """
+        The players grouped by their point totals, from most points to fewest.
+        """
+        return self.leaderboard.groups()
+
+    def check(self):
+        """
+        Check that the game's state is consistent.
+
+        Raises
+        ------
+        AssertionError
+            If it isn't.
+        """
+        problems = []
+
+        if set(self.players) != set(self.hands):
+            problems.append("seated players and hands disagree")
+
+        if len(set(self.players)) != len(self.players):
+            problems.append("a player is seated twice")
+
+        if self.phase in ("playing", "voting", "between"):
+            if self.use_czar and self.czar not in self.players:
+                problems.append("the Card Czar isn't playing")
+
+            if short := [
+                p for p, hand in self.hands.items() if len(hand) != self.HAND_SIZE
+            ]:
+                problems.append(f"hands with the wrong number of cards: {short}")
+
+        if any(player not in self.players for player in self.submissions):
+            problems.append("a departed player's submission is still in play")
+
+        if any(player not in self.players for player in self.outstanding):
+            problems.append("a departed player is still expected to act")
+
+        if self.phase == "playing" and any(
+            p in self.submissions for p in self.outstanding
+        ):
+            problems.append("a player who submitted is still expected to")
+
+        if self.phase == "voting" and not self.use_czar:
+            if set(self.tally.votes) != set(self.submissions):
+                problems.append("the tally doesn't match the submissions")
+
+        if any(voter not in self.players for voter in self.ballots):
+            problems.append("a departed player's ballot is still recorded")
+
+        if len(self.leaderboard) != len(self.players) or any(
+            player not in self.leaderboard
+            or self.leaderboard.points(player) != self.points[player]
+            for player in self.players
+        ):
+            problems.append("the leaderboard is out of date")
+
+        if problems:
+            raise AssertionError("; ".join(problems))
+
+    # internals
+
+    def require(self, *phases: str):
+        if self.phase not in phases:
+            raise ValueError(f"That can't be done while the game is {self.phase}")
+
+    def next_player(self, player: Hashable) -> Hashable:
+        if player not in self.players:
+            return self.players[0]
+
+        return self.players[(self.players.index(player) + 1) % len(self.players)]
+
+    def deal(self, player: Hashable, num_cards: int) -> CardsDealt:
+        cards = self.deck.get_random_white(num_cards)
+        self.hands[player].extend(cards)
+
+        return CardsDealt(player, tuple(cards))
+
+    def play(
+        self, player: Hashable, cards: list[int], order: int, forced: bool
+    ) -> list[CAHEvent]:
+        if player not in self.outstanding:
+            raise ValueError(f"{player!r} can't play cards right now")
+
+        if len(cards) != self.black_card.pick or len(set(cards)) != len(cards):
+            raise ValueError(f"Exactly {self.black_card.pick} cards must be played")
+
+        hand = self.hands[player]
+        played = tuple(hand[i] for i in cards)
+        submission = CAHSubmission(
+            player, played, self.black_card.compose(*played)[order]
+        )
+
+        for i in sorted(cards, reverse=True):
+            del hand[i]
+
+        self.submissions[player] = submission
+        del self.outstanding[player]
+
+        return [
+            CardsSubmitted(submission, forced),
+            self.deal(player, self.HAND_SIZE - len(hand)),
+        ]
+
+    def play_randomly(self, player: Hashable) -> list[CAHEvent]:
+        cards = self.rng.sample(range(len(self.hands[player])), self.black_card.pick)
+        order = self.rng.randrange(len(self.candidates(player, cards)))
+
+        return self.play(player, cards, order, forced=True)
+
+    def maybe_start_voting(self) -> list[CAHEvent]:
+        if self.phase != "playing" or self.outstanding:
+            return []
+
+        if not self.submissions:
+            self.phase = "between"
+            return []
+
+        self.phase = "voting"
+        self.outstanding = (
+            {self.czar: None} if self.use_czar else dict.fromkeys(self.players)
+        )
+        self.tally = CAHTally.of(self.submissions)
+        self.ballots.clear()
+
+        return [VotingStarted(tuple(self.submissions.values()))]
+
+    def cast(self, voter: Hashable, player: Hashable, forced: bool) -> list[CAHEvent]:
+        events = [VoteCast(voter, player, forced)]
+        del self.outstanding[voter]
+        self.ballots[voter] = player
+
+        if self.use_czar:
+            return events + self.win_round(player)
+
+        self.tally.add(player)
+
+        if not self.outstanding:
+            events.extend(self.finish_popular_vote())
+
+        return events
+
+    def vote_randomly(self, voter: Hashable) -> list[CAHEvent]:
+        choices = [player for player in self.submissions if player != voter]
+        return self.cast(
+            voter, self.rng.choice(choices or list(self.submissions)), forced=True
+        )
+
+    def finish_popular_vote(self) -> list[CAHEvent]:
+        # ties are broken at random
+        return self.win_round(self.rng.choice(self.tally.winners()))
+
+    def win_round(self, player: Hashable) -> list[CAHEvent]:
+        submission = self.submissions[player]
+        self.points[player] += 1
+        self.leaderboard.update(player, self.points[player])
+        self.outstanding.clear()
+
+        events = [RoundWon(submission, self.points[player])]
+
+        if self.points[player] >= self.points_to_win:
+            self.phase = "over"
+            events.append(GameWon(player))
+        else:
+            self.phase = "between"
+
+        return events
+
+    def close(self, reason: str) -> list[CAHEvent]:
+        self.phase = "over"
+        self.outstanding.clear()
+
+        return [GameClosed(reason)]
+
+
+# simulation
+
+
+@define(frozen=True)
+class CAHSimulation:
+    """
+    The results of a simulation run by :class:`CAHSimulator`.
+    """
+
+    games: int
+    rounds: int
+    events: int
+    draws: int
+    compositions: int
+    elapsed: float
+
+    @property
+    def rounds_per_second(self) -> float:
+        return self.rounds / self.elapsed if self.elapsed else 0
+
+
+@define
+class CAHSimulator:
+    """
+    Plays Cards Against Humanity games against itself with :class:`CAHEngine`.
+
+    Players submit, vote, time out, and leave at random, with the game's state checked (see :meth:`CAHEngine.check`)
+    after every command. A simulation with the same seed always plays out the same way.
+
+    Parameters
+    ----------
+    cards : CAHPack
+        The cards to play with.
+    players : int, default=6
+        The number of players in each game.
+    points_to_win : int, default=10
+        The number of points required to win each game.
+    use_czar : bool, default=True
+        Whether games are played with a Card Czar rather than by popular vote.
+    timeout_rate : float, default=0.05
+        The probability that a player doesn't act before their turn's time runs out.
+    leave_rate : float, default=0.002
+        The probability that a player leaves the game instead of acting.
+    """
+
+    cards: CAHPack
+    players: int = 6
+    points_to_win: int = 10
+    use_czar: bool = True
+    timeout_rate: float = 0.05
+    leave_rate: float = 0.002
+
+    @classmethod
+    def bundled(cls, *packs: str, **kwargs) -> Self:
+        """
+        Create a simulator that plays with packs from the bundled card file (see :class:`cah.CAHCorpus`). If the file
+        hasn't been built, a pack of made-up cards is used instead.
+
+        Parameters
+        ----------
+        *packs : str
+            The names of the packs. Defaults to the CAH Base Set.
+        **kwargs
+            Keyword arguments to pass to the simulator.
+        """
+        corpus = CAHCorpus.bundled()
+
+        if corpus:
+            cards = CAHPack.concat(
+                CAHPack.from_corpus(corpus, pack) for pack in packs or ["CAH Base Set"]
+            )
+        else:
+            cards = cls.made_up()
+
+        return cls(cards, **kwargs)
+
+    @staticmethod
+    def made_up(black: int = 90, white: int = 460) -> CAHPack:
+        """
+        A pack of made-up cards about the size of the CAH Base Set, for when the real ones aren't available.
+        """
+        rng = random.Random(3515)
+
+        def words(n: int) -> str:
+            return " ".join(
+                "".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 9)))
+                for _ in range(n)
+            )
+
+        picks = rng.choices([1, 2, 3], weights=[85, 12, 3], k=black)
+
+        return CAHPack.from_columns(
+            [
+                " _ ".join(words(rng.randint(1, 5)) for _ in range(pick + 1))
+                for pick in picks
+            ],
+            picks,
+            [words(rng.randint(1, 5)) for _ in range(white)],
+        )
+
+    def run(self, games: int, seed: int = 0) -> CAHSimulation:
+        """
+        Play some games.
+
+        Parameters
+        ----------
+        games : int
+            The number of games to play.
+        seed : int, default=0
+            The seed for every random choice made during the simulation.
+        """
+        rng = random.Random(seed)
+        # concatenating a pack fills in the proper noun flags of a pack that hasn't been tagged
+        pack = CAHPack.concat([self.cards])
+        rounds = events = draws = compositions = 0
+        start = time.perf_counter()
+
+        for _ in range(games):
+            deck = CAHDeck(("simulation",), pack)
+            deck.use_random(rng)
+
+            engine = CAHEngine(
+                deck, self.points_to_win, use_czar=self.use_czar, rng=rng
+            )
+
+            for player in range(self.players):
+                engine.join(player)
+
+            log = engine.start()
+
+            while engine.phase != "over":
+                if engine.phase == "between":
+                    log = engine.start_round()
+                elif rng.random() < self.timeout_rate:
+                    log = engine.time_out()
+                else:
+                    player = rng.choice(list(engine.outstanding))
+
+                    if rng.random() < self.leave_rate:
+                        log = engine.remove(player)
+                    elif engine.phase == "playing":
+                        hand = engine.hands[player]
+                        cards = rng.sample(range(len(hand)), engine.black_card.pick)
+                        order = rng.randrange(len(engine.candidates(player, cards)))
+                        compositions += 1
+                        log = engine.submit(player, cards, order)
+                    elif choices := [p for p in engine.submissions if p != player]:
+                        log = engine.vote(player, rng.choice(choices))
+                    else:
+                        log = engine.force_vote(player)
+
+                engine.check()
+                events += len(log)
+
+                for event in log:
+                    if isinstance(event, RoundWon):
+                        rounds += 1
+                    elif isinstance(event, CardsDealt):
+                        draws += len(event.cards)
+                    elif isinstance(event, CardsSubmitted):
+                        compositions += event.forced
+
+        return CAHSimulation(
+            games, rounds, events, draws, compositions, time.perf_counter() - start
+        )
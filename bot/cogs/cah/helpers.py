@@ -6,6 +6,8 @@
 
 from __future__ import annotations
 
+import asyncio
+
 import discord
 from discord.ext import commands
 
@@ -51,11 +53,7 @@ def verify_context(
         async def is_player() -> bool:
             game = cah.CAHGame.retrieve_game(ctx.channel_id)
 
-            if not any(
-                player
-                for player in game.players.itervalues()
-                if player.user == ctx.user
-            ):
+            if not game.retrieve_player(ctx.user):
                 message = f"Only players in this CAH game can use {command_name}."
                 embed = discord.Embed(
                     title="You're not playing in this game.",
@@ -90,7 +88,7 @@ def verify_context(
         async def is_player_turn() -> bool:
             async def czar_mode() -> bool:
                 if game.is_voting:
-                    if game.card_czar.value != player:
+                    if game.card_czar != player:
                         message = "Please wait for the Card Czar to finish."
                         embed = discord.Embed(
                             title="It's voting time.",
@@ -101,7 +99,7 @@ def verify_context(
 
                         return False
                 else:
-                    if game.card_czar.value == player:
+                    if game.card_czar == player:
                         message = f"As the Card Czar, you can't use {command_name} until it's voting time."
                         embed = discord.Embed(
                             title="Patience, young Padawan.",
@@ -118,9 +116,7 @@ def verify_context(
                             description=message,
                             color=support.Color.error(),
                         )
-                        submission = discord.utils.find(
-                            lambda c: c.player == player, game.candidates
-                        )
+                        submission = game.engine.submissions[player]
                         embed.add_field(name="Your Submission", value=submission.text)
                         await ctx.respond(embed=embed, ephemeral=True)
 
@@ -131,24 +127,24 @@ def verify_context(
             async def popular_vote_mode() -> bool:
                 if game.is_voting:
                     if player.has_voted:
-                        vote: cah.CAHCandidateCard = discord.utils.find(
-                            lambda c: player in c.voters, game.candidates
+                        message = "Please wait for the other players to finish."
+                        embed = discord.Embed(
+                            title="You've already cast your vote.",
+                            description=message,
+                            color=support.Color.error(),
                         )
 
-                        message = "Please wait for the other players to finish."
-                        embed = (
-                            discord.Embed(
-                                title="You've already cast your vote.",
-                                description=message,
-                                color=support.Color.error(),
-                            )
-                            .add_field(name="Your Vote", value=vote.text, inline=False)
-                            .add_field(
+                        # the submission the player voted for is withdrawn if its player leaves
+                        if vote := game.engine.submissions.get(
+                            game.engine.ballots.get(player)
+                        ):
+                            embed.add_field(
+                                name="Your Vote", value=vote.text, inline=False
+                            ).add_field(
                                 name="Submitted By",
                                 value=vote.player.mention,
                                 inline=False,
                             )
-                        )
 
                         await ctx.respond(embed=embed, ephemeral=True)
 
@@ -161,9 +157,7 @@ def verify_context(
                         description=message,
                         color=support.Color.error(),
                     )
-                    submission = discord.utils.find(
-                        lambda c: c.player == player, game.candidates
-                    )
+                    submission = game.engine.submissions[player]
                     embed.add_field(name="Your Submission", value=submission.text)
                     await ctx.respond(embed=embed, ephemeral=True)
 
@@ -220,3 +214,53 @@ def verify_context(
         return success
 
     return commands.check(predicate)
+
+
+# autocomplete
+
+
+async def pack_autocomplete(ctx: discord.AutocompleteContext):
+    """
+    Autocomplete the last pack in a comma-separated list of packs.
+    """
+    *chosen, query = ctx.value.split(",")
+    prefix = "".join(f"{pack.strip()}, " for pack in chosen if pack.strip())
+
+    index = cah.CAHPackIndex.bundled()
+    chosen, _ = index.resolve(",".join(chosen))
+
+    choices = []
+
+    for pack in index.search(query, limit=25 + len(chosen)):
+        value = prefix + pack
+        name = prefix + index.describe(pack)
+
+        if pack not in chosen and len(value) <= 100:
+            choices.append(
+                discord.OptionChoice(
+                    name=name if len(name) <= 100 else value, value=value
+                )
+            )
+
+    return choices[:25]
+
+
+async def refresh_corpus():
+    """
+    Rebuild the bundled card file from REST Against Humanity and start using it.
+    """
+    packs = {}
+    catalog = cah.CAHCorpus.catalog(
+        await support.HTTPClient.get_json(cah.CAHCorpus.CATALOG_URL)
+    )
+
+    for pack in catalog:
+        data = await support.HTTPClient.get_json(
+            cah.CAHCorpus.API_URL, params={"packs": [pack]}
+        )
+        packs[pack] = cah.CAHCorpus.from_api(data)
+
+    await asyncio.to_thread(cah.CAHCorpus.pack, packs, cah.CAHCorpus.bundled_path())
+    cah.CAHCorpus.bundled.cache_clear()
+    cah.CAHPackIndex.bundled.cache_clear()
+    cah.CAHPacks.clear()
@@ -6,260 +6,441 @@
 
 from __future__ import annotations
 
-import copy
+import asyncio
 import random
 import re
-import uuid
+from array import array
 
-import aiohttp
+import attrs
 import discord
-import nltk
-import orjson
 from attrs import define
 from elysia import Fields
-from llist import dllist, dllistnode
-from ordered_set import OrderedSet
-from pydantic import BaseModel, Field, validate_arguments, validator
+from pydantic import Field, validate_arguments
 
-from cogs.cah.models.player import CAHPlayer
+import support
+from cogs.cah.corpus import CAHCorpus, CAHPack
 from keyboard import *
 
 
-class CAHBlackCard(BaseModel):
+@define(frozen=True)
+class CAHBlackCard:
     """
     A black card.
+
+    Parameters
+    ----------
+    id : int
+        The card's position in its deck.
+    text : str
+        The card's normalized text (see :meth:`cah.CAHPack.from_columns`).
+    pick : int
+        The number of white cards the card asks for.
     """
 
-    class Config:
-        frozen = True
+    BLANK: ClassVar[str] = discord.utils.escape_markdown("_" * 5)
+    PUNCTUATION: ClassVar[str] = CAHPack.PUNCTUATION
 
+    id: int
     text: str
     pick: int
 
-    @validator("text")
-    def normalize_text(cls, v):
-        if "_" not in v:
-            v += " _"
+    # the text around each blank and, for each blank, whether white cards played into it should have their
+    # trailing punctuation stripped and whether they may be decapitalized
+    segments: tuple[str, ...] = Fields.attr(eq=False)
+    blanks: tuple[tuple[bool, bool], ...] = Fields.attr(eq=False)
+
+    @segments.default
+    def _segments(self):
+        return tuple(self.text.split(self.BLANK))
+
+    @blanks.default
+    def _blanks(self):
+        last = len(self.segments) - 2
+
+        return tuple(
+            (
+                # a blank at the very end of the card is the end of its sentence
+                i < last or bool(self.segments[-1]),
+                not before.rstrip().endswith(tuple(self.PUNCTUATION)),
+            )
+            for i, before in enumerate(self.segments[:-1])
+        )
+
+    def fill(self, *white_cards: CAHWhiteCard) -> str:
+        """
+        Fill the card's blanks with white cards, in order. Blanks left over once the white cards run out stay blank.
+
+        Parameters
+        ----------
+        *white_cards : CAHWhiteCard
+            The white cards.
+        """
+        parts = [self.segments[0]]
+
+        for i, ((strip, decapitalize), after) in enumerate(
+            zip(self.blanks, self.segments[1:])
+        ):
+            if i < len(white_cards):
+                card = white_cards[i]
+                text = card.text
+
+                if strip:
+                    text = text.rstrip(self.PUNCTUATION)
+
+                if text and decapitalize and not card.proper:
+                    text = text[0].lower() + text[1:]
 
-        return discord.utils.escape_markdown(v.replace("_", "_" * 5))
+                parts.append(f"**{text}**")
+            else:
+                parts.append(self.BLANK)
+
+            parts.append(after)
+
+        return "".join(parts)
+
+    def compose(self, *white_cards: CAHWhiteCard) -> list[str]:
+        """
+        Fill the card's blanks with white cards in each order a player may choose between: the order the white cards
+        were picked in and, if there's more than one blank to fill, the reverse.
+
+        Parameters
+        ----------
+        *white_cards : CAHWhiteCard
+            The white cards.
+        """
+        orders = [white_cards]
+
+        if self.pick > 1 and len(white_cards) > 1:
+            orders.append(white_cards[::-1])
+
+        return [self.fill(*order) for order in orders]
 
     def __str__(self):
         return self.text
 
 
-class CAHWhiteCard(BaseModel):
+@define(frozen=True)
+class CAHWhiteCard:
     """
     A white card.
-    """
 
-    class Config:
-        frozen = True
-
-    text: Optional[str]  # not actually optional
-    uuid: str = Field(default_factory=lambda: uuid.uuid4().hex, const=True)
+    Parameters
+    ----------
+    id : int
+        The card's position in its deck.
+    text : str
+        The card's normalized text (see :meth:`cah.CAHPack.from_columns`).
+    proper : bool, default=False
+        Whether the card begins with a proper noun.
+    """
 
-    @validator("text", pre=True)
-    def normalize(cls, v):
-        if len(normalized := re.sub(r"\b$", ".", v[0].upper() + v[1:])) <= 60:
-            return normalized
+    id: int
+    text: str
+    proper: bool = False
 
     def __str__(self):
         return self.text
 
-    def __bool__(self):
-        return bool(self.text)
 
-
-class CAHDeck(BaseModel):
-    """
-    A deck of black and white cards.
+class CAHPacks:
     """
+    The cards in every Cards Against Humanity pack that's been used since 3515.games started.
 
-    class Config:
-        arbitrary_types_allowed = True
-        extra = "allow"
+    Each pack's cards are normalized the first time a game uses the pack and are then shared, read-only, by every
+    game that uses it afterward. Games never modify cards; they only keep track of which ones they've drawn (see
+    :class:`CAHPile`).
 
-    black: OrderedSet[CAHBlackCard]
-    white: OrderedSet[CAHWhiteCard]
-    backup: CAHDeck = None
+    Loading a pack also works out which of its white cards begin with a proper noun, so that
+    :meth:`CAHBlackCard.fill` knows which white cards mustn't be decapitalized without having to tag them during a
+    game. If NLTK's tagger (see :class:`support.Tagger`) isn't ready within ``tagger_timeout`` seconds, packs are
+    used untagged and tagged the next time they're loaded after it is.
+    """
 
-    @validator("black", "white")
-    def cast(cls, v):
-        return OrderedSet(filter(None, v))
+    tagger_timeout: ClassVar[float] = 5
 
-    @validator("backup", always=True)
-    def create_backup(cls, v, values):
-        if v is None:
-            return cls.construct(**copy.deepcopy(values))
+    packs: ClassVar[dict[str, CAHPack]] = {}
 
     @classmethod
-    @validate_arguments
-    async def new(cls, *packs: str) -> Self:
+    async def load(cls, *packs: str) -> list[CAHPack]:
         """
-        Create a new deck given the exact, case-sensitive, names of one or more Cards Against Humanity packs.
+        Get one or more packs.
+
+        Packs are read from the bundled card file (see :class:`cah.CAHCorpus`) where possible and fetched from REST
+        Against Humanity otherwise.
 
         Parameters
         ----------
         packs : str
-            The packs to include.
+            The exact, case-sensitive, names of the packs.
 
-        Returns
-        -------
-        CAHDeck
-            A new deck.
+        Raises
+        ------
+        ConnectionError
+            If a pack had to be fetched from REST Against Humanity and couldn't be.
         """
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                "https://restagainsthumanity.com/api/v2/cards", params={"packs": packs}
-            ) as resp:
-                if resp.status != 200:
-                    raise ConnectionError
+        corpus = CAHCorpus.bundled()
 
-                return cls.parse_obj(await resp.json(loads=orjson.loads))
+        async def fetch(pack: str) -> CAHPack:
+            if corpus and pack in corpus:
+                return CAHPack.from_corpus(corpus, pack)
 
-    def get_random_black(self) -> CAHBlackCard:
+            return CAHPack.from_api(
+                await support.HTTPClient.get_json(
+                    CAHCorpus.API_URL, params={"packs": [pack]}
+                )
+            )
+
+        missing = [pack for pack in dict.fromkeys(packs) if pack not in cls.packs]
+
+        cls.packs.update(
+            zip(missing, await asyncio.gather(*[fetch(pack) for pack in missing]))
+        )
+
+        untagged = [
+            pack
+            for pack in dict.fromkeys(packs)
+            if len(cls.packs[pack].white_proper) != len(cls.packs[pack].white_text)
+        ]
+
+        if untagged and await support.Tagger.wait(cls.tagger_timeout):
+            tagged = await asyncio.to_thread(
+                lambda: [cls.tag(cls.packs[pack]) for pack in untagged]
+            )
+            cls.packs.update(zip(untagged, tagged))
+
+        return [cls.packs[pack] for pack in packs]
+
+    @staticmethod
+    def tag(pack: CAHPack) -> CAHPack:
         """
-        Return a random black card, removing it from the deck.
+        Return a copy of a pack with :attr:`cah.CAHPack.white_proper` filled in.
         """
-        if not self.black:
-            self.reset_black()
+        sentences = [re.sub(r"[.?!,]", "", text).split() for text in pack.white_text]
+        proper = array("B")
 
-        return self.black.pop(random.randint(0, len(self.black) - 1))
+        for text, tags in zip(pack.white_text, support.Tagger.tag_sents(sentences)):
+            proper_nouns = {word for word, pos in tags if pos.startswith("NNP")}
+            # a card with no words has nothing to capitalize
+            words = text.split()
+            proper.append(bool(words) and words[0] in proper_nouns)
 
-    @validate_arguments
-    def get_random_white(self, num_cards: Annotated[int, Field(ge=1)] = 1) -> set[str]:
+        return attrs.evolve(pack, white_proper=proper)
+
+    @classmethod
+    def clear(cls):
+        """
+        Forget every pack. Games already in progress keep the cards they have.
+        """
+        cls.packs.clear()
+
+
+@define
+class CAHPile:
+    """
+    A pile of cards from which cards are drawn at random.
+
+    The pile doesn't hold the cards themselves, only a permutation of their indices and a cursor separating the
+    cards that have been drawn from those that haven't. Each draw is one step of a Fisher-Yates shuffle: a random
+    undrawn index is swapped to the cursor, and the cursor advances. Drawing k cards is therefore O(k), and
+    reshuffling — which just means moving the cursor back to the start — is O(1).
+
+    Parameters
+    ----------
+    size : int
+        The number of cards in the pile.
+    """
+
+    size: int = Fields.field(frozen=True)
+    order: array = Fields.attr()
+    cursor: int = Fields.attr(default=0)
+    rng: random.Random = Fields.attr(default=random, eq=False)
+
+    @order.default
+    def _order(self):
+        return array("I", range(self.size))
+
+    def __len__(self):
+        return self.size - self.cursor
+
+    def draw(self, num_cards: int = 1) -> list[int]:
         """
-        Return a given number of random, unique, white cards, removing them from the deck.
+        Draw cards from the pile, returning their indices. If there aren't enough undrawn cards left, the pile is
+        reshuffled first.
 
         Parameters
         ----------
-        num_cards: int, default=1
-            The number of white cards to return. All white cards will be returned if this number is too big.
-
-        Returns
-        -------
-        set[str]
-            A set of white cards.
+        num_cards : int, default=1
+            The number of cards to draw. All the cards in the pile will be drawn if this number is too big.
         """
-        if num_cards > len(self.white):
-            self.reset_white()
-            num_cards = min(num_cards, len(self.white))
+        if num_cards > len(self):
+            self.reshuffle()
+            num_cards = min(num_cards, self.size)
 
-        cards = {
-            self.white[i] for i in random.sample(range(len(self.white)), num_cards)
-        }
+        start = self.cursor
 
-        self.white.difference_update(cards)
+        for _ in range(num_cards):
+            i = self.rng.randrange(self.cursor, self.size)
+            self.order[self.cursor], self.order[i] = (
+                self.order[i],
+                self.order[self.cursor],
+            )
+            self.cursor += 1
 
-        return cards
+        return self.order[start : self.cursor].tolist()
 
-    def reset_black(self):
-        self.black = self.backup.black.copy()
+    def reshuffle(self):
+        """
+        Return every drawn card to the pile.
+        """
+        self.cursor = 0
 
-    def reset_white(self):
-        self.white = self.backup.white.copy()
+    def snapshot(self) -> dict:
+        return {"order": self.order.tolist(), "cursor": self.cursor}
 
-    def __repr__(self):
-        return f"CAHDeck(black={len(self.black)}, white={len(self.white)})"
+    def load_snapshot(self, data: dict):
+        if len(data["order"]) != self.size:
+            raise ValueError("The pile's cards have changed since it was snapshotted")
 
-    __str__ = __repr__
+        self.order = array("I", data["order"])
+        self.cursor = data["cursor"]
 
 
-@define(on_setattr=Fields.setters.frozen)
-class CAHCandidateCard:
+@define
+class CAHDeck:
     """
-    A candidate card.
+    A deck of black and white cards.
 
-    A candidate card is the combination of a black card and one or more player-selected white cards.
+    Parameters
+    ----------
+    packs : tuple[str]
+        The names of the packs the deck is made from.
+    cards : CAHPack
+        The deck's cards.
+    upload : CAHPack, optional
+        The cards the Game Host uploaded, if any (see :class:`cah.CAHUploads`). They're included in ``cards``.
     """
 
-    text: str
-    player: CAHPlayer
-    white_cards: list[str]
+    packs: tuple[str, ...]
+    cards: CAHPack
+    upload: CAHPack = None
+
+    black: CAHPile = Fields.attr()
+    white: CAHPile = Fields.attr()
+
+    @black.default
+    def _black(self):
+        return CAHPile(len(self.cards.black_text))
 
-    voters: list[CAHPlayer] = Fields.attr(factory=list, on_setattr=Fields.setters.NO_OP)
-    uuid: str = Fields.attr(factory=lambda: uuid.uuid4().hex)
+    @white.default
+    def _white(self):
+        return CAHPile(len(self.cards.white_text))
 
     @classmethod
-    @validate_arguments(config=dict(arbitrary_types_allowed=True))
-    def create(cls, player: CAHPlayer, *white_cards: CAHWhiteCard) -> list[Self]:
+    async def new(cls, *packs: str, upload: CAHPack = None) -> Self:
         """
-        Create candidate cards.
+        Create a new deck given the exact, case-sensitive, names of zero or more Cards Against Humanity packs and,
+        optionally, an uploaded deck.
 
         Parameters
         ----------
-        player: CAHPlayer
-            The player who the candidate cards are being made for.
-        *white_cards: str
-            The white cards from which the candidate cards are being made.
+        packs : str
+            The packs to include.
+        upload : CAHPack, optional
+            An uploaded deck to include.
 
         Returns
         -------
-        list[CAHCandidateCard]
-            The candidate cards.
-
-        Notes
-        -----
-        This algorithm attempts to maintain grammatical correctness and proper noun capitalization. The enormity
-        of the dataset it has to work with and the innumberable amount of possible edge cases mean it will sometimes
-        produce less-than-perfect results.
+        CAHDeck
+            A new deck.
         """
-        # read: THIS SHIT DOESN'T WORK!!!
+        cards = await CAHPacks.load(*packs)
 
-        candidates = []
+        if upload:
+            cards.append(upload)
 
-        underscores = discord.utils.escape_markdown("_" * 5)
-        punctuation = ".?!:"
+        return cls(packs, CAHPack.concat(cards), upload)
 
-        proper_nouns = []
-        for card in white_cards:
-            words = re.sub(r"[.?!,]", "", card.text).split()
-            proper_nouns.extend(
-                [word for word, pos in nltk.pos_tag(words) if pos.startswith("NNP")]
-            )
-
-        # ngl I shoulda written comments for this when I had the chance. too bad!
+    def use_random(self, rng: random.Random):
+        """
+        Shuffle the deck with a particular random number generator, e.g. to make its draws reproducible.
+        """
+        self.black.rng = self.white.rng = rng
 
-        for c1, c2 in zip(white_cards, reversed(white_cards)):
-            tokens = dllist(re.split(r"((?:\\_){5})", player.game.black_card.text))
-            if not tokens[-1]:
-                tokens.pop()
+    def black_card(self, card_id: int) -> CAHBlackCard:
+        """
+        Get a black card by its ID.
+        """
+        return CAHBlackCard(
+            card_id, self.cards.black_text[card_id], self.cards.black_pick[card_id]
+        )
 
-            for card in c1, c2:
-                text = card.text
+    def white_card(self, card_id: int) -> CAHWhiteCard:
+        """
+        Get a white card by its ID.
+        """
+        return CAHWhiteCard(
+            card_id,
+            self.cards.white_text[card_id],
+            bool(self.cards.white_proper[card_id]),
+        )
 
-                if underscores in tokens:
-                    underscore_node: dllistnode = tokens.nodeat(
-                        [*tokens].index(underscores)
-                    )
+    def get_random_black(self) -> CAHBlackCard:
+        """
+        Draw a random black card.
+        """
+        return self.black_card(*self.black.draw())
 
-                    strip: bool = (
-                        underscore_node.prev is None or underscore_node.next is not None
-                    )
+    @validate_arguments
+    def get_random_white(
+        self, num_cards: Annotated[int, Field(ge=1)] = 1
+    ) -> list[CAHWhiteCard]:
+        """
+        Draw a given number of random, unique, white cards.
 
-                    decapitalize: bool = (
-                        underscore_node.prev is not None
-                        and not underscore_node.prev.value.rstrip().endswith(
-                            tuple(punctuation)
-                        )
-                        and text.split()[0] not in proper_nouns
-                    )
+        Parameters
+        ----------
+        num_cards: int, default=1
+            The number of white cards to return. All white cards will be returned if this number is too big.
 
-                    if strip:
-                        text = text.rstrip(punctuation)
+        Returns
+        -------
+        list[CAHWhiteCard]
+            A list of white cards.
+        """
+        return [self.white_card(i) for i in self.white.draw(num_cards)]
 
-                    if decapitalize:
-                        text = text[0].lower() + text[1:]
+    def snapshot(self) -> dict:
+        """
+        Serialize the deck. Cards from built-in packs aren't stored; only the deck's packs, its uploaded cards, and the
+        order in which its cards are drawn are.
+        """
+        return {
+            "packs": list(self.packs),
+            "upload": self.upload.snapshot() if self.upload else None,
+            "black": self.black.snapshot(),
+            "white": self.white.snapshot(),
+        }
 
-                    tokens.insertbefore(f"**{text}**", underscore_node)
-                    tokens.remove(underscore_node)
+    @classmethod
+    async def from_snapshot(cls, data: dict) -> Self:
+        """
+        Recreate a deck from a snapshot made by :meth:`snapshot`.
 
-            candidates.append(cls("".join(tokens), player, white_cards))
+        Raises
+        ------
+        ValueError
+            If the deck's packs have changed since the snapshot was made.
+        """
+        upload = data.get("upload")
+        deck = await cls.new(
+            *data["packs"], upload=CAHPack.from_snapshot(upload) if upload else None
+        )
+        deck.black.load_snapshot(data["black"])
+        deck.white.load_snapshot(data["white"])
 
-            if len(candidates) == player.game.black_card.pick:
-                break
+        return deck
 
-        return candidates
+    def __repr__(self):
+        return f"CAHDeck(black={len(self.black)}, white={len(self.white)})"
 
-    def __str__(self):
-        return self.text
+    __str__ = __repr__
@@ -7,15 +7,16 @@
 from __future__ import annotations
 
 import asyncio
-import random
+import io
+import time
 import uuid
 
+import attrs
 import discord
 import inflect as ifl
 from attrs import define
 from elysia import Fields
 from llist import dllistnode
-from sortedcontainers import SortedKeyList
 
 import shrine
 import support
@@ -31,6 +32,9 @@ inflect = ifl.engine()
 class CAHGame(HostedGame):
     """
     A Cards Against Humanity game.
+
+    The game's rules are enforced by its :class:`cah.CAHEngine`; the game sends what happens in it to Discord (see
+    :class:`CAHEventProcessor`).
     """
 
     __games__: ClassVar = {}
@@ -38,53 +42,149 @@ class CAHGame(HostedGame):
     name: ClassVar = "Cards Against Humanity"
     short_name: ClassVar = "CAH"
     min_players: ClassVar = 3
+    snapshot_kind: ClassVar = "cah"
+    snapshot_version: ClassVar = 3
 
     deck: cah.CAHDeck
     settings: CAHGameSettings
 
-    card_czar: dllistnode = Fields.attr(factory=dllistnode)
-    is_voting: bool = Fields.attr(default=False)
+    engine: cah.CAHEngine = Fields.attr()
     turn_uuid: uuid.UUID = Fields.attr(default=None)
-    black_card: cah.CAHBlackCard = Fields.attr(default=None)
-    candidates: list[cah.CAHCandidateCard] = Fields.attr(factory=list)
+
+    @engine.default
+    def _engine(self):
+        return cah.CAHEngine(
+            self.deck,
+            self.settings.points_to_win,
+            use_czar=self.settings.use_czar,
+            min_players=self.min_players,
+        )
 
     def __attrs_post_init__(self):
         super().__attrs_post_init__()
 
         if self.guild.id == support.TESTING_GROUNDS:
             # noinspection PyClassVar
-            self.min_players = 2
+            self.min_players = self.engine.min_players = 2
 
-        if not self.settings.use_czar:
-            self.__class__ = CAHPopularVoteGame
+        self.processor = CAHEventProcessor(self)
 
-    def retrieve_player(
-        self, user: discord.User, return_node: bool = False
-    ) -> cah.CAHPlayer | dllistnode:
+    @property
+    def card_czar(self) -> cah.CAHPlayer | None:
         """
-        Convert a :class:`discord.User` object to its corresponding :class:`CAHPlayer` object, if one exists.
-
-        Parameters
-        ----------
-        user: discord.User
-            The player's user object.
-        return_node: bool
-            Whether to return the node containing the player object or the player object itself.
-
-        Returns
-        -------
-        cah.CAHPlayer | dllistnode
-            The player object or the node containing the player object.
+        The Card Czar, if there is one.
         """
-
-        if return_node:
-            return discord.utils.find(
-                lambda node: node.value.user.id == user.id, self.players.iternodes()
+        return self.engine.czar
+
+    @property
+    def is_voting(self) -> bool:
+        return self.engine.phase == "voting"
+
+    @property
+    def black_card(self) -> cah.CAHBlackCard | None:
+        return self.engine.black_card
+
+    def snapshot(self) -> dict:
+        positions = self.player_positions()
+        engine = self.engine
+
+        return {
+            **super().snapshot(),
+            "settings": attrs.asdict(self.settings),
+            "deck": self.deck.snapshot(),
+            "players": [player.snapshot() for player in self.players.itervalues()],
+            "phase": engine.phase,
+            "card_czar": positions[engine.czar.user.id] if engine.czar else None,
+            "black_card": engine.black_card.id if engine.black_card else None,
+            "submissions": [
+                {
+                    "player": positions[submission.player.user.id],
+                    "white_cards": [card.id for card in submission.white_cards],
+                    "text": submission.text,
+                    "votes": engine.tally.votes.get(submission.player, 0),
+                }
+                for submission in engine.submissions.values()
+            ],
+            "outstanding": [positions[player.user.id] for player in engine.outstanding],
+            # ballots for submissions that have been withdrawn aren't needed
+            "ballots": [
+                [positions[voter.user.id], positions[player.user.id]]
+                for voter, player in engine.ballots.items()
+                if player in engine.submissions
+            ],
+        }
+
+    @classmethod
+    async def from_snapshot(cls, thread: discord.Thread, data: dict) -> Self:
+        game = cls(
+            guild=thread.guild,
+            thread=thread,
+            host=await support.fetch_member(thread.guild, data["host"]),
+            deck=await cah.CAHDeck.from_snapshot(data["deck"]),
+            settings=CAHGameSettings(**data["settings"]),
+        )
+
+        await game.load_snapshot(data)
+
+        return game
+
+    async def load_snapshot(self, data: dict):
+        await super().load_snapshot(data)
+
+        for player_data in data["players"]:
+            user = await support.fetch_member(self.guild, player_data["id"])
+            player = cah.CAHPlayer(user=user, game=self)
+            self.seat_player(player)
+            self.engine.join(player)
+            player.load_snapshot(player_data)
+
+        players = list(self.players.itervalues())
+
+        self.engine.host = self.retrieve_player(self.host)
+        self.engine.phase = data["phase"]
+
+        if data["card_czar"] is not None:
+            self.engine.czar = players[data["card_czar"]]
+
+        if data["black_card"] is not None:
+            self.engine.black_card = self.deck.black_card(data["black_card"])
+
+        for submission_data in data["submissions"]:
+            player = players[submission_data["player"]]
+            self.engine.submissions[player] = cah.CAHSubmission(
+                player,
+                tuple(self.deck.white_card(i) for i in submission_data["white_cards"]),
+                submission_data["text"],
             )
-        else:
-            return discord.utils.find(
-                lambda player: player.user.id == user.id, self.players.itervalues()
+
+        self.engine.outstanding = dict.fromkeys(players[i] for i in data["outstanding"])
+
+        if self.is_voting:
+            self.engine.tally = cah.CAHTally(
+                {
+                    players[submission_data["player"]]: submission_data["votes"]
+                    for submission_data in data["submissions"]
+                }
             )
+            self.engine.ballots = {
+                players[voter]: players[player] for voter, player in data["ballots"]
+            }
+
+        self.engine.check()
+
+        if self.turn_deadline:
+            self.turn_uuid = uuid.uuid4()
+
+    def resume(self):
+        super().resume()
+
+        # a game snapshotted between rounds picks up with the next one, and a turn snapshotted before its timer was
+        # set gets one now
+        if self.engine.phase == "between":
+            asyncio.create_task(self.start_round())
+        elif self.engine.outstanding and not self.turn_deadline:
+            self.turn_uuid = uuid.uuid4()
+            asyncio.create_task(self.turn_timer())
 
     async def open_lobby(self):
         with shrine.Torii.cah() as torii:
@@ -133,7 +233,9 @@ class CAHGame(HostedGame):
             await self.thread.add_user(user)
 
         player = cah.CAHPlayer(user=user, game=self)
-        self.players.append(player)
+        self.seat_player(player)
+        self.engine.join(player)
+        self.checkpoint()
 
         join_message_embed = discord.Embed(
             title="A new player has joined the game!",
@@ -168,7 +270,7 @@ class CAHGame(HostedGame):
 
             await ctx.respond(embed=embed, ephemeral=True)
 
-    async def remove_player(self, player_node: dllistnode):
+    async def remove_player(self, player_node: dllistnode, reason: str = "left"):
         """
         Remove a player from the game.
 
@@ -176,90 +278,74 @@ class CAHGame(HostedGame):
         ----------
         player_node: dllistnode
             The node containing the player to remove.
+        reason: str, default="left"
+            Why the player is being removed. See :meth:`cah.CAHEngine.remove`.
         """
+        await self.processor.process(self.engine.remove(player_node.value, reason))
 
-        player: cah.CAHPlayer = player_node.value
+    async def notify_inactivity_kick(self, player: cah.CAHPlayer):
+        """
+        Let a player know, by DM, that they've been kicked for inactivity.
 
+        Parameters
+        ----------
+        player: cah.CAHPlayer
+            The kicked player.
+        """
+        msg = (
+            f"You were removed from {self.host.mention}'s Cards Against Humanity game in {self.guild.name} "
+            f"for inactivity."
+        )
         embed = discord.Embed(
-            title="A player has left the game.",
-            description=f"{player.user.mention} has left the game.",
+            title=f"You timed out of {self.host.name}'s Cards Against Humanity game.",
+            description=msg,
             color=support.Color.error(),
         )
 
-        await self.thread.send(embed=embed)
-
-        # if the host leaves, the game is force closed
-        if player.user == self.host:
-            await self.force_close(reason="host_left")
-
-        elif self.has_started:
-            # if there are too few players remaining in the game and the game has started, the game is force closed
-            if len(self.players) - 1 < self.min_players:
-                await self.force_close(reason="insufficient_players")
-
-            elif self.is_voting and player == self.card_czar.value:
-                await player.force_vote()
-
-            elif not self.is_voting:
-                if player == self.card_czar.value:
-                    self.card_czar = self.card_czar.next
-                    msg = f"{self.card_czar.value.user.mention} is now the Card Czar."
-                    embed = discord.Embed(
-                        title="The Card Czar has changed!",
-                        description=msg,
-                        color=support.Color.caution(),
-                    )
-                    embed.set_thumbnail(
-                        url=self.card_czar.value.user.display_avatar.url
-                    )
-
-                    await self.thread.send(
-                        content=f"{self.card_czar.value.user.mention}, you are now the Card Czar.",
-                        embed=embed,
-                    )
-                else:
-                    await player.force_pick()
-
-            player_candidate = discord.utils.find(
-                lambda c: c.player == player, self.candidates
-            )
-            if player_candidate:
-                self.candidates.remove(player_candidate)
+        await player.user.send(embed=embed)
 
-        self.players.remove(player_node)
+    async def release_voice(self, player: cah.CAHPlayer):
+        """
+        Disconnect a departing player from the game's voice channel and revoke their access to it.
 
+        Parameters
+        ----------
+        player: cah.CAHPlayer
+            The departing player.
+        """
         if self.voice_channel and player.user in self.voice_channel.members:
             await player.user.move_to(None)
             await self.voice_channel.set_permissions(target=player.user, overwrite=None)
 
-    async def inactivity_kick(self, player: cah.CAHPlayer):
+    async def send_submissions(self, embed: discord.Embed, **kwargs):
         """
-        Kick a player for inactivity.
+        Send the round's submissions to the game thread, rendered as a gallery (see :class:`cah.CAHRenderer`) or,
+        if the renderer is too busy, listed in an embed.
 
         Parameters
         ----------
-        player: cah.CAHPlayer
-            The player to kick.
+        embed: discord.Embed
+            The embed to send the submissions with.
+        **kwargs
+            Keyword arguments to pass to :meth:`discord.Thread.send`.
         """
-        msg = f"{player.user.mention} has been removed for inactivity."
-        embed = discord.Embed(
-            title="Player Kicked", description=msg, color=support.Color.error()
+        submissions = list(self.engine.submissions.values())
+        gallery = await cah.CAHRenderer.render(
+            [submission.text for submission in submissions]
         )
 
-        await self.thread.send(embed=embed)
-        await self.remove_player(self.retrieve_player(player.user, return_node=True))
-
-        msg = (
-            f"You were removed from {self.host.mention}'s Cards Against Humanity game in {self.guild.name} "
-            f"for inactivity."
-        )
-        embed = discord.Embed(
-            title=f"You timed out of {self.host.name}'s Cards Against Humanity game.",
-            description=msg,
-            color=support.Color.error(),
-        )
+        if gallery:
+            embed.set_image(url="attachment://submissions.png")
+            kwargs["file"] = discord.File(
+                io.BytesIO(gallery), filename="submissions.png"
+            )
+        else:
+            embed.description += "".join(
+                f"\n\n**Submission {i + 1}**\n{submission.text}"
+                for i, submission in enumerate(submissions)
+            )
 
-        await player.user.send(embed=embed)
+        await self.thread.send(embed=embed, **kwargs)
 
     async def start_game(self):
         """
@@ -268,7 +354,9 @@ class CAHGame(HostedGame):
         self.is_joinable = False
         await self.thread.edit(name=f"{self.short_name} with {self.host.name}!")
 
-        random.shuffle(self.players)
+        self.shuffle_players()
+        events = self.engine.start(order=self.players.itervalues())
+        support.PronounResolver.prefetch(*self.player_nodes)
 
         with shrine.Torii.cah() as torii:
             template = torii.get_template("game-start.md")
@@ -288,10 +376,10 @@ class CAHGame(HostedGame):
 
         await asyncio.sleep(3)
 
-        for player in self.players.itervalues():
-            player.add_cards(10)
-
-        msg = "10 white cards have been dealt to each player. Check them out with `/cah hand`."
+        msg = (
+            f"{self.engine.HAND_SIZE} white cards have been dealt to each player. Check them out with "
+            f"`/cah hand`."
+        )
         embed = discord.Embed(
             title="The game begins!", description=msg, color=support.Color.mint()
         )
@@ -299,138 +387,13 @@ class CAHGame(HostedGame):
 
         await asyncio.sleep(2)
 
-        await self.start_round()
+        await self.processor.process(events)
 
     async def start_round(self):
         """
         Start a new round.
         """
-        self.turn_uuid = uuid.uuid4()
-        self.card_czar = (
-            self.card_czar.next
-            if self.card_czar and self.card_czar.next
-            else self.players.first
-        )
-        self.black_card = self.deck.get_random_black()
-        self.candidates.clear()
-
-        for player in self.players.itervalues():
-            player.has_submitted = False
-
-        card_embed = discord.Embed(
-            title="Black Card",
-            description=self.black_card.text,
-            color=support.Color.black(),
-        )
-        card_embed.set_footer(
-            text=f"{self.card_czar.value.user.name} is the Card Czar.",
-            icon_url=self.card_czar.value.user.display_avatar.url,
-        )
-
-        await self.thread.send(
-            content=f"@everyone Pick {inflect.number_to_words(self.black_card.pick)} "
-            f"white {inflect.plural('card', self.black_card.pick)} with "
-            f"`/cah play`. {self.card_czar.value.user.mention} is the "
-            f"Card Czar.",
-            embed=card_embed,
-        )
-
-        await self.turn_timer()
-
-    async def start_voting(self):
-        """
-        Start the voting phase of the current round.
-        """
-        self.turn_uuid = uuid.uuid4()
-        self.is_voting = True
-
-        msg = f"**{self.card_czar.value.user.name}** is the Card Czar."
-        embed = discord.Embed(
-            title="It's voting time!", description=msg, color=support.Color.mint()
-        )
-        embed.set_thumbnail(url=self.card_czar.value.user.display_avatar.url)
-
-        for i, candidate in enumerate(self.candidates):
-            embed.add_field(
-                name=f"Submission {i + 1}", value=candidate.text, inline=True
-            )
-            if (i + 1) % 3 == 0:
-                embed.add_field(name="\u200b", value="\u200b", inline=False)
-
-        await self.thread.send(
-            content=f"{self.card_czar.value.user.mention} Select your favorite submission "
-            f"with `/cah play`.",
-            embed=embed,
-        )
-
-        await self.turn_timer()
-
-    async def submit_vote(self, candidate: cah.CAHCandidateCard, **_):
-        """
-        Submit a vote for a candidate card.
-
-        Parameters
-        ----------
-        candidate: cah.CAHCandidateCard
-            The candidate card.
-        """
-        await self.end_round(winning_submission=candidate)
-
-    async def end_round(self, winning_submission: cah.CAHCandidateCard):
-        """
-        End the current round.
-
-        Parameters
-        ----------
-        winning_submission: cah.CAHCandidateCard
-            The winning submission.
-        """
-        self.turn_uuid = None
-        self.is_voting = False
-
-        victor = winning_submission.player
-        victor.points += 1
-
-        victor_rank = inflect.ordinal(
-            self.get_leaderboard().index(
-                discord.utils.find(
-                    lambda group: victor in group, self.get_leaderboard()
-                )
-            )
-            + 1
-        )
-
-        msg = (
-            f"The {'Card Czar has ' if self.settings.use_czar else 'players have '} "
-            f"chosen {posessive(victor.mention)} submission.\n"
-            f"\n"
-            f"**{victor.name}** now has {inflect.no('point', victor.points)}, "
-            f"putting {victor.pronoun('them')} in {victor_rank} place."
-        )
-
-        if (point_gap := self.settings.points_to_win - victor.points) > 0:
-            msg = (
-                msg[:-1]
-                + f"—**{inflect.no('point', point_gap)}** away from winning the game."
-            )
-
-        embed = discord.Embed(
-            title=f"{victor.user.name} gains a point!",
-            description=msg,
-            color=support.Color.mint(),
-        )
-        embed.add_field(
-            name="Winning Submission", value=winning_submission.text, inline=False
-        )
-        embed.set_thumbnail(url=victor.user.display_avatar.url)
-
-        await self.thread.send(embed=embed)
-
-        if winning_submission.player.points >= self.settings.points_to_win:
-            await self.end_game(victor)
-        else:
-            await asyncio.sleep(5)
-            await self.start_round()
+        await self.processor.process(self.engine.start_round())
 
     async def end_game(self, game_winner: cah.CAHPlayer):
         """
@@ -467,80 +430,44 @@ class CAHGame(HostedGame):
         await asyncio.sleep(60)
         await self.thread.delete()
 
-    async def turn_timer(self):
+    async def turn_timer(self, *, resume: bool = False):
         """
         Start a timer for the current turn.
 
         The game will forcefully progress if this timer expires and the current turn has not yet ended.
-        """
-
-        async def play_callback():
-            """
-            The time limit trigger for playing cards.
-            """
-            outstanding_players = [
-                player
-                for player in self.players.itervalues()
-                if not player.has_submitted and player != self.card_czar.value
-            ]
-            mentions = [player.user.mention for player in outstanding_players]
-            msg = "The mentioned players have timed out. I've made their submissions for them."
-            embed = discord.Embed(
-                title="Time's up.", description=msg, color=support.Color.error()
-            )
-            await self.thread.send(content="".join(mentions), embed=embed)
-
-            for player in outstanding_players:
-                await player.increment_timeouts()
-
-                if self.retrieve_player(player.user):
-                    await player.force_pick()
-
-        async def vote_callback():
-            """
-            The time limit trigger for voting.
-            """
-            msg = "You timed out. I've cast your vote for you."
-            embed = discord.Embed(
-                title="Time's up.", description=msg, color=support.Color.error()
-            )
-            await self.thread.send(
-                content=self.card_czar.value.user.mention, embed=embed
-            )
-
-            await self.card_czar.value.increment_timeouts()
-
-            if self.retrieve_player(self.card_czar.value.user):
-                await self.card_czar.value.force_vote()
 
+        Parameters
+        ----------
+        resume: bool
+            Whether to count down to the existing :attr:`turn_deadline` rather than setting a new one, as when a game
+            is restored from a snapshot.
+        """
         turn_uuid = self.turn_uuid
 
-        await asyncio.sleep(support.fuzz(self.settings.timeout))
+        if not resume:
+            self.turn_deadline = time.time() + support.fuzz(self.settings.timeout)
+            self.checkpoint()
+
+        await asyncio.sleep(max(self.turn_deadline - time.time(), 0))
 
-        if turn_uuid == self.turn_uuid and self.retrieve_game(self.thread.id):
-            await play_callback() if not self.is_voting else await vote_callback()
+        if (
+            turn_uuid == self.turn_uuid
+            and self.retrieve_game(self.thread.id)
+            and self.engine.outstanding
+        ):
+            # the engine makes submissions or casts votes for everyone who hasn't, and removes anyone who's timed out
+            # too many times in a row
+            await self.processor.process(self.engine.time_out())
 
-    def get_leaderboard(self) -> list[[list[cah.CAHPlayer]]]:
+    def get_leaderboard(self) -> list[list[cah.CAHPlayer]]:
         """
         Returns the game leaderboard.
         """
-        point_order = reversed(
-            SortedKeyList(self.players.itervalues(), key=lambda p: p.points)
-        )
-
-        leaderboard = []
-        determinant = 0
-        for player in point_order:
-            if not leaderboard or player.points < determinant:
-                leaderboard.append([player])
-                determinant = player.points
-            else:
-                leaderboard[-1].append(player)
-
-        return leaderboard
+        return self.engine.standings()
 
     async def transfer_host(self, new_host: discord.User):
         old_host = self.host
+        self.engine.host = self.retrieve_player(new_host)
         await super().transfer_host(new_host)
 
         if self.voice_channel:
@@ -575,7 +502,7 @@ class CAHGame(HostedGame):
         )
 
         await self.thread.send(embed=embed)
-        await self.remove_player(player_node)
+        await self.remove_player(player_node, "kicked")
 
         embed = discord.Embed(
             title=f"You were kicked from {posessive(self.host.name)} CAH game.",
@@ -588,203 +515,297 @@ class CAHGame(HostedGame):
         await player_node.value.user.send(embed=embed)
 
 
-class CAHPopularVoteGame(CAHGame):
+@define(frozen=False)
+class CAHGameSettings:
     """
-    A Cards Against Humanity game where winners are determined by popular vote rather than a Card Czar.
-
-    An object of this class is created rather than a :class:`CAHGame` object when `/cah create` command is invoked
-    with the `voting` option set to "Popular Vote".
-
-    This class overrides the functionality of some methods to accommodate the popular vote system. Its objects
-    can generally be treated as equivalent to those of :class:`CAHGame`.
+    Settings for a Cards Against Humanity game.
     """
 
-    async def remove_player(self, player_node: dllistnode):
-        player: cah.CAHPlayer = player_node.value
+    max_players: int
+    points_to_win: int
+    timeout: int
+    use_czar: bool
 
-        embed = discord.Embed(
-            title="A player has left the game.",
-            description=f"{player.user.mention} has left the game.",
-            color=support.Color.error(),
+    def __str__(self):
+        players_str = (
+            f"__**Maximum Players**: {self.max_players}__\n"
+            f"Up to {self.max_players} can join this CAH game. Once that quota is filled, "
+            f"no one else will be able to join unless a player leaves or is removed by the Game Host."
         )
 
-        await self.thread.send(embed=embed)
+        points_str = (
+            f"__**Points to Win**: {self.points_to_win}__\n"
+            f"The first player to reach {self.points_to_win} points will win the game."
+        )
 
-        # if the host leaves, the game is force closed
-        if player.user == self.host:
-            await self.force_close(reason="host_left")
+        timeout_str = (
+            f"__**Timeout**: {self.timeout} seconds__\n"
+            f"Each player will have {self.timeout} seconds to play white cards when prompted. "
+            f"When it's voting time, {'the Card Czar' if self.use_czar else 'players'} will have "
+            f"{self.timeout} seconds to vote for a white card."
+        )
+
+        voting_str = (
+            f"__**Voting Mode**: {'Card Czar' if self.use_czar else 'Popular Vote'}__\n"
+            f"At the end of each round, the funniest submission will be decided by "
+            f"{'a Card Czar' if self.use_czar else 'popular vote'}."
+        )
 
-        # if there are too few players remaining in the game and the game has started, the game is force closed
-        elif len(self.players) - 1 < self.min_players and not self.is_joinable:
-            await self.force_close(reason="insufficient_players")
+        return "\n\n".join([players_str, points_str, timeout_str, voting_str])
 
-        elif not self.is_joinable:
-            await player.force_vote() if self.is_voting else await player.force_pick()
 
-            player_candidate = discord.utils.find(
-                lambda c: c.player == player, self.candidates
-            )
-            if player_candidate:
-                self.candidates.remove(player_candidate)
+@define
+class CAHEventProcessor:
+    """
+    Turns the events returned by :class:`cah.CAHEngine` into messages.
 
-        self.players.remove(player_node)
+    Parameters
+    ----------
+    game: CAHGame
+    """
 
-        if self.voice_channel and player.user in self.voice_channel.members:
-            await player.user.move_to(None)
-            await self.voice_channel.set_permissions(target=player.user, overwrite=None)
+    game: CAHGame
 
-    async def start_round(self):
-        self.turn_uuid = uuid.uuid4()
-        self.black_card = self.deck.get_random_black()
-        self.candidates.clear()
+    async def process(self, events: list[cah.CAHEvent]):
+        """
+        Handle events in the order they happened.
 
-        for player in self.players.itervalues():
-            player.has_submitted = False
-            player.has_voted = False
+        Parameters
+        ----------
+        events : list[cah.CAHEvent]
+            The events.
+        """
+        # everyone who timed out at once is told so in a single message, before anything else happens
+        if timed_out := [e for e in events if isinstance(e, cah.PlayerTimedOut)]:
+            await self.time_out_event(timed_out, events)
+
+        for event in events:
+            match event:
+                case cah.RoundStarted():
+                    await self.round_started_event(event)
+                case cah.CardsSubmitted():
+                    await self.cards_submitted_event(event)
+                case cah.VotingStarted():
+                    await self.voting_started_event(event)
+                case cah.VoteCast():
+                    await self.vote_cast_event(event)
+                case cah.RoundWon():
+                    await self.round_won_event(event)
+                case cah.GameWon():
+                    await self.game.end_game(game_winner=event.player)
+                case cah.PlayerRemoved():
+                    await self.player_removed_event(event)
+                case cah.CzarChanged():
+                    await self.czar_changed_event(event)
+                case cah.GameClosed():
+                    await self.game.force_close(reason=event.reason)
+
+    async def round_started_event(self, event: cah.RoundStarted):
+        """
+        The handler for the event of a round starting.
+        """
+        self.game.turn_uuid = uuid.uuid4()
+        pick = event.black_card.pick
 
         card_embed = discord.Embed(
             title="Black Card",
-            description=self.black_card.text,
+            description=event.black_card.text,
             color=support.Color.black(),
         )
 
-        await self.thread.send(
-            content=f"@everyone Pick {inflect.number_to_words(self.black_card.pick)} "
-            f"white {inflect.plural('card', self.black_card.pick)} with "
-            f"`/cah play`.",
-            embed=card_embed,
-        )
-
-        await self.turn_timer()
-
-    async def start_voting(self):
-        self.turn_uuid = uuid.uuid4()
-        self.is_voting = True
-
-        msg = f"Vote for your favorite submission with `/cah play`."
-        embed = discord.Embed(
-            title="It's voting time!", description=msg, color=support.Color.mint()
+        content = (
+            f"@everyone Pick {inflect.number_to_words(pick)} white "
+            f"{inflect.plural('card', pick)} with `/cah play`."
         )
 
-        for i, candidate in enumerate(self.candidates):
-            embed.add_field(
-                name=f"Submission {i + 1}", value=candidate.text, inline=True
+        if czar := event.czar:
+            card_embed.set_footer(
+                text=f"{czar.user.name} is the Card Czar.",
+                icon_url=czar.user.display_avatar.url,
             )
-            if i + 1 % 3 == 0:
-                embed.add_field(name="\u200b", value="\u200b", inline=False)
+            content += f" {czar.user.mention} is the Card Czar."
 
-        await self.thread.send(content="@everyone", embed=embed)
+        await self.game.thread.send(content=content, embed=card_embed)
+        await self.game.turn_timer()
 
-        await self.turn_timer()
+    async def cards_submitted_event(self, event: cah.CardsSubmitted):
+        """
+        The handler for the event of a player making a submission, or having one made for them.
+        """
+        await event.submission.player.terminate_views()
+        self.game.checkpoint()
 
-    # noinspection PyMethodOverriding
-    async def submit_vote(
-        self, candidate: cah.CAHCandidateCard, *, voter: cah.CAHPlayer
-    ):
-        real_candidate: cah.CAHCandidateCard = discord.utils.find(
-            lambda c: c.uuid == candidate.uuid, self.candidates
-        )
-        real_candidate.voters.append(voter)
-
-        if all(player.has_voted for player in self.players.itervalues()):
-            # determine the highest vote total
-            max_points = max(len(candidate.voters) for candidate in self.candidates)
-
-            # get a list of candidates with the highest vote total
-            potential_winners = [
-                candidate
-                for candidate in self.candidates
-                if len(candidate.voters) == max_points
-            ]
-
-            # pick a winner at random from the aforementioned list. this is redundant if there is only one potential
-            # winner, but fairly resolves ties in the event there are multiple potential winners
-            await self.end_round(random.choice(potential_winners))
-
-    async def turn_timer(self):
-        async def play_callback():
-            outstanding_players = [
-                player
-                for player in self.players.itervalues()
-                if not player.has_submitted
-            ]
-            mentions = [player.user.mention for player in outstanding_players]
-            msg = "The mentioned players have timed out. I've made their submissions for them."
+    async def voting_started_event(self, event: cah.VotingStarted):
+        """
+        The handler for the event of voting starting.
+        """
+        self.game.turn_uuid = uuid.uuid4()
+
+        if czar := self.game.card_czar:
+            msg = f"**{czar.user.name}** is the Card Czar."
             embed = discord.Embed(
-                title="Time's up.", description=msg, color=support.Color.error()
+                title="It's voting time!", description=msg, color=support.Color.mint()
             )
-            await self.thread.send(content="".join(mentions), embed=embed)
+            embed.set_thumbnail(url=czar.user.display_avatar.url)
+            content = (
+                f"{czar.user.mention} Select your favorite submission with `/cah play`."
+            )
+        else:
+            msg = "Vote for your favorite submission with `/cah play`."
+            embed = discord.Embed(
+                title="It's voting time!", description=msg, color=support.Color.mint()
+            )
+            content = "@everyone"
 
-            for player in outstanding_players:
-                await player.increment_timeouts()
+        await self.game.send_submissions(embed, content=content)
+        await self.game.turn_timer()
 
-                if self.retrieve_player(player.user):
-                    await player.force_pick()
+    async def vote_cast_event(self, event: cah.VoteCast):
+        """
+        The handler for the event of a player casting a vote, or having one cast for them.
+        """
+        await event.voter.terminate_views()
+        self.game.checkpoint()
 
-        async def vote_callback():
-            outstanding_players = [
-                player
-                for player in self.players.itervalues()
-                if not player.has_submitted
-            ]
-            mentions = [player.user.mention for player in outstanding_players]
+    async def time_out_event(
+        self, timed_out: list[cah.PlayerTimedOut], events: list[cah.CAHEvent]
+    ):
+        """
+        The handler for the event of players running out of time to submit or vote.
 
-            msg = (
-                "The mentioned players have timed out. I've cast their votes for them."
+        Parameters
+        ----------
+        timed_out : list[cah.PlayerTimedOut]
+            The players who timed out.
+        events : list[cah.CAHEvent]
+            Everything that happened as a result.
+        """
+        players = [event.player for event in timed_out]
+        kicked = [
+            event.player
+            for event in events
+            if isinstance(event, cah.PlayerRemoved) and event.reason == "inactive"
+        ]
+        submitted = [
+            event.submission.player
+            for event in events
+            if isinstance(event, cah.CardsSubmitted) and event.forced
+        ]
+        voted = [
+            event.voter
+            for event in events
+            if isinstance(event, cah.VoteCast) and event.forced
+        ]
+
+        msg = "The mentioned players have timed out."
+
+        if submitted:
+            msg += f" I've made submissions for {inflect.join([p.user.mention for p in submitted])}."
+
+        if voted:
+            msg += (
+                f" I've cast {'votes' if len(voted) > 1 else 'a vote'} for "
+                f"{inflect.join([p.user.mention for p in voted])}."
             )
-            embed = discord.Embed(
-                title="Time's up.", description=msg, color=support.Color.error()
+
+        if kicked:
+            msg += (
+                f" {inflect.join([p.user.mention for p in kicked])} "
+                f"{inflect.plural_verb('has', len(kicked))} been removed for inactivity."
             )
-            await self.thread.send(content="".join(mentions), embed=embed)
 
-            for player in outstanding_players:
-                await player.increment_timeouts()
+        embed = discord.Embed(
+            title="Time's up.", description=msg, color=support.Color.error()
+        )
+        await self.game.thread.send(
+            content="".join(player.user.mention for player in players), embed=embed
+        )
 
-                if self.retrieve_player(player.user):
-                    await player.force_vote()
+        # one player's DMs being closed shouldn't keep anyone else from being notified. this has to happen before
+        # the game is closed, since closing it deletes the thread after a minute-long wait
+        await asyncio.gather(
+            *[self.game.notify_inactivity_kick(player) for player in kicked],
+            return_exceptions=True,
+        )
 
-        turn_uuid = self.turn_uuid
+    async def round_won_event(self, event: cah.RoundWon):
+        """
+        The handler for the event of a player winning a round.
+        """
+        self.game.turn_uuid = None
+        self.game.turn_deadline = None
+        self.game.checkpoint()
 
-        await asyncio.sleep(self.settings.timeout)
+        submission = event.submission
+        victor: cah.CAHPlayer = submission.player
+        victor_rank = inflect.ordinal(self.game.engine.leaderboard.place(victor))
 
-        if turn_uuid == self.turn_uuid and self.retrieve_game(self.thread.id):
-            await play_callback() if not self.is_voting else await vote_callback()
+        msg = (
+            f"The {'Card Czar has ' if self.game.settings.use_czar else 'players have '} "
+            f"chosen {posessive(victor.mention)} submission.\n"
+            f"\n"
+            f"**{victor.name}** now has {inflect.no('point', event.points)}, "
+            f"putting {victor.pronoun('them')} in {victor_rank} place."
+        )
 
+        if (point_gap := self.game.settings.points_to_win - event.points) > 0:
+            msg = (
+                msg[:-1]
+                + f"—**{inflect.no('point', point_gap)}** away from winning the game."
+            )
 
-@define(frozen=False)
-class CAHGameSettings:
-    """
-    Settings for a Cards Against Humanity game.
-    """
+        embed = discord.Embed(
+            title=f"{victor.user.name} gains a point!",
+            description=msg,
+            color=support.Color.mint(),
+        )
+        embed.add_field(name="Winning Submission", value=submission.text, inline=False)
+        embed.set_thumbnail(url=victor.user.display_avatar.url)
 
-    max_players: int
-    points_to_win: int
-    timeout: int
-    use_czar: bool
+        await self.game.thread.send(embed=embed)
 
-    def __str__(self):
-        players_str = (
-            f"__**Maximum Players**: {self.max_players}__\n"
-            f"Up to {self.max_players} can join this CAH game. Once that quota is filled, "
-            f"no one else will be able to join unless a player leaves or is removed by the Game Host."
-        )
+        # a round that wins the game is followed by a GameWon event instead of another round
+        if self.game.engine.phase == "between":
+            await asyncio.sleep(5)
+            await self.game.start_round()
 
-        points_str = (
-            f"__**Points to Win**: {self.points_to_win}__\n"
-            f"The first player to reach {self.points_to_win} points will win the game."
+    async def czar_changed_event(self, event: cah.CzarChanged):
+        """
+        The handler for the event of the Card Czar changing mid-round.
+        """
+        czar: cah.CAHPlayer = event.czar
+
+        embed = discord.Embed(
+            title="The Card Czar has changed!",
+            description=f"{czar.user.mention} is now the Card Czar.",
+            color=support.Color.caution(),
         )
+        embed.set_thumbnail(url=czar.user.display_avatar.url)
 
-        timeout_str = (
-            f"__**Timeout**: {self.timeout} seconds__\n"
-            f"Each player will have {self.timeout} seconds to play white cards when prompted. "
-            f"When it's voting time, {'the Card Czar' if self.use_czar else 'players'} will have "
-            f"{self.timeout} seconds to vote for a white card."
+        await self.game.thread.send(
+            content=f"{czar.user.mention}, you are now the Card Czar.", embed=embed
         )
 
-        voting_str = (
-            f"__**Voting Mode**: {'Card Czar' if self.use_czar else 'Popular Vote'}__\n"
-            f"At the end of each round, the funniest submission will be decided by "
-            f"{'a Card Czar' if self.use_czar else 'popular vote'}."
+    async def player_removed_event(self, event: cah.PlayerRemoved):
+        """
+        The handler for the event of a player leaving the game, for whatever reason.
+        """
+        player: cah.CAHPlayer = event.player
+
+        # players removed for inactivity are announced along with everyone else who timed out
+        if event.reason != "inactive":
+            embed = discord.Embed(
+                title="A player has left the game.",
+                description=f"{player.user.mention} has left the game.",
+                color=support.Color.error(),
+            )
+
+            await self.game.thread.send(embed=embed)
+
+        await player.terminate_views()
+        self.game.unseat_player(
+            self.game.retrieve_player(player.user, return_node=True)
         )
+        self.game.checkpoint()
 
-        return "\n\n".join([players_str, points_str, timeout_str, voting_str])
+        await self.game.release_voice(player)
@@ -6,8 +6,6 @@
 
 from __future__ import annotations
 
-import random
-
 import discord
 import inflect as ifl
 from attr import define
@@ -20,11 +18,14 @@ from support import BasePlayer, PlayerVoiceMixin
 inflect = ifl.engine()
 
 
-@define
+@define(eq=False)
 class CAHPlayer(PlayerVoiceMixin, BasePlayer):
     """
     A player in a Cards Against Humanity game.
 
+    The player's hand, points, and timeouts are kept by the game's :class:`cah.CAHEngine`, which compares players by
+    identity.
+
     Parameters
     ----------
     game: cah.CAHGame
@@ -32,28 +33,48 @@ class CAHPlayer(PlayerVoiceMixin, BasePlayer):
 
     Attributes
     ----------
-    points: int
-        The player's point total.
-    consecutive_timeouts: int
-        The number of consecutive times the player has timed out.
-    hand: list[str]
-        The white cards in the player's possession.
-    has_submitted: bool
-        Whether the player has made a submission for the current round.
-    has_voted: bool
-        Whether the player has cast a vote for the current round. Applicable only to popular vote games.
     terminable_views: list[cah.CAHTerminableView]
     """
 
     game: cah.CAHGame
 
-    points: int = Fields.attr(default=0)
-    consecutive_timeouts: int = Fields.attr(default=0)
-    hand: list[cah.CAHCandidateCard] = Fields.attr(factory=list)
-    has_submitted: bool = Fields.attr(default=False)
-    has_voted: bool = Fields.attr(default=False)
     terminable_views: list[cah.CAHTerminableView] = Fields.attr(factory=list)
 
+    @property
+    def hand(self) -> list[cah.CAHWhiteCard]:
+        """
+        The white cards in the player's possession.
+        """
+        return self.game.engine.hands[self]
+
+    @property
+    def points(self) -> int:
+        """
+        The player's point total.
+        """
+        return self.game.engine.points[self]
+
+    @property
+    def consecutive_timeouts(self) -> int:
+        """
+        The number of consecutive times the player has timed out.
+        """
+        return self.game.engine.timeouts[self]
+
+    @property
+    def has_submitted(self) -> bool:
+        """
+        Whether the player has made a submission for the current round.
+        """
+        return self in self.game.engine.submissions
+
+    @property
+    def has_voted(self) -> bool:
+        """
+        Whether the player has cast a vote for the current round. Applicable only to popular vote games.
+        """
+        return self.game.is_voting and self not in self.game.engine.outstanding
+
     async def show_hand(self, ctx: discord.ApplicationContext):
         """
         Shows the player the white cards they're currently holding.
@@ -71,137 +92,77 @@ class CAHPlayer(PlayerVoiceMixin, BasePlayer):
         """
         Prompts the player to pick white cards to play.
         """
-        candidate: cah.CAHCandidateCard = await cah.CAHCardSelectView(
-            ctx=ctx, player=self
-        ).select_card()
-
-        if candidate:
-            self.reset_timeouts()
-            await self.submit_candidate(candidate)
+        pick = await cah.CAHCardSelectView(ctx=ctx, player=self).select_card()
 
-    async def force_pick(self, player_removal: bool = False):
-        """
-        Pick random white cards on the player's behalf.
-
-        Parameters
-        ----------
-        player_removal: bool
-            Flags whether this is happening as a consequence of the player's removal from the game.
-        """
-        # pick x number of cards from the player's hand at random, depending on how many white cards need to be played
-        cards = [
-            self.hand[i]
-            for i in random.sample(range(len(self.hand)), self.game.black_card.pick)
-        ]
-
-        # create candidates from those cards and randomly choose one of them to submit
-        candidate: cah.CAHCandidateCard = random.choice(
-            cah.CAHCandidateCard.create(self, *cards)
-        )
-
-        await self.submit_candidate(candidate, player_removal=player_removal)
-
-    async def submit_candidate(
-        self, candidate: cah.CAHCandidateCard, player_removal: bool = False
-    ):
-        """
-        Submit a candidate card.
-
-        Parameters
-        ----------
-        candidate: cah.CAHCandidateCard
-            The candidate card to submit.
-        player_removal: bool
-            Flags whether this is happening automatically as a consequence of the player's removal from the game.
-        """
-        self.has_submitted = True
-
-        if not player_removal:
-            self.game.candidates.append(candidate)
-
-        await self.terminate_views()
-
-        for card in candidate.white_cards:
-            self.hand.remove(card)
-
-        self.add_cards(10 - len(self.hand))
-
-        if all(
-            player.has_submitted
-            for player in self.game.players.itervalues()
-            if player != self.game.card_czar.value
-        ):
-            await self.game.start_voting()
+        # the player may have timed out while they were picking
+        if pick and not self.game.is_voting and self in self.game.engine.outstanding:
+            cards, order = pick
+            await self.game.processor.process(
+                self.game.engine.submit(self, cards, order)
+            )
 
     async def vote(self, ctx: discord.ApplicationContext):
         """
-        Prompt the player to vote for a candidate card.
+        Prompt the player to vote for a submission.
         """
-        selection: cah.CAHCandidateCard = await cah.CAHVotingView(
+        selection: cah.CAHSubmission = await cah.CAHVotingView(
             ctx=ctx, game=self.game
         ).vote()
 
-        if selection:
-            self.has_voted = True
-            self.reset_timeouts()
-            await self.terminate_views()
-            await self.game.submit_vote(candidate=selection, voter=self)
+        # the player may have timed out, or the submission's player left, while they were voting
+        if (
+            selection
+            and self.game.is_voting
+            and self in self.game.engine.outstanding
+            and selection.player in self.game.engine.submissions
+        ):
+            await self.game.processor.process(
+                self.game.engine.vote(self, selection.player)
+            )
 
-    async def force_vote(self):
+    def snapshot(self) -> dict:
         """
-        Vote for a random candidate card on the player's behalf.
+        Serialize the player's state for :meth:`cah.CAHGame.snapshot`.
         """
-        await self.terminate_views()
-        await self.game.submit_vote(
-            candidate=random.choice(self.game.candidates), voter=self
-        )
+        return {
+            "id": self.user.id,
+            "points": self.points,
+            "consecutive_timeouts": self.consecutive_timeouts,
+            "hand": [card.id for card in self.hand],
+        }
 
-    def add_cards(self, num_cards):
+    def load_snapshot(self, data: dict):
         """
-        Add white cards to the player's hand.
+        Restore the player's state from a snapshot made by :meth:`snapshot`. The player must already have joined the
+        game's engine.
 
         Parameters
         ----------
-        num_cards: int
-            The number of cards to add.
+        data: dict
+            The snapshot.
         """
-        self.hand.extend(self.game.deck.get_random_white(num_cards))
+        engine = self.game.engine
+        engine.hands[self] = [self.game.deck.white_card(i) for i in data["hand"]]
+        engine.points[self] = data["points"]
+        engine.timeouts[self] = data["consecutive_timeouts"]
+        engine.leaderboard.update(self, data["points"])
 
     def get_ranking(self, with_string: bool = False) -> str:
         """
         Returns a string representation of the player's ranking in the game. (e.g. "1st", "2nd", "3rd", etc.).
         """
-        leaderboard_group = discord.utils.find(
-            lambda group: self in group, self.game.get_leaderboard()
-        )
-        ranking = inflect.ordinal(
-            self.game.get_leaderboard().index(leaderboard_group) + 1
-        )
+        leaderboard = self.game.engine.leaderboard
+        ranking = inflect.ordinal(leaderboard.place(self))
 
         if with_string:
             ranking += f" of {len(self.game.players)}"
-            ties = len(leaderboard_group) - 1
+            ties = len(leaderboard.tied(self)) - 1
 
             if ties > 0:
                 ranking += f" (tied with {ties} {inflect.plural('other', ties)})"
 
         return ranking
 
-    async def increment_timeouts(self):
-        """
-        Increments the player's timeout counter by one.
-        """
-        self.consecutive_timeouts += 1
-
-        if self.consecutive_timeouts >= 3:
-            await self.game.inactivity_kick(self)
-
-    def reset_timeouts(self):
-        """
-        Resets the player's timeout counter to 0.
-        """
-        self.consecutive_timeouts = 0
-
     async def terminate_views(self):
         """
         Terminates time-sensitive views.
@@ -0,0 +1,343 @@
+########################################################################################################################
+#                         Copyright (C) 2023-present celsius narhwal <hello@celsiusnarhwal.dev>                        #
+#  This notice may not be altered or removed except by or with the express written permission of the copyright holder. #
+#                                      For more information, see the COPYING file.                                     #
+########################################################################################################################
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import io
+import math
+import re
+import string
+import threading
+from collections import OrderedDict
+
+import reportlab
+from attrs import define
+from elysia import Fields
+from path import Path
+from PIL import Image, ImageDraw, ImageFont
+
+from keyboard import *
+
+__all__ = ["CAHGlyphAtlas", "CAHRenderer"]
+
+
+@define
+class CAHGlyphAtlas:
+    """
+    The glyphs of one font at one size, each rasterized once and then reused.
+
+    Printable ASCII is rasterized when the atlas is created. Any other character is rasterized the first time it's
+    needed and kept from then on. Atlases can be shared between threads; only rasterizing a new glyph is serialized.
+
+    Parameters
+    ----------
+    path : str
+        The path to the font file.
+    size : int
+        The font size, in pixels.
+    """
+
+    path: str = Fields.field(frozen=True)
+    size: int = Fields.field(frozen=True)
+
+    font: ImageFont.FreeTypeFont = Fields.attr()
+    glyphs: dict[str, tuple[Image.Image, int, int, float]] = Fields.attr(factory=dict)
+    line_height: int = Fields.attr()
+    lock: threading.Lock = Fields.attr(factory=threading.Lock)
+
+    @font.default
+    def _font(self):
+        return ImageFont.truetype(self.path, self.size)
+
+    @line_height.default
+    def _line_height(self):
+        ascent, descent = self.font.getmetrics()
+        return math.ceil((ascent + descent) * 1.15)
+
+    def __attrs_post_init__(self):
+        for char in string.printable.strip() + " ":
+            self.glyph(char)
+
+    def glyph(self, char: str) -> tuple[Image.Image, int, int, float]:
+        """
+        Get a character's glyph: its mask, the offset at which to draw the mask, and the character's advance width.
+        """
+        if (glyph := self.glyphs.get(char)) is None:
+            with self.lock:
+                if (glyph := self.glyphs.get(char)) is None:
+                    left, top, right, bottom = self.font.getbbox(char)
+                    mask = Image.new("L", (max(right - left, 1), max(bottom - top, 1)))
+                    ImageDraw.Draw(mask).text(
+                        (-left, -top), char, font=self.font, fill=255
+                    )
+                    glyph = (mask, left, top, self.font.getlength(char))
+                    self.glyphs[char] = glyph
+
+        return glyph
+
+    def measure(self, text: str) -> float:
+        return sum(self.glyph(char)[3] for char in text)
+
+    def draw(
+        self, canvas: Image.Image, xy: tuple[float, float], text: str, fill: Any = 255
+    ) -> float:
+        """
+        Draw text onto a canvas, returning the x coordinate at which it ends.
+        """
+        x, y = xy
+
+        for char in text:
+            mask, left, top, advance = self.glyph(char)
+
+            if not char.isspace():
+                canvas.paste(fill, (round(x) + left, round(y) + top), mask)
+
+            x += advance
+
+        return x
+
+
+class CAHRenderer:
+    """
+    Renders candidate cards as black cards, with the white cards played into them in bold, and combines them into a
+    single gallery image.
+
+    Text is drawn glyph by glyph from :class:`CAHGlyphAtlas` instances, one per weight and size, so no glyph is ever
+    rasterized twice. Each card's rendering is cached by the hash of its text, so a card with the same black card and
+    white cards as one already rendered — in any game — isn't rendered again. The ``cache_size`` most recently used
+    cards are kept.
+
+    Rendering happens in worker threads, up to ``render_limit`` galleries at a time; if that many are already being
+    rendered, :meth:`render` returns None so that callers can fall back to text. Only the card cache and the creation
+    of each atlas are guarded by ``lock``, so galleries are laid out and drawn in parallel.
+    """
+
+    CARD_SIZE: ClassVar[int] = 300
+    MARGIN: ClassVar[int] = 20
+    GUTTER: ClassVar[int] = 16
+    COLUMNS: ClassVar[int] = 4
+    FONT_SIZES: ClassVar[tuple[int, ...]] = (24, 20, 17, 14, 12)
+
+    BACKGROUND: ClassVar[tuple[int, int, int]] = (49, 51, 56)
+    CARD: ClassVar[tuple[int, int, int]] = (0, 0, 0)
+    TEXT: ClassVar[tuple[int, int, int]] = (255, 255, 255)
+
+    cache_size: ClassVar[int] = 256
+    render_limit: ClassVar[int] = 4
+
+    atlases: ClassVar[dict[tuple[bool, int], CAHGlyphAtlas]] = {}
+    cards: ClassVar[OrderedDict[str, Image.Image]] = OrderedDict()
+    lock: ClassVar[threading.Lock] = threading.Lock()
+    in_flight: ClassVar[int] = 0
+
+    @staticmethod
+    def font_path(bold: bool) -> Path:
+        # reportlab, which 3515.games already depends on, ships with Bitstream Vera
+        return (
+            Path(reportlab.__file__).parent
+            / "fonts"
+            / ("VeraBd.ttf" if bold else "Vera.ttf")
+        )
+
+    @classmethod
+    def atlas(cls, bold: bool, size: int) -> CAHGlyphAtlas:
+        if (atlas := cls.atlases.get((bold, size))) is None:
+            with cls.lock:
+                if (atlas := cls.atlases.get((bold, size))) is None:
+                    atlas = CAHGlyphAtlas(cls.font_path(bold), size)
+                    cls.atlases[bold, size] = atlas
+
+        return atlas
+
+    @classmethod
+    def overloaded(cls) -> bool:
+        return cls.in_flight >= cls.render_limit
+
+    @classmethod
+    async def render(cls, texts: list[str]) -> bytes | None:
+        """
+        Render a gallery of candidate cards to PNG.
+
+        Parameters
+        ----------
+        texts : list[str]
+            The cards' text, as produced by :meth:`cah.CAHBlackCard.fill`.
+
+        Returns
+        -------
+        bytes | None
+            The rendered PNG, or None if the renderer is too busy.
+        """
+        if cls.overloaded():
+            return None
+
+        cls.in_flight += 1
+
+        try:
+            return await asyncio.to_thread(cls.render_gallery, texts)
+        finally:
+            cls.in_flight -= 1
+
+    @classmethod
+    def render_gallery(cls, texts: list[str]) -> bytes:
+        columns = min(cls.COLUMNS, len(texts))
+        rows = math.ceil(len(texts) / columns)
+        step = cls.CARD_SIZE + cls.GUTTER
+
+        gallery = Image.new(
+            "RGB",
+            (columns * step + cls.GUTTER, rows * step + cls.GUTTER),
+            cls.BACKGROUND,
+        )
+
+        shape = Image.new("L", (cls.CARD_SIZE, cls.CARD_SIZE))
+        ImageDraw.Draw(shape).rounded_rectangle(
+            (0, 0, cls.CARD_SIZE - 1, cls.CARD_SIZE - 1), radius=16, fill=255
+        )
+
+        for i, text in enumerate(texts):
+            row, column = divmod(i, columns)
+            x, y = cls.GUTTER + column * step, cls.GUTTER + row * step
+
+            gallery.paste(cls.CARD, (x, y), shape)
+            gallery.paste(cls.TEXT, (x, y), cls.render_card(text))
+
+            label = cls.atlas(True, cls.FONT_SIZES[-1])
+            label.draw(
+                gallery,
+                (x + cls.MARGIN, y + cls.CARD_SIZE - cls.MARGIN - label.line_height),
+                f"#{i + 1}",
+                fill=cls.TEXT,
+            )
+
+        buffer = io.BytesIO()
+        gallery.save(buffer, format="PNG")
+
+        return buffer.getvalue()
+
+    @classmethod
+    def render_card(cls, text: str) -> Image.Image:
+        """
+        Render a card's text as a mask.
+        """
+        key = hashlib.sha256(text.encode()).hexdigest()
+
+        with cls.lock:
+            if key in cls.cards:
+                cls.cards.move_to_end(key)
+                return cls.cards[key]
+
+        runs = cls.parse(text)
+        width = cls.CARD_SIZE - 2 * cls.MARGIN
+        height = cls.CARD_SIZE - 3 * cls.MARGIN
+
+        for size in cls.FONT_SIZES:
+            regular, bold = cls.atlas(False, size), cls.atlas(True, size)
+            lines = cls.layout(runs, regular, bold, width)
+
+            if len(lines) * regular.line_height <= height:
+                break
+        else:
+            lines = lines[: height // regular.line_height]
+
+        card = Image.new("L", (cls.CARD_SIZE, cls.CARD_SIZE))
+        y = cls.MARGIN
+
+        for line in lines:
+            x = cls.MARGIN
+
+            for piece, atlas in line:
+                x = atlas.draw(card, (x, y), piece)
+
+            y += regular.line_height
+
+        with cls.lock:
+            cls.cards[key] = card
+
+            while len(cls.cards) > cls.cache_size:
+                cls.cards.popitem(last=False)
+
+        return card
+
+    @staticmethod
+    def parse(text: str) -> list[tuple[str, bool]]:
+        """
+        Split a card's Markdown into runs of regular and bold text, unescaping it along the way.
+        """
+        return [
+            (re.sub(r"\\([^\sA-Za-z0-9])", r"\1", run), bool(i % 2))
+            for i, run in enumerate(re.split(r"(?<!\\)\*\*", text))
+            if run
+        ]
+
+    @staticmethod
+    def layout(
+        runs: list[tuple[str, bool]],
+        regular: CAHGlyphAtlas,
+        bold: CAHGlyphAtlas,
+        width: float,
+    ) -> list[list[tuple[str, CAHGlyphAtlas]]]:
+        """
+        Wrap runs of text into lines no wider than ``width``. Lines are only broken at whitespace, unless a single word
+        is too wide for a line of its own.
+        """
+        # a word may span several runs (e.g. a bold white card followed by regular punctuation), so words are built up
+        # from the pieces of each run until whitespace is reached. line breaks are kept as Nones.
+        words: list[list[tuple[str, CAHGlyphAtlas]] | None] = [[]]
+
+        for run, is_bold in runs:
+            atlas = bold if is_bold else regular
+
+            for piece in re.findall(r"\s+|\S+", run):
+                if piece.isspace():
+                    words.extend([None] * piece.count("\n"))
+                    words.append([])
+                else:
+                    words[-1].append((piece, atlas))
+
+        lines = [[]]
+        x = 0
+
+        for word in words:
+            if word is None:
+                lines.append([])
+                x = 0
+                continue
+
+            if not word:
+                continue
+
+            word_width = sum(atlas.measure(piece) for piece, atlas in word)
+            space = regular.measure(" ") if lines[-1] else 0
+
+            if lines[-1] and x + space + word_width > width:
+                lines.append([])
+                x, space = 0, 0
+
+            if space:
+                lines[-1].append((" ", regular))
+                x += space
+
+            if x + word_width <= width:
+                lines[-1].extend(word)
+                x += word_width
+                continue
+
+            # the word is too wide for a line of its own, so it's broken wherever it runs out of room
+            for piece, atlas in word:
+                for char in piece:
+                    advance = atlas.measure(char)
+
+                    if x + advance > width and lines[-1]:
+                        lines.append([])
+                        x = 0
+
+                    lines[-1].append((char, atlas))
+                    x += advance
+
+        return lines
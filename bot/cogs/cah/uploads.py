@@ -0,0 +1,342 @@
+########################################################################################################################
+#                         Copyright (C) 2023-present celsius narhwal <hello@celsiusnarhwal.dev>                        #
+#  This notice may not be altered or removed except by or with the express written permission of the copyright holder. #
+#                                      For more information, see the COPYING file.                                     #
+########################################################################################################################
+
+"""
+Game Hosts can play Cards Against Humanity with their own cards by attaching a CSV or JSON file to
+``/cah create``.
+
+CSV files have one card per row. The first column is the card's color (``black`` or ``white``), the second is its
+text, and the third, which is optional and only applies to black cards, is the number of white cards it asks for. An
+optional header row is ignored. JSON files are laid out like REST Against Humanity's ``/v2/cards`` endpoint:
+``{"black": [{"text": ..., "pick": ...}, ...], "white": [{"text": ...}, ...]}``, where any card may also just be a
+string.
+
+Blanks on black cards are written as underscores. A black card without a pick count asks for as many white cards as
+it has blanks.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import codecs
+import contextlib
+import csv
+import hashlib
+import re
+from collections import OrderedDict
+
+import discord
+import orjson
+from attrs import define
+from elysia import Fields
+from path import Path
+
+import support
+from cogs.cah.corpus import CAHPack
+from cogs.cah.models.cards import CAHPacks
+from keyboard import *
+
+__all__ = ["CAHDeckReader", "CAHUploads"]
+
+
+@define
+class CAHDeckReader:
+    """
+    A parser for uploaded decks that's fed the file a chunk at a time.
+
+    CSV files are parsed row by row as their chunks arrive, so a file that breaks a limit is rejected as soon as it
+    does. JSON can't be parsed until the whole file has arrived, but the file can't be bigger than
+    :attr:`CAHUploads.MAX_BYTES`. Cards are deduplicated as they're read.
+
+    Parameters
+    ----------
+    format : str
+        The file's format: ``csv`` or ``json``.
+
+    Raises
+    ------
+    ValueError
+        From :meth:`feed` or :meth:`close`, if the file isn't a valid deck.
+    """
+
+    format: str = Fields.field(frozen=True)
+
+    black: list[tuple[str, int]] = Fields.attr(factory=list)
+    white: list[str] = Fields.attr(factory=list)
+    seen: set[tuple[str, str]] = Fields.attr(factory=set)
+
+    decoder: codecs.IncrementalDecoder = Fields.attr(
+        factory=lambda: codecs.getincrementaldecoder("utf-8-sig")()
+    )
+    buffer: str = Fields.attr(default="")
+    record: str = Fields.attr(default="")
+    rows: int = Fields.attr(default=0)
+
+    @format.validator
+    def _format(self, _, value):
+        if value not in ("csv", "json"):
+            raise ValueError("Decks must be CSV or JSON files.")
+
+    @classmethod
+    def for_file(cls, filename: str) -> Self:
+        """
+        Create a reader for a file based on its extension.
+        """
+        return cls(Path(filename).suffix.lstrip(".").casefold())
+
+    def feed(self, chunk: bytes):
+        """
+        Parse the next chunk of the file.
+        """
+        try:
+            text = self.decoder.decode(chunk)
+        except UnicodeDecodeError as e:
+            raise ValueError("Decks must be encoded in UTF-8.") from e
+
+        self.buffer += text
+
+        if self.format == "csv":
+            *lines, self.buffer = self.buffer.split("\n")
+
+            for line in lines:
+                self.read_line(line + "\n")
+
+    def close(self) -> tuple[list[tuple[str, int]], list[str]]:
+        """
+        Finish parsing the file.
+
+        Returns
+        -------
+        tuple[list[tuple[str, int]], list[str]]
+            The deck's black cards, as pairs of text and pick count, and its white cards.
+        """
+        try:
+            self.buffer += self.decoder.decode(b"", final=True)
+        except UnicodeDecodeError as e:
+            raise ValueError("Decks must be encoded in UTF-8.") from e
+
+        if self.format == "csv":
+            if self.buffer:
+                self.read_line(self.buffer)
+
+            if self.record:
+                raise ValueError(f"Row {self.rows + 1} has an unclosed quote.")
+        else:
+            self.read_json(self.buffer)
+
+        if not (self.black or self.white):
+            raise ValueError("Your deck doesn't have any cards in it.")
+
+        return self.black, self.white
+
+    def read_line(self, line: str):
+        # a quoted field may span lines, so lines are collected until their quotes balance out. quotes inside quoted
+        # fields are escaped by doubling them, which never unbalances them.
+        self.record += line
+
+        if self.record.count('"') % 2:
+            return
+
+        record, self.record = self.record, ""
+        self.rows += 1
+        row = next(csv.reader([record]), [])
+
+        if not any(cell.strip() for cell in row):
+            return
+
+        if self.rows == 1 and row[0].strip().casefold() in ("color", "type"):
+            return
+
+        if len(row) < 2:
+            raise ValueError(f"Row {self.rows} needs a color and some text.")
+
+        color, text, pick, *_ = [*row, None]
+        self.add(color.strip().casefold(), text, pick, f"Row {self.rows}")
+
+    def read_json(self, text: str):
+        try:
+            data = orjson.loads(text)
+        except orjson.JSONDecodeError as e:
+            raise ValueError(f"Your deck isn't valid JSON ({e}).") from e
+
+        if not isinstance(data, dict):
+            raise ValueError('JSON decks must have "black" and/or "white" lists.')
+
+        for color in ("black", "white"):
+            cards = data.get(color, [])
+
+            if not isinstance(cards, list):
+                raise ValueError(f'"{color}" must be a list of cards.')
+
+            for i, card in enumerate(cards, 1):
+                where = f"{color.capitalize()} card {i}"
+
+                if isinstance(card, str):
+                    self.add(color, card, None, where)
+                elif isinstance(card, dict) and isinstance(card.get("text"), str):
+                    self.add(color, card["text"], card.get("pick"), where)
+                else:
+                    raise ValueError(f"{where} needs some text.")
+
+    def add(self, color: str, text: str, pick: Any, where: str):
+        text = " ".join(text.split())
+
+        if not text:
+            raise ValueError(f"{where} doesn't have any text.")
+
+        if color == "black":
+            text = re.sub(r"_+", "_", text)
+            pick = self.parse_pick(pick, text, where)
+
+            if len(text) > CAHUploads.MAX_BLACK_LENGTH:
+                raise ValueError(
+                    f"{where} is too long. Black cards can be at most {CAHUploads.MAX_BLACK_LENGTH} characters long."
+                )
+        elif color == "white":
+            if not text.rstrip(CAHPack.PUNCTUATION):
+                raise ValueError(f"{where} doesn't have any text besides punctuation.")
+
+            # white cards may gain a trailing period when they're normalized, which has to fit too
+            if len(text) >= CAHPack.MAX_WHITE_LENGTH:
+                raise ValueError(
+                    f"{where} is too long. White cards can be at most {CAHPack.MAX_WHITE_LENGTH - 1} characters "
+                    f"long."
+                )
+        else:
+            raise ValueError(f'{where} needs to be either "black" or "white".')
+
+        key = (color, text.casefold())
+
+        if key in self.seen:
+            return
+
+        if len(self.seen) >= CAHUploads.MAX_CARDS:
+            raise ValueError(
+                f"Your deck has too many cards. Decks can have at most {CAHUploads.MAX_CARDS} cards."
+            )
+
+        self.seen.add(key)
+
+        if color == "black":
+            self.black.append((text, pick))
+        else:
+            self.white.append(text)
+
+    @staticmethod
+    def parse_pick(pick: Any, text: str, where: str) -> int:
+        if pick is None or (isinstance(pick, str) and not pick.strip()):
+            pick = text.count("_") or 1
+
+        try:
+            pick = int(pick)
+        except (TypeError, ValueError):
+            raise ValueError(f"{where}'s pick count isn't a number.") from None
+
+        if not 1 <= pick <= CAHUploads.MAX_PICK:
+            raise ValueError(
+                f"{where} asks for {pick} white cards. Black cards can ask for between 1 and {CAHUploads.MAX_PICK}."
+            )
+
+        return pick
+
+
+class CAHUploads:
+    """
+    Decks uploaded by Game Hosts.
+
+    Uploads are streamed from Discord in chunks and parsed as they arrive (see :class:`CAHDeckReader`), with limits
+    on the size of the file, the number of cards in it, and the length of each card. Once parsed, a deck is
+    normalized and tagged just like a built-in pack (see :class:`cah.CAHPacks`).
+
+    Parsed decks are cached by the SHA-256 hash of their file's contents, so uploading the same file again — in the
+    same game or another one — skips normalizing and tagging it. The ``cache_size`` most recently used decks are kept.
+    """
+
+    MAX_BYTES: ClassVar[int] = 256 * 1024
+    MAX_CARDS: ClassVar[int] = 2000
+    MAX_BLACK_LENGTH: ClassVar[int] = 250
+    MAX_PICK: ClassVar[int] = 3
+    CHUNK_SIZE: ClassVar[int] = 16 * 1024
+
+    # a deck that isn't played with any built-in packs has to have at least this many cards of each color
+    MIN_BLACK: ClassVar[int] = 1
+    MIN_WHITE: ClassVar[int] = 10
+
+    cache_size: ClassVar[int] = 32
+    decks: ClassVar[OrderedDict[str, CAHPack]] = OrderedDict()
+
+    @classmethod
+    async def load(
+        cls, attachment: discord.Attachment, standalone: bool = False
+    ) -> CAHPack:
+        """
+        Download, parse, and normalize an uploaded deck.
+
+        Parameters
+        ----------
+        attachment : discord.Attachment
+            The deck's file.
+        standalone : bool, default=False
+            Whether the deck is going to be played without any built-in packs.
+
+        Raises
+        ------
+        ValueError
+            If the file isn't a valid deck. The exception's message explains why and can be shown to the Game Host.
+        ConnectionError
+            If the file couldn't be downloaded.
+        """
+        if attachment.size > cls.MAX_BYTES:
+            raise ValueError(
+                f"Your deck is too big. Decks can be at most {cls.MAX_BYTES // 1024} KB."
+            )
+
+        reader = CAHDeckReader.for_file(attachment.filename)
+        digest = hashlib.sha256()
+        size = 0
+
+        # closing the stream ourselves releases the download as soon as the deck is rejected
+        async with contextlib.aclosing(
+            support.HTTPClient.stream(attachment.url, chunk_size=cls.CHUNK_SIZE)
+        ) as chunks:
+            async for chunk in chunks:
+                size += len(chunk)
+
+                if size > cls.MAX_BYTES:
+                    raise ValueError(
+                        f"Your deck is too big. Decks can be at most {cls.MAX_BYTES // 1024} KB."
+                    )
+
+                digest.update(chunk)
+                reader.feed(chunk)
+
+        black, white = reader.close()
+        key = digest.hexdigest()
+
+        deck = cls.decks.get(key) or CAHPack.from_columns(
+            [text for text, _ in black], [pick for _, pick in black], white
+        )
+
+        if len(deck.white_proper) != len(deck.white_text) and await support.Tagger.wait(
+            CAHPacks.tagger_timeout
+        ):
+            deck = await asyncio.to_thread(CAHPacks.tag, deck)
+
+        cls.decks[key] = deck
+        cls.decks.move_to_end(key)
+
+        while len(cls.decks) > cls.cache_size:
+            cls.decks.popitem(last=False)
+
+        if standalone and (
+            len(deck.black_text) < cls.MIN_BLACK or len(deck.white_text) < cls.MIN_WHITE
+        ):
+            raise ValueError(
+                f"Your deck needs at least {cls.MIN_BLACK} black card and {cls.MIN_WHITE} white cards to be played "
+                f"on its own. Add some more cards or pick some packs to play it with."
+            )
+
+        return deck
@@ -62,24 +62,54 @@ class CAHPackSelectView(View):
             lambda x: isinstance(x, Select), self.children
         )
 
+        await self.create_deck(
+            *(pack_menu.values or ["CAH Base Set"]), interaction=interaction
+        )
+
+    async def create_deck(
+        self,
+        *packs: str,
+        interaction: Interaction,
+        upload: discord.Attachment = None,
+    ):
         await interaction.edit_original_response(
             content="Creating your Cards Against Humanity game...",
             embed=None,
             view=None,
         )
 
-        packs = pack_menu.values or ["CAH Base Set"]
+        try:
+            custom = (
+                await cah.CAHUploads.load(upload, standalone=not packs)
+                if upload
+                else None
+            )
+        except (ValueError, ConnectionError) as e:
+            if isinstance(e, ValueError):
+                title = "I can't use your cards."
+                msg = f"{e}\n\nFix your deck and try again."
+            else:
+                title = "Something went wrong."
+                msg = "I couldn't download your deck. Please try again."
+
+            embed = discord.Embed(
+                title=title, description=msg, color=support.Color.error()
+            )
+            await interaction.edit_original_response(
+                content=None, embed=embed, view=None
+            )
+
+            return
 
         try:
-            self.cardset = await cah.CAHDeck.new(*packs)
+            self.cardset = await cah.CAHDeck.new(*packs, upload=custom)
         except ConnectionError:
-            rah_repo = support.mona().get_repo("rest-against-humanity")
             msg = (
-                f"I couldn't communicate with [REST Against Humanity]({rah_repo.homepage}), "
-                f"my source for CAH card data. Please try again.\n"
-                f"\n"
-                f"If the problem persists, open an issue on [REST Against Humanity's GitHub page]"
-                f"({rah_repo.html_url}/issues/new)."
+                "I couldn't communicate with [REST Against Humanity](https://restagainsthumanity.com), "
+                "my source for CAH card data. Please try again.\n"
+                "\n"
+                "If the problem persists, open an issue on [REST Against Humanity's GitHub page]"
+                "(https://github.com/celsiusnarhwal/rest-against-humanity/issues/new)."
             )
             embed = discord.Embed(
                 title="Something went wrong.",
@@ -94,9 +124,16 @@ class CAHPackSelectView(View):
         else:
             self.stop()
 
-    async def get_packs(self) -> cah.CAHDeck | None:
-        with support.Assets.cah():
-            packs = open("packs.txt").read().splitlines()
+    async def get_packs(
+        self, packs: list[str] = None, upload: discord.Attachment = None
+    ) -> cah.CAHDeck | None:
+        if packs or upload:
+            await self.create_deck(
+                *(packs or []), interaction=self.ctx.interaction, upload=upload
+            )
+            self.stop()
+
+            return self.cardset
 
         pack_menu = Select(
             placeholder="Pick some packs",
@@ -105,10 +142,8 @@ class CAHPackSelectView(View):
             row=0,
         )
 
-        pack_menu.add_option(label="CAH Base Set", value="CAH Base Set", default=True)
-
-        for pack in packs:
-            pack_menu.add_option(label=pack, value=pack)
+        for pack in cah.CAHPackIndex.bundled().names[:25]:
+            pack_menu.add_option(label=pack, value=pack, default=pack == "CAH Base Set")
 
         self.add_item(pack_menu)
 
@@ -119,7 +154,8 @@ class CAHPackSelectView(View):
         )
 
         embed.set_footer(
-            text="I'll default to the CAH Base Set if you leave this empty."
+            text="I'll default to the CAH Base Set if you leave this empty. You can play with packs that aren't listed "
+            "here by using the packs option of /cah create."
         )
 
         embed.set_author(
@@ -143,8 +179,10 @@ class CAHCardSelectView(CAHTerminableView):
         self.player = player
         self.game = player.game
         self.cards = player.hand
-        self.candidates: list[cah.CAHCandidateCard] = []
-        self.submission: cah.CAHCandidateCard = None
+        # the positions of the chosen cards in the player's hand, and the texts they can be played as
+        self.chosen: list[int] = []
+        self.candidates: list[str] = []
+        self.order: int = None
 
     async def interaction_check(self, interaction: Interaction) -> bool:
         menu: Select = discord.utils.find(
@@ -152,8 +190,8 @@ class CAHCardSelectView(CAHTerminableView):
         )
 
         if not self.candidates:
-            chosen_cards = [card for card in self.cards if card.uuid in menu.values]
-            self.candidates = cah.CAHCandidateCard.create(self.player, *chosen_cards)
+            self.chosen = sorted(int(value) for value in menu.values)
+            self.candidates = self.game.engine.candidates(self.player, self.chosen)
 
             if len(self.candidates) == 2:
                 self.clear_items()
@@ -175,16 +213,14 @@ class CAHCardSelectView(CAHTerminableView):
                     icon_url=self.ctx.me.display_avatar.url,
                 )
                 for i, option in enumerate(self.candidates):
-                    embed.add_field(
-                        name=f"Option {i + 1}", value=option.text, inline=False
-                    )
+                    embed.add_field(name=f"Option {i + 1}", value=option, inline=False)
 
                 await interaction.response.defer()
                 await self.ctx.interaction.edit_original_response(
                     embed=embed, view=self
                 )
             else:
-                self.submission = self.candidates[0]
+                self.order = 0
                 await self.finish()
 
         return await super().interaction_check(interaction)
@@ -197,17 +233,17 @@ class CAHCardSelectView(CAHTerminableView):
             max_values=self.game.black_card.pick,
         )
 
-        for card in self.cards:
-            menu.add_option(label=card.text, value=card.uuid)
+        for i, card in enumerate(self.cards):
+            menu.add_option(label=card.text, value=str(i))
 
         return menu
 
     async def order_option_1_callback(self, _: Interaction):
-        self.submission = self.candidates[0]
+        self.order = 0
         await self.finish()
 
     async def order_option_2_callback(self, _: Interaction):
-        self.submission = self.candidates[1]
+        self.order = 1
         await self.finish()
 
     async def finish(self):
@@ -218,7 +254,7 @@ class CAHCardSelectView(CAHTerminableView):
         )
 
         embed.add_field(
-            name="Your Submission", value=self.submission.text, inline=False
+            name="Your Submission", value=self.candidates[self.order], inline=False
         )
 
         embed.set_author(
@@ -250,7 +286,8 @@ class CAHCardSelectView(CAHTerminableView):
 
         await self.wait()
 
-        return self.submission
+        if self.order is not None:
+            return self.chosen, self.order
 
 
 class CAHVotingView(CAHTerminableView):
@@ -261,16 +298,15 @@ class CAHVotingView(CAHTerminableView):
     def __init__(self, game: cah.CAHGame, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.game = game
-        self.selection: cah.CAHCandidateCard = None
+        self.submissions = list(game.engine.submissions.values())
+        self.selection: cah.CAHSubmission = None
 
     async def interaction_check(self, interaction: Interaction) -> bool:
         menu: Select = discord.utils.find(
             lambda x: isinstance(x, Select), self.children
         )
 
-        self.selection = discord.utils.find(
-            lambda c: c.uuid == menu.values[0], self.game.candidates
-        )
+        self.selection = self.submissions[int(menu.values[0])]
 
         self.stop()
 
@@ -298,12 +334,14 @@ class CAHVotingView(CAHTerminableView):
         )
         embed.add_field(name="Black Card", value=self.game.black_card.text)
 
-        for i, candidate in enumerate(
-            [c for c in self.game.candidates if c.player.user != self.ctx.user]
-        ):
-            menu.add_option(label=f"Submission {i + 1}", value=candidate.uuid)
+        # submissions are numbered as they are in the gallery, even if the voter's own is left out
+        for i, submission in enumerate(self.submissions):
+            if submission.player.user == self.ctx.user:
+                continue
+
+            menu.add_option(label=f"Submission {i + 1}", value=str(i))
             embed.add_field(
-                name=f"Submission {i + 1}", value=candidate.text, inline=False
+                name=f"Submission {i + 1}", value=submission.text, inline=False
             )
 
         self.add_item(menu)
@@ -312,6 +350,9 @@ class CAHVotingView(CAHTerminableView):
 
         await self.wait()
 
+        if not self.selection:
+            return None
+
         embed = discord.Embed(
             title="Your Vote",
             description=self.selection.text,
@@ -22,7 +22,7 @@ import clockworks
 import shrine
 import support
 from cogs import uno
-from support import BasePlayer, Gender, Pronoun
+from support import Gender, Pronoun, PronounResolver
 from support.views import View
 
 inflect = ifl.engine()
@@ -304,7 +304,7 @@ class PronounsView(View):
         )
 
     async def present(self, ctx: discord.ApplicationContext):
-        player = BasePlayer(user=ctx.user)
+        genders = await PronounResolver.resolve(ctx.user.id)
 
         msg = (
             "You can choose the pronouns I use to refer to you by creating a [PronounDB](https://pronoundb.org) "
@@ -320,7 +320,7 @@ class PronounsView(View):
         pronouns = inflect.join(
             [
                 f"{they.transform(g)}/{(them.transform(g) if g is not Gender.NEUTER else their.transform(g))}"
-                for g in player.genders
+                for g in genders
             ]
         )
 
@@ -9,4 +9,5 @@
 
 from cogs.shogi.helpers import *
 from cogs.shogi.models import *
+from cogs.shogi.puzzles import *
 from cogs.shogi.views import *
@@ -6,13 +6,14 @@
 
 import discord
 from discord import Option
-from discord.ext import commands
+from discord.ext import commands, tasks
 
 import shrine
 import support
 from bot import bot
 from cogs import shogi
 from cogs.base import Cog
+from shrine.kami import posessive
 from support import SlashCommandGroup
 
 
@@ -23,6 +24,9 @@ class ChessCog(Cog):
     """
 
     chess_group = SlashCommandGroup("chess", "Commands for playing chess.")
+    simul_group = chess_group.create_subgroup(
+        "simul", "Commands for simultaneous exhibitions."
+    )
 
     @chess_group.command()
     @support.not_in_maintenance()
@@ -38,12 +42,30 @@ class ChessCog(Cog):
             choices=["Enabled", "Disabled"],
             default="Enabled",
         ),
+        pace: Option(
+            str,
+            "Choose whether to play live or by correspondence, with days to make each move. Defaults to Live.",
+            choices=["Live", "Correspondence"],
+            default="Live",
+        ),
+        board: Option(
+            str,
+            "Choose whether to display the board as an image or as text. Defaults to Image.",
+            choices=["Image", "Text"],
+            default="Image",
+        ),
     ):
         """
         Challenge someone to a game of chess.
         """
 
         saving = True if saving == "Enabled" else False
+        text_board = board == "Text"
+        game_class = (
+            shogi.ChessCorrespondenceGame
+            if pace == "Correspondence"
+            else shogi.ChessGame
+        )
 
         if ctx.user == opponent:
             msg = "You can't play with yourself. Choose someone else to challenge."
@@ -77,6 +99,8 @@ class ChessCog(Cog):
 
         elif shogi.ChessGame.retrieve_duplicate_game(
             players=[ctx.user, opponent], guild=ctx.guild
+        ) or await shogi.ChessCorrespondenceGame.hydrate_duplicate_game(
+            players=[ctx.user, opponent], guild=ctx.guild
         ):
             chess_game = shogi.ChessGame.retrieve_duplicate_game(
                 players=[ctx.user, opponent], guild=ctx.guild
@@ -144,18 +168,17 @@ class ChessCog(Cog):
             game_thread = await ctx.channel.create_thread(
                 name=f"Chess - {ctx.user.name} vs. {opponent.name}",
                 type=discord.ChannelType.public_thread,
-                auto_archive_duration=1440,
+                auto_archive_duration=10080 if pace == "Correspondence" else 1440,
             )
 
-            chess_game = shogi.ChessGame(
+            chess_game = game_class(
                 guild=ctx.guild,
                 thread=game_thread,
                 players=[ctx.user, opponent],
                 saving_enabled=saving,
+                text_board=text_board,
             )
 
-            await chess_game.open_lobby()
-
             await game_thread.add_user(ctx.user)
             await game_thread.add_user(opponent)
 
@@ -171,7 +194,11 @@ class ChessCog(Cog):
                 embed=embed, view=support.GameThreadURLView(thread=chess_game.thread)
             )
 
-            await chess_game.game_timer()
+            await chess_game.open_lobby()
+
+            # correspondence games have per-move deadlines instead of an overall time limit
+            if pace == "Live":
+                await chess_game.game_timer()
 
     @chess_group.command()
     @shogi.verify_context(level="player")
@@ -256,6 +283,16 @@ class ChessCog(Cog):
 
         await player.view_board(ctx)
 
+    @chess_group.command()
+    @shogi.verify_context(level="chess_thread")
+    async def spectate(self, ctx: discord.ApplicationContext):
+        """
+        Watch a live view of the board.
+        """
+        chess_game: shogi.ChessGame = shogi.ChessGame.retrieve_game(ctx.channel.id)
+
+        await chess_game.spectators.subscribe(ctx)
+
     @chess_group.command()
     @shogi.verify_context(level="player")
     async def forfeit(self, ctx: discord.ApplicationContext):
@@ -376,6 +413,41 @@ class ChessCog(Cog):
                 await ctx.respond(content="Rescinding your proposal...", ephemeral=True)
                 await player.rescind_draw()
 
+    @chess_group.command()
+    async def puzzle(
+        self,
+        ctx: discord.ApplicationContext,
+        difficulty: Option(
+            str,
+            "Choose how difficult the puzzle should be. Defaults to Intermediate.",
+            choices=["Beginner", "Intermediate", "Advanced", "Expert"],
+            default="Intermediate",
+        ),
+        theme: Option(
+            str,
+            "Choose a theme for the puzzle.",
+            autocomplete=shogi.puzzle_theme_autocomplete,
+            required=False,
+        ),
+    ):
+        """
+        Solve a chess puzzle.
+        """
+        band = ["Beginner", "Intermediate", "Advanced", "Expert"].index(difficulty)
+        puzzle = shogi.ChessPuzzleIndex.bundled().random(band=band, theme=theme)
+
+        if not puzzle:
+            msg = "I don't have any puzzles like that. Try a different difficulty or theme."
+            embed = discord.Embed(
+                title="No puzzles found.",
+                description=msg,
+                color=support.Color.error(),
+            )
+            await ctx.respond(embed=embed, ephemeral=True)
+        else:
+            view = shogi.ChessPuzzleView(ctx=ctx, puzzle=puzzle, band=band, theme=theme)
+            await view.present()
+
     @chess_group.command()
     async def replay(self, ctx: discord.ApplicationContext):
         """
@@ -384,11 +456,285 @@ class ChessCog(Cog):
         view = shogi.ChessReplayMenuView(ctx=ctx)
         await view.initiate_view()
 
+    # simul commands
+
+    @simul_group.command(name="create")
+    @support.not_in_maintenance()
+    @support.bot_has_permissions(support.GamePermissions.chess())
+    @support.invoked_in_text_channel()
+    @shogi.ChessSimul.verify_unique_host()
+    async def create_simul(self, ctx: discord.ApplicationContext):
+        """
+        Host a simul, playing up to 10 opponents at once.
+        """
+        await ctx.respond("Creating your simul...", ephemeral=True)
+
+        game_thread = await ctx.channel.create_thread(
+            name=f"Simul with {ctx.user.name} - check pins to play!",
+            type=discord.ChannelType.public_thread,
+            auto_archive_duration=1440,
+        )
+
+        simul = shogi.ChessSimul(guild=ctx.guild, thread=game_thread, host=ctx.user)
+
+        await simul.open_lobby()
+        await game_thread.add_user(ctx.user)
+
+        embed = discord.Embed(
+            title="A chess simul has been created!",
+            description=f"{ctx.user.mention} will play up to {simul.max_boards} opponents at once. "
+            f"You can take a board by using `/chess simul join` in the game thread.",
+            color=support.Color.mint(),
+        )
+
+        await ctx.send(embed=embed, view=support.GameThreadURLView(thread=game_thread))
+
+        await simul.game_timer()
+
+    @simul_group.command(name="join")
+    @shogi.verify_simul_context(level="simul_thread")
+    async def join_simul(self, ctx: discord.ApplicationContext):
+        """
+        Take a board in a simul.
+        """
+        simul: shogi.ChessSimul = shogi.ChessSimul.retrieve_game(ctx.channel.id)
+
+        if ctx.user == simul.host:
+            msg = "You're hosting this simul, so you're already playing on every board."
+            embed = discord.Embed(
+                title="You're the host.", description=msg, color=support.Color.error()
+            )
+            await ctx.respond(embed=embed, ephemeral=True)
+        elif simul.retrieve_player(ctx.user):
+            msg = "You've already taken a board in this simul."
+            embed = discord.Embed(
+                title="You're already playing.",
+                description=msg,
+                color=support.Color.error(),
+            )
+            await ctx.respond(embed=embed, ephemeral=True)
+        elif not simul.is_joinable:
+            msg = "This simul has already started. You can't join it now."
+            embed = discord.Embed(
+                title="This simul has started.",
+                description=msg,
+                color=support.Color.error(),
+            )
+            await ctx.respond(embed=embed, ephemeral=True)
+        elif len(simul.players) >= simul.max_boards:
+            msg = f"This simul already has {simul.max_boards} opponents. You can't join it."
+            embed = discord.Embed(
+                title="This simul is full.",
+                description=msg,
+                color=support.Color.error(),
+            )
+            await ctx.respond(embed=embed, ephemeral=True)
+        else:
+            await simul.add_player(ctx, ctx.user)
+
+    @simul_group.command(name="start")
+    @shogi.verify_simul_context(level="simul_thread", verify_host=True)
+    async def start_simul(self, ctx: discord.ApplicationContext):
+        """
+        Start your simul.
+        """
+        simul: shogi.ChessSimul = shogi.ChessSimul.retrieve_game(ctx.channel.id)
+
+        if simul.has_started:
+            msg = "This simul is already underway."
+            embed = discord.Embed(
+                title="This simul has started.",
+                description=msg,
+                color=support.Color.error(),
+            )
+            await ctx.respond(embed=embed, ephemeral=True)
+        elif len(simul.players) < simul.min_players:
+            msg = "You need at least one opponent before you can start the simul."
+            embed = discord.Embed(
+                title="Nobody's here yet.",
+                description=msg,
+                color=support.Color.error(),
+            )
+            await ctx.respond(embed=embed, ephemeral=True)
+        else:
+            await ctx.respond("Starting the simul...", ephemeral=True)
+            await simul.start_game()
+
+    @simul_group.command(name="move")
+    @shogi.verify_simul_context(level="game")
+    async def simul_move(
+        self,
+        ctx: discord.ApplicationContext,
+        notation: Option(
+            str,
+            name="move",
+            description="Specify a move using algebraic or UCI notation.",
+        ),
+        number: Option(
+            int,
+            name="board",
+            description="Choose the board to move on. Only the host needs to specify this.",
+            min_value=1,
+            max_value=10,
+            required=False,
+        ),
+    ):
+        """
+        Make a move in a simul.
+        """
+        simul: shogi.ChessSimul = shogi.ChessSimul.retrieve_game(ctx.channel.id)
+
+        if ctx.user == simul.host:
+            board = simul.retrieve_board(number) if number else None
+        else:
+            board = simul.retrieve_player(ctx.user).game
+
+        if not board:
+            msg = "Choose one of this simul's boards with the `board` option."
+            embed = discord.Embed(
+                title="Which board?", description=msg, color=support.Color.error()
+            )
+            await ctx.respond(embed=embed, ephemeral=True)
+        elif board.result:
+            msg = f"The game on board {board.number} is over."
+            embed = discord.Embed(
+                title="That board is finished.",
+                description=msg,
+                color=support.Color.error(),
+            )
+            await ctx.respond(embed=embed, ephemeral=True)
+        elif board.current_player.user != ctx.user:
+            msg = f"It's not your move on board {board.number}. Wait your turn, then try again."
+            embed = discord.Embed(
+                title="It's not your turn.",
+                description=msg,
+                color=support.Color.error(),
+            )
+            await ctx.respond(embed=embed, ephemeral=True)
+        elif ctx.user == simul.host and board.number not in simul.pending_boards:
+            if simul.pending_boards:
+                msg = (
+                    f"Board {board.number} will be part of the next round. Finish your moves on the "
+                    f"other boards first."
+                )
+            else:
+                msg = (
+                    f"Board {board.number} will be part of the next round, which starts once every opponent "
+                    f"has moved or <t:{int(simul.round_deadline)}:R>, whichever comes first."
+                )
+            embed = discord.Embed(
+                title="Not yet.", description=msg, color=support.Color.error()
+            )
+            await ctx.respond(embed=embed, ephemeral=True)
+        else:
+            await board.current_player.move_with_notation(ctx, notation)
+
+    @simul_group.command(name="boards")
+    @shogi.verify_simul_context(level="simul_thread")
+    async def simul_boards(self, ctx: discord.ApplicationContext):
+        """
+        View every board in a simul at once.
+        """
+        simul: shogi.ChessSimul = shogi.ChessSimul.retrieve_game(ctx.channel.id)
+
+        if not simul.has_started:
+            msg = "There aren't any boards to show until the simul has begun."
+            embed = discord.Embed(
+                title="This simul hasn't started yet.",
+                description=msg,
+                color=support.Color.error(),
+            )
+            await ctx.respond(embed=embed, ephemeral=True)
+        else:
+            await ctx.defer(ephemeral=True)
+
+            embed = discord.Embed(
+                title=f"{posessive(simul.host.name)} Simul",
+                description=f"Round {simul.round_number}",
+                color=support.Color.mint(),
+            )
+
+            async with simul.overview_image() as overview_png:
+                embed.set_image(url=f"attachment://{overview_png.filename}")
+                await ctx.respond(embed=embed, file=overview_png, ephemeral=True)
+
+    @simul_group.command(name="resign")
+    @shogi.verify_simul_context(level="game")
+    async def simul_resign(
+        self,
+        ctx: discord.ApplicationContext,
+        number: Option(
+            int,
+            name="board",
+            description="Choose the board to resign. Only the host needs to specify this.",
+            min_value=1,
+            max_value=10,
+            required=False,
+        ),
+    ):
+        """
+        Resign a board in a simul.
+        """
+        simul: shogi.ChessSimul = shogi.ChessSimul.retrieve_game(ctx.channel.id)
+
+        if ctx.user == simul.host:
+            board = simul.retrieve_board(number) if number else None
+        else:
+            board = simul.retrieve_player(ctx.user).game
+
+        if not board or board.result:
+            msg = (
+                "Choose one of this simul's unfinished boards with the `board` option."
+            )
+            embed = discord.Embed(
+                title="Which board?", description=msg, color=support.Color.error()
+            )
+            await ctx.respond(embed=embed, ephemeral=True)
+            return
+
+        player: shogi.ChessPlayer = board.retrieve_player(ctx.user)
+
+        msg = (
+            f"Resigning will cause {player.opponent.user.mention} to be declared the winner on board "
+            f"{board.number}. This can't be undone.\n"
+            f"\n"
+            f"Resign this board?"
+        )
+
+        embed = discord.Embed(
+            title="Are you sure?", description=msg, color=support.Color.caution()
+        )
+
+        view = support.ConfirmationView(ctx=ctx)
+
+        confirmation = await view.request_confirmation(
+            prompt_embeds=[embed], ephemeral=True
+        )
+
+        if confirmation:
+            await ctx.interaction.edit_original_response(
+                content="Resigning...", view=None, embeds=[]
+            )
+            await player.forfeit()
+        else:
+            await ctx.interaction.edit_original_response(
+                content="Okay! The game is still on.", view=None, embeds=[]
+            )
+
     @commands.Cog.listener(name="on_thread_member_remove")
     async def sync_game_thread_removal(self, thread_member: discord.ThreadMember):
         chess_game: shogi.ChessGame = shogi.ChessGame.retrieve_game(
             thread_member.thread_id
         )
+
+        if not chess_game and thread_member.thread:
+            chess_game = await shogi.ChessCorrespondenceGame.hydrate(
+                thread_member.thread
+            )
+
+        if not chess_game:
+            return
+
         player: shogi.ChessPlayer = chess_game.retrieve_player(thread_member)
 
         if player:
@@ -414,13 +760,64 @@ class ChessCog(Cog):
 
         if chess_game:
             await chess_game.force_close(reason="thread_deletion")
+        else:
+            await shogi.ChessCorrespondenceGame.discard(thread.thread_id)
 
     @commands.Cog.listener(name="on_guild_channel_delete")
     async def force_close_channel_deletion(self, channel):
-        for thread in [
-            thread
-            for thread in channel.threads
-            if shogi.ChessGame.retrieve_game(thread.id)
-        ]:
-            chess_game = shogi.ChessGame.retrieve_game(thread.id)
+        for chess_game in support.GameRegistry.in_channel(
+            channel.id, game_class=shogi.ChessGame
+        ):
             await chess_game.force_close(reason="channel_deletion")
+
+        # correspondence games that aren't in memory still have to be looked up in the database
+        for thread in channel.threads:
+            if chess_game := await shogi.ChessCorrespondenceGame.hydrate(thread):
+                await chess_game.force_close(reason="channel_deletion")
+
+    @commands.Cog.listener(name="on_ready")
+    async def load_correspondence_games(self):
+        await shogi.ChessCorrespondenceGame.load_thread_ids()
+
+    @commands.Cog.listener(name="on_ready")
+    async def start_deadline_sweep(self):
+        if not self.enforce_correspondence_deadlines.is_running():
+            self.enforce_correspondence_deadlines.start()
+
+    @tasks.loop(minutes=30)
+    async def enforce_correspondence_deadlines(self):
+        await shogi.ChessCorrespondenceGame.enforce_deadlines(self.bot)
+
+    @commands.Cog.listener(name="on_ready")
+    async def rehydrate_games(self):
+        await support.GameSnapshots.rehydrate(self.bot, shogi.ChessGame)
+
+    @commands.Cog.listener(name="on_thread_member_remove")
+    async def sync_simul_thread_removal(self, thread_member: discord.ThreadMember):
+        simul: shogi.ChessSimul = shogi.ChessSimul.retrieve_game(
+            thread_member.thread_id
+        )
+
+        if not simul:
+            return
+
+        if thread_member.id == simul.host.id:
+            await simul.force_close(reason="host_left")
+        elif player_node := simul.retrieve_player(thread_member, return_node=True):
+            await simul.remove_player(player_node)
+
+    @commands.Cog.listener(name="on_raw_thread_delete")
+    async def force_close_simul_thread_deletion(
+        self, thread: discord.RawThreadDeleteEvent
+    ):
+        simul: shogi.ChessSimul = shogi.ChessSimul.retrieve_game(thread.thread_id)
+
+        if simul:
+            await simul.force_close(reason="thread_deletion")
+
+    @commands.Cog.listener(name="on_guild_channel_delete")
+    async def force_close_simul_channel_deletion(self, channel):
+        for simul in support.GameRegistry.in_channel(
+            channel.id, game_class=shogi.ChessSimul
+        ):
+            await simul.force_close(reason="channel_deletion")
@@ -6,6 +6,10 @@
 
 from __future__ import annotations
 
+import asyncio
+import io
+import math
+import re
 from contextlib import asynccontextmanager
 from tempfile import TemporaryDirectory
 
@@ -14,6 +18,7 @@ import discord
 from discord.ext import commands
 from path import Path
 from reportlab.graphics import renderPM
+from reportlab.graphics.shapes import Drawing, Group, String
 from svglib.svglib import svg2rlg
 
 import support
@@ -26,6 +31,16 @@ def verify_context(level: str):
     async def predicate(ctx: discord.ApplicationContext):
         command_name = f"`/{ctx.command.qualified_name}`"
 
+        # correspondence games only live in memory while they're being played, so this may be the interaction that
+        # brings one back
+        game = shogi.ChessGame.retrieve_game(ctx.channel.id)
+
+        if not game and isinstance(ctx.channel, discord.Thread):
+            game = await shogi.ChessCorrespondenceGame.hydrate(ctx.channel)
+
+        if isinstance(game, shogi.ChessCorrespondenceGame):
+            game.touch()
+
         async def is_chess_thread():
             if shogi.ChessGame.retrieve_game(ctx.channel.id):
                 return True
@@ -114,12 +129,361 @@ def verify_context(level: str):
     return commands.check(predicate)
 
 
+def verify_simul_context(level: str, *, verify_host: bool = False):
+    async def predicate(ctx: discord.ApplicationContext):
+        command_name = f"`/{ctx.command.qualified_name}`"
+
+        async def is_simul_thread():
+            if shogi.ChessSimul.retrieve_game(ctx.channel.id):
+                return True
+            else:
+                message = (
+                    f"You can only use {command_name} in designated chess simul threads. "
+                    f"Head to a simul thread and try again."
+                )
+                embed = discord.Embed(
+                    title="You can't do that here.",
+                    description=message,
+                    color=support.Color.error(),
+                )
+                await ctx.respond(embed=embed, ephemeral=True)
+
+                return False
+
+        async def is_player():
+            simul = shogi.ChessSimul.retrieve_game(ctx.channel.id)
+
+            if ctx.user == simul.host or simul.retrieve_player(ctx.user):
+                return True
+            else:
+                message = f"Only players in this simul can use {command_name}."
+                embed = discord.Embed(
+                    title="You're not playing in this simul.",
+                    description=message,
+                    color=support.Color.error(),
+                )
+                await ctx.respond(embed=embed, ephemeral=True)
+
+                return False
+
+        async def is_active_game():
+            simul = shogi.ChessSimul.retrieve_game(ctx.channel.id)
+
+            if simul.has_started:
+                return True
+            else:
+                message = (
+                    f"You can't use {command_name} until the simul has begun. Wait until the simul has begun, "
+                    f"then try again."
+                )
+                embed = discord.Embed(
+                    title="This simul hasn't started yet.",
+                    description=message,
+                    color=support.Color.error(),
+                )
+                await ctx.respond(embed=embed, ephemeral=True)
+
+                return False
+
+        async def is_host():
+            simul = shogi.ChessSimul.retrieve_game(ctx.channel.id)
+
+            if ctx.user == simul.host:
+                return True
+            else:
+                message = f"Only the host of this simul can use {command_name}."
+                embed = discord.Embed(
+                    title="You're not the host.",
+                    description=message,
+                    color=support.Color.error(),
+                )
+                await ctx.respond(embed=embed, ephemeral=True)
+
+                return False
+
+        checks = {
+            "simul_thread": is_simul_thread,
+            "player": is_player,
+            "game": is_active_game,
+        }
+
+        success = False
+
+        for key, check in checks.items():
+            success = await check()
+
+            if not success or key == level:
+                break
+
+        if success and verify_host:
+            success = await is_host()
+
+        return success
+
+    return commands.check(predicate)
+
+
+# formatters
+
+
+def humanize_theme(theme: str) -> str:
+    """
+    Convert a puzzle theme from its camel-cased name (e.g. "backRankMate") to something more presentable
+    (e.g. "Back rank mate").
+    """
+    return re.sub(r"(?<=[a-z])(?=[A-Z0-9])", " ", theme).capitalize()
+
+
+# autocomplete
+
+
+async def puzzle_theme_autocomplete(ctx: discord.AutocompleteContext):
+    return [
+        discord.OptionChoice(name=humanize_theme(theme), value=theme)
+        for theme in shogi.ChessPuzzleIndex.bundled().themes
+        if ctx.value.casefold() in humanize_theme(theme).casefold()
+    ][:25]
+
+
 # context managers
 
 
 @asynccontextmanager
 async def get_board_image(**kwargs) -> discord.File:
-    with (TemporaryDirectory() as tmp, Path(tmp)):
-        open("board.svg", "w+").write(chess.svg.board(**kwargs, size=1800))
-        renderPM.drawToFile(svg2rlg("board.svg"), "board.png", fmt="png")
-        yield discord.File(Path("board.png").abspath())
+    yield discord.File(io.BytesIO(await render_board(**kwargs)), filename="board.png")
+
+
+@asynccontextmanager
+async def get_board_display(
+    embed: discord.Embed = None, *, text: bool = False, image: bytes = None, **kwargs
+) -> dict:
+    """
+    Display a chess board as either an image or text.
+
+    Boards are displayed as text if ``text`` is True or if the renderer is too busy to render them as images. If an
+    embed is given, the board is attached to it; otherwise, it's displayed on its own.
+
+    Parameters
+    ----------
+    embed : discord.Embed
+        The embed to attach the board to.
+    text : bool
+        Whether to display the board as text.
+    image : bytes
+        The board, already rendered to PNG. If given, it's displayed instead of rendering the board again.
+    **kwargs
+        Keyword arguments to pass to ``chess.svg.board()`` or :func:`render_board_text`.
+
+    Yields
+    ------
+    dict
+        Keyword arguments to send (or edit) the message displaying the board with.
+    """
+    if text or (image is None and is_renderer_overloaded()):
+        board_text = render_board_text(**kwargs)
+
+        if embed:
+            embed.add_field(name="Board", value=board_text, inline=False)
+            yield {}
+        else:
+            yield {"content": board_text}
+    else:
+        image = image or await render_board(**kwargs)
+        board_png = discord.File(io.BytesIO(image), filename="board.png")
+
+        if embed:
+            embed.set_image(url=f"attachment://{board_png.filename}")
+            yield {"file": board_png}
+        else:
+            yield {"file": board_png, "content": None}
+
+
+# rendering
+
+# the number of boards that can be rasterized at once before boards are displayed as text instead
+RENDER_LIMIT = 4
+
+_renders_in_flight = 0
+
+
+def is_renderer_overloaded() -> bool:
+    return _renders_in_flight >= RENDER_LIMIT
+
+
+async def render_board(**kwargs) -> bytes:
+    """
+    Render a chess board to PNG.
+
+    The SVG is generated on the event loop so that the board can't change out from under it; rasterization, which
+    is the slow part, happens in a worker thread.
+
+    Parameters
+    ----------
+    **kwargs
+        Keyword arguments to pass to ``chess.svg.board()``.
+
+    Returns
+    -------
+    bytes
+        The rendered PNG.
+    """
+    global _renders_in_flight
+
+    svg = chess.svg.board(**kwargs, size=1800)
+    _renders_in_flight += 1
+
+    try:
+        return await asyncio.to_thread(_rasterize, svg)
+    finally:
+        _renders_in_flight -= 1
+
+
+def render_board_text(
+    board: chess.Board,
+    orientation: chess.Color = chess.WHITE,
+    lastmove: chess.Move = None,
+    squares: chess.SquareSet = None,
+    fill: dict[chess.Square, str] = None,
+    coordinates: bool = True,
+    **_,
+) -> str:
+    """
+    Render a chess board as text.
+
+    White's pieces are shown in uppercase and Black's in lowercase. Highlights are shown by bracketing squares:
+    ``(x)`` for the last move, ``[x]`` for selected squares, and ``<x>`` for marked squares (e.g. legal
+    destinations).
+
+    Parameters
+    ----------
+    board : chess.Board
+        The board to render.
+    orientation : chess.Color
+        The side to view the board from.
+    lastmove : chess.Move
+        The move to mark as the last move.
+    squares : chess.SquareSet
+        The squares to mark.
+    fill : dict[chess.Square, str]
+        The squares to mark as selected. Colors are ignored.
+    coordinates : bool
+        Whether to show rank and file labels.
+    **_
+        Other keyword arguments accepted by ``chess.svg.board()``, which are ignored.
+
+    Returns
+    -------
+    str
+        The rendered board as a Markdown code block, followed by a legend.
+    """
+    brackets = {}
+
+    if lastmove:
+        brackets[lastmove.from_square] = brackets[lastmove.to_square] = "()"
+
+    for square in squares or []:
+        brackets[square] = "<>"
+
+    for square in fill or {}:
+        brackets[square] = "[]"
+
+    ranks = range(7, -1, -1) if orientation == chess.WHITE else range(8)
+    files = range(8) if orientation == chess.WHITE else range(7, -1, -1)
+
+    lines = []
+
+    for rank in ranks:
+        row = ""
+
+        for file in files:
+            square = chess.square(file, rank)
+            piece = board.piece_at(square)
+            left, right = brackets.get(square, "  ")
+            row += f"{left}{piece.symbol() if piece else '·'}{right}"
+
+        lines.append(f"{rank + 1} {row}" if coordinates else row)
+
+    if coordinates:
+        lines.append("  " + "".join(f" {chess.FILE_NAMES[file]} " for file in files))
+
+    legend = ["Uppercase: White", "Lowercase: Black"]
+
+    if lastmove:
+        legend.append("( ): Move")
+
+    if fill:
+        legend.append("[ ]: Selected")
+
+    if squares:
+        legend.append("< >: Legal")
+
+    return "```\n" + "\n".join(lines) + "\n```\n" + " · ".join(legend)
+
+
+async def render_board_grid(
+    boards: list[dict], *, labels: list[str] = None, columns: int = 5
+) -> bytes:
+    """
+    Render several chess boards as a grid of thumbnails in a single PNG.
+
+    Parameters
+    ----------
+    boards : list[dict]
+        Keyword arguments to pass to ``chess.svg.board()``, one dictionary per board.
+    labels : list[str]
+        Captions to draw above each board.
+    columns : int
+        The maximum number of boards per row.
+
+    Returns
+    -------
+    bytes
+        The rendered PNG.
+    """
+    svgs = [chess.svg.board(**kwargs, size=360) for kwargs in boards]
+    return await asyncio.to_thread(
+        _rasterize_grid, svgs, labels or [""] * len(svgs), columns
+    )
+
+
+def _rasterize(svg: str) -> bytes:
+    # this runs off the event loop, so it mustn't change the working directory the way Path's context manager does
+    with TemporaryDirectory() as tmp:
+        svg_file = Path(tmp) / "board.svg"
+        svg_file.write_text(svg)
+        return renderPM.drawToString(svg2rlg(svg_file), fmt="png")
+
+
+def _rasterize_grid(svgs: list[str], labels: list[str], columns: int) -> bytes:
+    cell, caption = 360, 40
+    columns = min(columns, len(svgs))
+    rows = math.ceil(len(svgs) / columns)
+
+    grid = Drawing(columns * cell, rows * (cell + caption))
+
+    with TemporaryDirectory() as tmp:
+        for index, (svg, label) in enumerate(zip(svgs, labels)):
+            svg_file = Path(tmp) / f"board-{index}.svg"
+            svg_file.write_text(svg)
+            drawing = svg2rlg(svg_file)
+
+            # reportlab's origin is the bottom-left corner, so the first row is the one furthest from it
+            row, column = divmod(index, columns)
+            x, y = column * cell, (rows - row - 1) * (cell + caption)
+
+            thumbnail = Group(*drawing.contents)
+            thumbnail.translate(x, y)
+            thumbnail.scale(cell / drawing.width, cell / drawing.height)
+
+            grid.add(thumbnail)
+            grid.add(
+                String(
+                    x + cell / 2,
+                    y + cell + caption / 3,
+                    label,
+                    fontSize=20,
+                    textAnchor="middle",
+                )
+            )
+
+    return renderPM.drawToString(grid, fmt="png")
@@ -7,33 +7,44 @@
 from __future__ import annotations
 
 import asyncio
+import io
 import math
 import random
+import time
 import uuid
 from collections import Counter
 from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
 
 import chess
 import discord
+import inflect as ifl
 from attrs import define
 from chess import square_name
 from elysia import Fields
+from llist import dllistnode
 from pydantic import BaseModel, validate_arguments
 
+import database.models as orm
 import shrine
 import support
 from cogs import shogi
 from keyboard import *
 from shrine.kami import posessive
-from support import BasePlayer, ThreadedGame
+from support import BasePlayer, HostedGame, ThreadedGame
+
+inflect = ifl.engine()
 
 
 @define(slots=False)
 class ChessGame(ThreadedGame):
     __games__: ClassVar[dict[int, Self]] = {}
 
+    snapshot_kind: ClassVar[str] = "chess"
+
     players: list[ChessPlayer] = Fields.field()
     saving_enabled: bool = Fields.field(frozen=True)
+    text_board: bool = Fields.field(default=False, frozen=True)
 
     has_started: bool = Fields.attr(default=False)
     current_player: ChessPlayer = Fields.attr(default=None)
@@ -48,10 +59,12 @@ class ChessGame(ThreadedGame):
 
         self.board: ChessBoard = ChessBoard()
         self.processor = ChessEventProcessor(self)
+        self.spectators = ChessSpectatorFeed(self)
         self.players = [ChessPlayer(player, game=self) for player in self.players]
 
         for player in self.players:
             player.set_opponent()
+            support.GameRegistry.join(self, player.user.id)
 
     async def game_timer(self, *, hours: int = 4):
         await super().game_timer(hours=hours)
@@ -59,13 +72,80 @@ class ChessGame(ThreadedGame):
         if self.retrieve_game(self.thread.id):
             await self.force_close("time_limit")
 
+    def snapshot(self) -> dict:
+        return {
+            **super().snapshot(),
+            "players": [player.id for player in self.players],
+            "saving_enabled": self.saving_enabled,
+            "text_board": self.text_board,
+            "has_started": self.has_started,
+            "turn_number": self.turn_number,
+            "moves": [move.uci() for move in self.board.move_stack],
+            "white": self.white.id if self.white else None,
+            "ready": [player.is_ready for player in self.players],
+            "draw_proposed": [player.has_proposed_draw for player in self.players],
+        }
+
+    @classmethod
+    async def from_snapshot(cls, thread: discord.Thread, data: dict) -> Self:
+        game = cls(
+            guild=thread.guild,
+            thread=thread,
+            players=[
+                await support.fetch_member(thread.guild, user_id)
+                for user_id in data["players"]
+            ],
+            saving_enabled=data["saving_enabled"],
+            text_board=data["text_board"],
+        )
+
+        await game.load_snapshot(data)
+
+        return game
+
+    async def load_snapshot(self, data: dict):
+        await super().load_snapshot(data)
+
+        for move in data["moves"]:
+            self.board.push_uci(move)
+
+        for player, is_ready, has_proposed_draw in zip(
+            self.players, data["ready"], data["draw_proposed"]
+        ):
+            player.is_ready = is_ready
+            player.has_proposed_draw = has_proposed_draw
+
+        self.has_started = data["has_started"]
+        self.turn_number = data["turn_number"]
+
+        if self.has_started:
+            self.white = self.retrieve_player(discord.Object(id=data["white"]))
+            self.black = self.white.opponent
+
+            for player in self.players:
+                player.set_color()
+
+            to_move = self.white if self.board.turn else self.black
+
+            # between turns, the current player is still the one who just moved
+            self.current_player = to_move if self.turn_deadline else to_move.opponent
+            self.turn_uuid = uuid.uuid4()
+
+    def resume(self):
+        super().resume()
+
+        # a game snapshotted between turns picks up with the next one
+        if self.has_started and not self.turn_deadline:
+            asyncio.create_task(self.start_next_turn())
+
     @classmethod
     def retrieve_duplicate_game(cls, players, guild) -> Self:
+        # only games the first player is in can possibly match, so there's no need to look any further than those
         return discord.utils.find(
             lambda game: Counter([user.id for user in players])
             == Counter([player.user.id for player in game.players])
             and game.guild == guild,
-            cls.__games__.values(),
+            support.GameRegistry.joined_by(players[0].id, game_class=cls),
         )
 
     def retrieve_player(self, user):
@@ -195,9 +275,10 @@ class ChessGame(ThreadedGame):
         )
 
         async with self.thread.typing():
-            async with self.board.image() as board_png:
-                embed.set_image(url=f"attachment://{board_png.filename}")
-                await self.thread.send(embed=embed, file=board_png)
+            async with shogi.get_board_display(
+                embed, text=self.text_board, board=self.board
+            ) as board_display:
+                await self.thread.send(embed=embed, **board_display)
 
         await asyncio.sleep(3)
 
@@ -227,11 +308,15 @@ class ChessGame(ThreadedGame):
 
     async def end_current_turn(self):
         self.turn_uuid = None
+        self.turn_deadline = None
 
         async with self.thread.typing():
-            async with self.board.image() as board_png:
-                self.turn_record.set_image(url=f"attachment://{board_png.filename}")
-                await self.thread.send(embed=self.turn_record, file=board_png)
+            async with shogi.get_board_display(
+                self.turn_record, text=self.text_board, board=self.board
+            ) as board_display:
+                await self.thread.send(embed=self.turn_record, **board_display)
+
+        self.spectators.notify()
 
         if self.board.is_checkmate():
             await self.end_game(reason="checkmate", winner=self.current_player)
@@ -240,11 +325,19 @@ class ChessGame(ThreadedGame):
         else:
             await self.start_next_turn()
 
-    async def turn_timer(self):
+    async def turn_timer(self, *, resume: bool = False):
         turn_uuid = self.turn_uuid
 
-        await asyncio.sleep(90)
-        if turn_uuid == self.turn_uuid and self.retrieve_game(self.thread.id):
+        if not resume:
+            self.turn_deadline = time.time() + 120
+            self.checkpoint()
+
+        # a game restored with less than 30 seconds left on the clock skips the warning
+        if (until_warning := self.turn_deadline - 30 - time.time()) > 0:
+            await asyncio.sleep(until_warning)
+            if not (turn_uuid == self.turn_uuid and self.retrieve_game(self.thread.id)):
+                return
+
             msg = f"{self.current_player.user.mention} has 30 seconds left to move."
             embed = discord.Embed(
                 title="30 Second Warning",
@@ -253,21 +346,23 @@ class ChessGame(ThreadedGame):
             )
             await self.thread.send(embed=embed)
 
-            await asyncio.sleep(30)
-            if turn_uuid == self.turn_uuid and self.retrieve_game(self.thread.id):
-                msg = f"{self.current_player.user.mention} took too long to move."
-                embed = discord.Embed(
-                    title=f"{self.current_player.user.name} timed out.",
-                    description=msg,
-                    color=support.Color.error(),
-                )
-                await self.thread.send(embed=embed)
+        await asyncio.sleep(max(self.turn_deadline - time.time(), 0))
+        if turn_uuid == self.turn_uuid and self.retrieve_game(self.thread.id):
+            msg = f"{self.current_player.user.mention} took too long to move."
+            embed = discord.Embed(
+                title=f"{self.current_player.user.name} timed out.",
+                description=msg,
+                color=support.Color.error(),
+            )
+            await self.thread.send(embed=embed)
 
-                await self.end_game(reason="timeout", player=self.current_player)
+            await self.end_game(reason="timeout", player=self.current_player)
 
     async def end_game(self, reason: str, **kwargs):
         await self.kill()
 
+        self.spectators.notify()
+
         async def forfeit():
             forfeiter: ChessPlayer = kwargs.get("player")
 
@@ -389,6 +484,359 @@ class ChessGame(ThreadedGame):
         await self.thread.delete()
 
 
+@define(slots=False)
+class ChessCorrespondenceGame(ChessGame):
+    """
+    A chess game played at correspondence pace, with days rather than minutes to make each move.
+
+    The game's state lives in the database. A correspondence game is only held in memory while its players are
+    interacting with it: it's hydrated from the database the first time someone uses a chess command in its thread,
+    and evicted again after ``idle_minutes`` without any interaction. Move deadlines are enforced by a periodic sweep
+    of the database rather than by in-memory timers.
+
+    The threads of every correspondence game in the database are tracked in :attr:`thread_ids`, so that threads
+    without one never touch the database. All database work happens off the event loop.
+
+    Parameters
+    ----------
+    deadline : datetime.datetime
+        The time by which the current player must move.
+    """
+
+    # correspondence games keep their own state in the database, so checkpoint() saves them there instead
+    snapshot_kind: ClassVar[str] = None
+
+    move_days: ClassVar[int] = 3
+    idle_minutes: ClassVar[int] = 15
+
+    # the threads of every correspondence game in the database, loaded at startup by load_thread_ids()
+    thread_ids: ClassVar[set[int]] = set()
+
+    deadline: datetime = Fields.attr(default=None)
+    last_active: float = Fields.attr(default=0)
+    eviction_task: asyncio.Task = Fields.attr(default=None)
+    save_lock: asyncio.Lock = Fields.attr(factory=asyncio.Lock)
+
+    @classmethod
+    async def load_thread_ids(cls):
+        """
+        Load the threads of every correspondence game in the database into :attr:`thread_ids`.
+        """
+
+        def read():
+            with orm.db_session:
+                return [
+                    int(record.thread_id) for record in orm.ChessCorrespondence.select()
+                ]
+
+        cls.thread_ids.update(await asyncio.to_thread(read))
+
+    @classmethod
+    async def hydrate(cls, thread: discord.Thread) -> Self | None:
+        """
+        Load a correspondence game into memory from the database.
+
+        Parameters
+        ----------
+        thread : discord.Thread
+            The game's thread.
+
+        Returns
+        -------
+        Self | None
+            The game associated with the specified thread if one exists; otherwise None.
+        """
+        if thread.id not in cls.thread_ids:
+            return None
+
+        def read():
+            with orm.db_session:
+                record = orm.ChessCorrespondence.get(thread_id=str(thread.id))
+                return record.to_dict() if record else None
+
+        if not (data := await asyncio.to_thread(read)):
+            return None
+
+        white, black = [
+            thread.guild.get_member(int(user_id))
+            or await thread.guild.fetch_member(int(user_id))
+            for user_id in (data["white_id"], data["black_id"])
+        ]
+
+        # someone else may have hydrated the game while we were waiting on Discord
+        if game := cls.retrieve_game(thread.id):
+            return game
+
+        game = cls(
+            guild=thread.guild,
+            thread=thread,
+            players=[white, black],
+            saving_enabled=data["saving_enabled"],
+            text_board=data["text_board"],
+        )
+
+        game.restore(data)
+        game.touch()
+
+        return game
+
+    @classmethod
+    async def hydrate_duplicate_game(
+        cls, players: list[discord.User], guild: discord.Guild
+    ) -> Self | None:
+        """
+        Load a correspondence game between two users in a server into memory from the database, if one exists, so
+        that :meth:`ChessGame.retrieve_duplicate_game` can find it even after it's been evicted.
+
+        Parameters
+        ----------
+        players : list[discord.User]
+            The two users.
+        guild : discord.Guild
+            The server.
+
+        Returns
+        -------
+        Self | None
+            The game if one exists; otherwise None.
+        """
+        user_ids = {str(user.id) for user in players}
+
+        def read():
+            with orm.db_session:
+                return [
+                    int(record.thread_id)
+                    for record in orm.ChessCorrespondence.select(guild_id=str(guild.id))
+                    if {record.white_id, record.black_id} == user_ids
+                ]
+
+        for thread_id in await asyncio.to_thread(read):
+            if game := cls.retrieve_game(thread_id):
+                return game
+
+            try:
+                thread = guild.get_thread(thread_id) or await guild.fetch_channel(
+                    thread_id
+                )
+            except discord.NotFound:
+                await cls.discard(thread_id)
+                continue
+
+            if game := await cls.hydrate(thread):
+                return game
+
+    @classmethod
+    async def enforce_deadlines(cls, bot: discord.Bot):
+        """
+        End every correspondence game whose current player has missed their deadline.
+
+        Parameters
+        ----------
+        bot : discord.Bot
+        """
+
+        def read():
+            with orm.db_session:
+                return [
+                    int(record.thread_id)
+                    for record in orm.ChessCorrespondence.get_overdue_games(
+                        datetime.utcnow()
+                    )
+                ]
+
+        overdue = await asyncio.to_thread(read)
+
+        # the sweep may run before the known threads have been loaded
+        cls.thread_ids.update(overdue)
+
+        for thread_id in overdue:
+            try:
+                thread = bot.get_channel(thread_id) or await bot.fetch_channel(
+                    thread_id
+                )
+            except discord.NotFound:
+                await cls.discard(thread_id)
+                continue
+
+            game = cls.retrieve_game(thread_id) or await cls.hydrate(thread)
+
+            if game:
+                msg = f"{game.current_player.user.mention} took too long to move."
+                embed = discord.Embed(
+                    title=f"{game.current_player.user.name} timed out.",
+                    description=msg,
+                    color=support.Color.error(),
+                )
+                await game.thread.send(embed=embed)
+
+                asyncio.create_task(
+                    game.end_game(reason="timeout", player=game.current_player)
+                )
+
+    @classmethod
+    async def discard(cls, thread_id: int):
+        """
+        Delete a correspondence game from the database.
+
+        Parameters
+        ----------
+        thread_id : int
+            The unique identifier of the game's thread.
+        """
+        if thread_id not in cls.thread_ids:
+            return
+
+        cls.thread_ids.discard(thread_id)
+
+        def delete():
+            with orm.db_session:
+                orm.ChessCorrespondence.select(thread_id=str(thread_id)).delete(
+                    bulk=True
+                )
+
+        await asyncio.to_thread(delete)
+
+    def restore(self, data: dict):
+        moves = data["moves"].split()
+
+        if moves:
+            for move in moves:
+                self.board.push_uci(move)
+        else:
+            self.board.set_fen(data["fen"])
+
+        self.white, self.black = [
+            self.retrieve_player(discord.Object(id=int(data[key])))
+            for key in ("white_id", "black_id")
+        ]
+
+        for player in self.players:
+            player.set_color()
+            player.has_proposed_draw = str(player.id) == data["draw_proposer_id"]
+
+        self.has_started = True
+        self.turn_number = len(moves) + 1
+        self.turn_uuid = uuid.uuid4()
+        self.current_player = self.white if self.board.turn else self.black
+        self.deadline = data["deadline"].replace(tzinfo=timezone.utc)
+
+    async def save(self):
+        """
+        Write the game's state to the database.
+        """
+        draw_proposer = discord.utils.find(lambda p: p.has_proposed_draw, self.players)
+
+        state = {
+            "guild_id": str(self.guild.id),
+            "white_id": str(self.white.id),
+            "black_id": str(self.black.id),
+            "saving_enabled": self.saving_enabled,
+            "text_board": self.text_board,
+            "fen": self.board.fen(),
+            "moves": " ".join(move.uci() for move in self.board.move_stack),
+            "draw_proposer_id": str(draw_proposer.id) if draw_proposer else None,
+            "deadline": self.deadline.replace(tzinfo=None),
+        }
+
+        def write():
+            with orm.db_session:
+                if record := orm.ChessCorrespondence.get(thread_id=str(self.thread.id)):
+                    record.set(**state)
+                else:
+                    orm.ChessCorrespondence(thread_id=str(self.thread.id), **state)
+
+        # writes are made one at a time so that an older state can't land after a newer one
+        async with self.save_lock:
+            if self.retrieve_game(self.thread.id) is self:
+                self.thread_ids.add(self.thread.id)
+                await asyncio.to_thread(write)
+
+    def checkpoint(self):
+        """
+        Save the game to the database in the background. Games that haven't started yet have nothing to save.
+        """
+        if self.deadline and self.retrieve_game(self.thread.id):
+            asyncio.create_task(self.save())
+
+    def touch(self):
+        """
+        Record that the game has been interacted with, postponing its eviction from memory.
+        """
+        self.last_active = asyncio.get_running_loop().time()
+
+        if not self.eviction_task or self.eviction_task.done():
+            self.eviction_task = asyncio.create_task(self.eviction_timer())
+
+    async def eviction_timer(self):
+        loop = asyncio.get_running_loop()
+
+        while (idle := loop.time() - self.last_active) < self.idle_minutes * 60:
+            await asyncio.sleep(self.idle_minutes * 60 - idle)
+
+        if self.retrieve_game(self.thread.id) is self:
+            await self.evict()
+
+    async def evict(self):
+        """
+        Write the game's state to the database and remove it from memory.
+        """
+        await self.save()
+        support.GameRegistry.unregister(self.thread.id)
+
+    async def kill(self):
+        await super().kill()
+
+        async with self.save_lock:
+            await self.discard(self.thread.id)
+
+    async def open_lobby(self):
+        msg = (
+            "Your chess game will take place in this thread.\n"
+            "\n"
+            f"This is a correspondence game, so you'll each have {self.move_days} days to make each move. "
+            f"Take your time!"
+        )
+
+        embed = discord.Embed(
+            title=f"Hi, {self.players[0].user.name} and {self.players[1].user.name}!\n",
+            description=msg,
+            color=support.Color.mint(),
+        )
+
+        if self.saving_enabled:
+            embed.set_footer(text="Game saving is enabled.")
+        else:
+            embed.set_footer(text="Game saving is disabled.")
+
+        link_button = discord.ui.Button(
+            label="How to Play",
+            emoji="📖",
+            url="https://3515.games/games/chess",
+        )
+
+        intro = await self.thread.send(embed=embed, view=discord.ui.View(link_button))
+        await intro.pin()
+
+        await self.start_game()
+
+    async def start_game(self):
+        await super().start_game()
+        self.touch()
+
+    async def turn_timer(self, *, resume: bool = False):
+        self.deadline = discord.utils.utcnow() + timedelta(days=self.move_days)
+        await self.save()
+
+        msg = (
+            f"{self.current_player.user.mention} has until "
+            f"{discord.utils.format_dt(self.deadline)} to move."
+        )
+        embed = discord.Embed(
+            title="Move Deadline", description=msg, color=support.Color.caution()
+        )
+        await self.thread.send(embed=embed)
+
+
 @define
 class ChessPlayer(BasePlayer):
     game: ChessGame
@@ -401,6 +849,7 @@ class ChessPlayer(BasePlayer):
 
     async def ready(self):
         self.is_ready = True
+        self.game.checkpoint()
 
         embed = discord.Embed(
             title=f"{self.user.name} is ready!",
@@ -424,18 +873,7 @@ class ChessPlayer(BasePlayer):
         await self.end_turn()
 
     async def move_with_notation(self, ctx: discord.ApplicationContext, notation: str):
-        def parse_move(move_str: str) -> chess.Move | None:
-            try:
-                parsed_move = self.game.board.parse_san(move_str)
-            except ValueError:
-                try:
-                    parsed_move = self.game.board.parse_uci(move_str)
-                except ValueError:
-                    return None
-
-            return parsed_move if self.game.board.is_legal(parsed_move) else None
-
-        move = parse_move(notation)
+        move = self.game.board.parse_notation(notation)
 
         if move:
             await ctx.respond("Making move...", ephemeral=True)
@@ -479,6 +917,7 @@ class ChessPlayer(BasePlayer):
     async def propose_draw(self):
         if not any(player.has_proposed_draw for player in self.game.players):
             self.has_proposed_draw = True
+            self.game.checkpoint()
 
             msg = (
                 f"{self.mention} proposes a draw. {self.opponent.mention} can agree to the proposal "
@@ -499,6 +938,7 @@ class ChessPlayer(BasePlayer):
 
     async def rescind_draw(self):
         self.has_proposed_draw = False
+        self.game.checkpoint()
 
         msg = f"{self.mention} rescinds {self.pronoun('their')} proposal to draw."
         embed = discord.Embed(
@@ -534,12 +974,653 @@ class ChessBoard(chess.Board):
         piece = super().piece_at(square)
         return ChessPiece.from_base_piece(piece) if piece else None
 
+    def parse_notation(self, notation: str) -> chess.Move | None:
+        """
+        Parse a move given in either algebraic or UCI notation.
+
+        Parameters
+        ----------
+        notation : str
+            The move.
+
+        Returns
+        -------
+        chess.Move | None
+            The move if it's valid and legal in the current position; otherwise None.
+        """
+        try:
+            move = self.parse_san(notation)
+        except ValueError:
+            try:
+                move = self.parse_uci(notation)
+            except ValueError:
+                return None
+
+        return move if self.is_legal(move) else None
+
     @asynccontextmanager
     async def image(self) -> discord.File:
         async with shogi.get_board_image(board=self) as image:
             yield image
 
 
+@define(slots=False)
+class ChessSimul(HostedGame):
+    """
+    A simultaneous exhibition, in which one host plays white against up to 10 opponents at once, each on their own
+    board, in a single thread.
+
+    Play proceeds in rounds. A round opens once every board in play is waiting on the host, or once
+    :attr:`round_timeout` seconds have passed since the last round ended, whichever comes first. It ends once the host
+    has answered every board that was waiting on them when it opened, at which point every board is rendered in one
+    batch as a single overview image rather than one upload per board.
+
+    Parameters
+    ----------
+    guild : discord.Guild
+        The server (a.k.a. "guild") in which the simul is taking place.
+    thread : discord.Thread
+        The simul's associated thread.
+    host : discord.Member
+        The user who is the Game Host.
+    """
+
+    __games__: ClassVar = {}
+
+    name: ClassVar = "Chess Simul"
+    short_name: ClassVar = "Simul"
+    min_players: ClassVar = 1
+    max_boards: ClassVar = 10
+    round_timeout: ClassVar = 60
+
+    boards: list[ChessSimulBoard] = Fields.attr(factory=list)
+    pending_boards: set[int] = Fields.attr(factory=set)
+    round_number: int = Fields.attr(default=0)
+    round_record: list[str] = Fields.attr(factory=list)
+    overview: bytes = Fields.attr(default=None)
+    overview_plies: tuple[int, ...] = Fields.attr(default=None)
+    round_deadline: float = Fields.attr(default=None)
+
+    def retrieve_board(self, number: int) -> ChessSimulBoard | None:
+        """
+        Retrieve a board given its number.
+
+        Parameters
+        ----------
+        number : int
+            The board's number, starting from 1.
+
+        Returns
+        -------
+        ChessSimulBoard | None
+            The board if one exists with the specified number; otherwise None.
+        """
+        return self.boards[number - 1] if 0 < number <= len(self.boards) else None
+
+    @property
+    def active_boards(self) -> list[ChessSimulBoard]:
+        return [board for board in self.boards if not board.result]
+
+    async def open_lobby(self):
+        msg = (
+            f"{self.host.mention} will play white against everyone who joins, on up to {self.max_boards} boards "
+            f"at once.\n"
+            f"\n"
+            f"Use `/chess simul join` to take a board. When everyone's in, {self.host.mention} can start the simul "
+            f"with `/chess simul start`."
+        )
+
+        embed = discord.Embed(
+            title=f"Welcome to {posessive(self.host.name)} chess simul!",
+            description=msg,
+            color=support.Color.mint(),
+        )
+
+        link_button = discord.ui.Button(
+            label="How to Play",
+            emoji="📖",
+            url="https://3515.games/games/chess",
+        )
+
+        self.lobby_intro_msg = await self.thread.send(
+            embed=embed, view=discord.ui.View(link_button)
+        )
+        await self.lobby_intro_msg.pin()
+
+    async def add_player(self, ctx: discord.ApplicationContext, user: discord.User):
+        """
+        Add an opponent to the simul.
+
+        Parameters
+        ----------
+        ctx : discord.ApplicationContext
+        user : discord.Member
+            The user object of the opponent being added.
+        """
+        if user not in await self.thread.fetch_members():
+            await self.thread.add_user(user)
+
+        self.seat_player(ChessPlayer(user, game=self))
+
+        embed = discord.Embed(
+            title="A new opponent has joined the simul!",
+            description=f"{user.mention} will play on board {len(self.players)}.",
+            color=support.Color.mint(),
+        )
+
+        await self.thread.send(embed=embed)
+        await ctx.respond("You've joined the simul.", ephemeral=True)
+
+    async def remove_player(self, player_node: dllistnode):
+        """
+        Remove an opponent from the simul. If the simul has started, the opponent resigns their board.
+
+        Parameters
+        ----------
+        player_node : dllistnode
+            The node of the opponent to remove.
+        """
+        player: ChessPlayer = player_node.value
+
+        if self.has_started:
+            if not player.game.result:
+                await player.game.end_game(reason="forfeit", player=player)
+        else:
+            self.unseat_player(player_node)
+
+            embed = discord.Embed(
+                title="An opponent has left the simul.",
+                description=f"{player.user.mention} has left the simul.",
+                color=support.Color.error(),
+            )
+
+            await self.thread.send(embed=embed)
+
+    async def kick_player(self, player_node: dllistnode):
+        """
+        Kick an opponent from the simul.
+
+        Parameters
+        ----------
+        player_node: dllistnode
+            The node of the opponent to kick.
+        """
+        await self.remove_player(player_node)
+
+        embed = discord.Embed(
+            title=f"You were kicked from {posessive(self.host.name)} chess simul.",
+            description=f"You were kicked from {posessive(self.host.name)} chess simul in {self.guild.name}.",
+            color=support.Color.error(),
+            timestamp=discord.utils.utcnow(),
+        )
+
+        await player_node.value.user.send(embed=embed)
+
+    async def start_game(self):
+        self.is_joinable = False
+
+        for number, opponent in enumerate(self.players.itervalues(), start=1):
+            self.boards.append(
+                ChessSimulBoard(
+                    guild=self.guild,
+                    thread=self.thread,
+                    players=[ChessPlayer(self.host, game=self), opponent],
+                    saving_enabled=False,
+                    simul=self,
+                    number=number,
+                )
+            )
+
+        for board in self.boards:
+            board.start()
+
+        await self.thread.edit(name=f"{self.short_name} with {self.host.name}!")
+
+        lineup = "\n".join(
+            f"**Board {board.number}**: {board.black.user.mention}"
+            for board in self.boards
+        )
+
+        embed = discord.Embed(
+            title="Let's play chess!",
+            description=f"{self.host.mention} plays white on every board.\n\n{lineup}",
+            color=support.Color.mint(),
+        )
+
+        await self.thread.send(content="@everyone", embed=embed)
+
+        await asyncio.sleep(3)
+
+        await self.start_round()
+
+    async def start_round(self):
+        self.round_number += 1
+        self.round_record = []
+        self.round_deadline = None
+        self.pending_boards = {
+            board.number
+            for board in self.active_boards
+            if board.current_player is board.white
+        }
+
+        boards = ", ".join(str(number) for number in sorted(self.pending_boards))
+
+        embed = discord.Embed(
+            title=f"Round {self.round_number}",
+            description=f"{self.host.mention}, it's your move on "
+            f"{inflect.plural('board', len(self.pending_boards))} {boards}.",
+            color=support.Color.white(),
+        )
+
+        await self.thread.send(content=self.host.mention, embed=embed)
+
+    async def end_round(self):
+        embed = discord.Embed(
+            title=f"Round {self.round_number} Moves",
+            description="\n".join(self.round_record),
+            color=support.Color.white(),
+        )
+
+        async with self.thread.typing():
+            async with self.overview_image() as overview_png:
+                embed.set_image(url=f"attachment://{overview_png.filename}")
+                await self.thread.send(embed=embed, file=overview_png)
+
+        self.round_record = []
+
+        waiting = [
+            board.black.user.mention
+            for board in self.active_boards
+            if board.current_player is board.black
+        ]
+
+        if waiting:
+            await self.thread.send(f"{' '.join(waiting)}, it's your move.")
+
+    async def move_made(
+        self,
+        board: ChessSimulBoard,
+        player: ChessPlayer,
+        conclusion: discord.Embed = None,
+    ):
+        """
+        Process a move made on one of the simul's boards.
+
+        Opponents' moves are announced immediately. The host's moves are collected until they've moved on every
+        board that was waiting on them this round, then announced together alongside a single overview image.
+
+        Parameters
+        ----------
+        board : ChessSimulBoard
+            The board on which the move was made.
+        player : ChessPlayer
+            The player who made the move.
+        conclusion : discord.Embed
+            An announcement of the board's result, if the move ended the game on that board.
+        """
+        if player is board.white:
+            self.pending_boards.discard(board.number)
+            self.round_record.append(
+                f"**Board {board.number}**: {board.board.peek_san()}"
+            )
+        else:
+            await self.thread.send(embed=board.turn_record)
+
+        if conclusion:
+            await self.thread.send(embed=conclusion)
+
+        await self.advance()
+
+    async def board_finished(self, board: ChessSimulBoard, conclusion: discord.Embed):
+        """
+        Process a board ending other than by a move (e.g. by forfeit).
+
+        Parameters
+        ----------
+        board : ChessSimulBoard
+            The board that ended.
+        conclusion : discord.Embed
+            An announcement of the board's result.
+        """
+        self.pending_boards.discard(board.number)
+
+        await self.thread.send(embed=conclusion)
+        await self.advance()
+
+    async def advance(self):
+        if self.pending_boards:
+            return
+
+        if self.round_record:
+            await self.end_round()
+
+        waiting = [board.current_player is board.white for board in self.active_boards]
+
+        if not waiting:
+            await self.end_game()
+        elif all(waiting):
+            await self.start_round()
+        elif any(waiting) and not self.round_deadline:
+            self.round_deadline = time.time() + self.round_timeout
+            asyncio.create_task(self.round_timer())
+
+    async def round_timer(self):
+        """
+        Open the next round once the round deadline passes, even if some opponents have yet to move.
+        """
+        round_number = self.round_number
+
+        await asyncio.sleep(max(self.round_deadline - time.time(), 0))
+
+        if (
+            round_number == self.round_number
+            and not self.pending_boards
+            and self.retrieve_game(self.thread.id)
+        ):
+            await self.start_round()
+
+    @asynccontextmanager
+    async def overview_image(self) -> discord.File:
+        """
+        Render every board in the simul as a grid of thumbnails. The image is cached until another move is made.
+        """
+        plies = tuple(board.board.ply() for board in self.boards)
+
+        if self.overview_plies != plies:
+            self.overview = await shogi.render_board_grid(
+                [
+                    {
+                        "board": board.board,
+                        "lastmove": board.board.peek()
+                        if board.board.move_stack
+                        else None,
+                    }
+                    for board in self.boards
+                ],
+                labels=[
+                    f"{board.number}. {board.black.user.name}"
+                    + (f" ({board.result})" if board.result else "")
+                    for board in self.boards
+                ],
+            )
+            self.overview_plies = plies
+
+        yield discord.File(io.BytesIO(self.overview), filename="simul.png")
+
+    async def end_game(self):
+        await self.kill()
+
+        wins = sum(board.result == "1-0" for board in self.boards)
+        losses = sum(board.result == "0-1" for board in self.boards)
+        draws = sum(board.result == "½-½" for board in self.boards)
+
+        msg = (
+            f"{self.host.mention} finishes the simul with "
+            f"{inflect.no('win', wins)}, {inflect.no('loss', losses)}, and {inflect.no('draw', draws)}.\n"
+            f"\n"
+            f"This thread will be automatically deleted in 60 seconds.\n"
+            f"\n"
+            f"Thanks for playing!"
+        )
+
+        embed = discord.Embed(
+            title="The simul is over!", description=msg, color=support.Color.mint()
+        )
+
+        await self.thread.edit(name=f"{self.thread.name} - Game Over!")
+
+        async with self.overview_image() as overview_png:
+            embed.set_image(url=f"attachment://{overview_png.filename}")
+            message = await self.thread.send(embed=embed, file=overview_png)
+
+        await message.pin()
+
+        await asyncio.sleep(60)
+        await self.thread.delete()
+
+
+@define(slots=False)
+class ChessSimulBoard(ChessGame):
+    """
+    One board in a :class:`ChessSimul`.
+
+    Simul boards share their thread with the simul itself, so they are tracked by their simul rather than registered
+    in :attr:`ChessGame.__games__`.
+
+    Parameters
+    ----------
+    simul : ChessSimul
+        The simul the board belongs to.
+    number : int
+        The board's number, starting from 1.
+    """
+
+    snapshot_kind: ClassVar[str] = None
+
+    simul: ChessSimul = Fields.attr(default=None)
+    number: int = Fields.attr(default=0)
+    result: str = Fields.attr(default=None)
+
+    def __attrs_post_init__(self):
+        self.board: ChessBoard = ChessBoard()
+        self.processor = ChessEventProcessor(self)
+
+        for player in self.players:
+            player.game = self
+            player.set_opponent()
+
+    def start(self):
+        self.has_started = True
+        self.white, self.black = self.players
+
+        for player in self.players:
+            player.set_color()
+
+        self.turn_number = 1
+        self.current_player = self.white
+
+    async def end_current_turn(self):
+        player = self.current_player
+
+        if self.board.is_checkmate():
+            conclusion = self.conclude(reason="checkmate", winner=player)
+        elif self.board.is_stalemate():
+            conclusion = self.conclude(reason="stalemate")
+        else:
+            conclusion = None
+
+            self.turn_number += 1
+            self.current_player = player.opponent
+
+        await self.simul.move_made(self, player, conclusion)
+
+    async def end_game(self, reason: str, **kwargs):
+        await self.simul.board_finished(self, self.conclude(reason, **kwargs))
+
+    def conclude(self, reason: str, **kwargs) -> discord.Embed:
+        self.current_player = None
+
+        match reason:
+            case "checkmate":
+                winner: ChessPlayer = kwargs.get("winner")
+                msg = f"{winner.user.mention} wins on board {self.number} by checkmate."
+            case "stalemate":
+                winner = None
+                msg = f"Board {self.number} ends in a stalemate."
+            case "forfeit":
+                winner: ChessPlayer = kwargs.get("player").opponent
+                msg = f"{winner.user.mention} wins on board {self.number} by forfeit."
+            case "timeout":
+                winner: ChessPlayer = kwargs.get("player").opponent
+                msg = f"{winner.user.mention} wins on board {self.number} on time."
+            case "draw":
+                winner = None
+                msg = f"Board {self.number} ends in a draw by agreement."
+            case _:
+                winner = None
+                msg = f"Board {self.number} ends in a draw."
+
+        if winner is None:
+            self.result = "½-½"
+        else:
+            self.result = "1-0" if winner is self.white else "0-1"
+
+        return discord.Embed(
+            title=f"Board {self.number}: Game Over!",
+            description=msg,
+            color=support.Color.mint(),
+        )
+
+
+@define(slots=False)
+class ChessSpectatorFeed:
+    """
+    A live view of a chess game's board that any number of spectators can subscribe to.
+
+    Updates are coalesced per game: no matter how many people are watching or how quickly moves are made, the board
+    is rendered, and spectators' boards are edited, at most once every ``interval`` seconds. Every spectator shares
+    the same render. Spectators see the board the same way the players do (see :func:`shogi.get_board_display`), so
+    games with text boards, and every game while the renderer is too busy, are spectated as text.
+
+    Parameters
+    ----------
+    game : ChessGame
+        The game being spectated.
+    """
+
+    interval: ClassVar[int] = 5
+
+    game: ChessGame
+    subscribers: dict[int, discord.Interaction] = Fields.attr(factory=dict)
+    image: bytes = Fields.attr(default=None)
+    image_ply: int = Fields.attr(default=None)
+    is_stale: bool = Fields.attr(default=False)
+    last_update: float = Fields.attr(default=0)
+    update_task: asyncio.Task = Fields.attr(default=None)
+
+    async def subscribe(self, ctx: discord.ApplicationContext):
+        """
+        Subscribe a user to the feed. Subscribing again replaces the user's existing subscription.
+
+        Parameters
+        ----------
+        ctx : discord.ApplicationContext
+            The context of the command the user subscribed with.
+        """
+        await ctx.defer(ephemeral=True)
+
+        image = await self.render()
+
+        async with self.display(image) as display:
+            await ctx.respond(ephemeral=True, **display)
+
+        self.subscribers[ctx.user.id] = ctx.interaction
+
+    def notify(self):
+        """
+        Let the feed know that the board has changed. Spectators will see the change at the next update.
+        """
+        self.is_stale = True
+
+        if self.subscribers and not (self.update_task and not self.update_task.done()):
+            self.update_task = asyncio.create_task(self.update())
+
+    async def update(self):
+        loop = asyncio.get_running_loop()
+
+        while self.is_stale and self.subscribers:
+            await asyncio.sleep(max(0, self.last_update + self.interval - loop.time()))
+
+            self.is_stale = False
+            self.last_update = loop.time()
+
+            image = await self.render()
+
+            subscribers = list(self.subscribers.items())
+
+            async def edit(interaction: discord.Interaction):
+                async with self.display(image) as display:
+                    await interaction.edit_original_response(attachments=[], **display)
+
+            results = await asyncio.gather(
+                *[edit(interaction) for _, interaction in subscribers],
+                return_exceptions=True,
+            )
+
+            # interaction tokens expire after 15 minutes, after which the spectator has to subscribe again
+            for (user_id, _), result in zip(subscribers, results):
+                if isinstance(result, discord.HTTPException):
+                    self.subscribers.pop(user_id, None)
+
+    def board_kwargs(self) -> dict:
+        board = self.game.board
+        return {"board": board, "lastmove": board.peek() if board.move_stack else None}
+
+    async def render(self) -> bytes | None:
+        """
+        Render the board as an image, if it's to be displayed as one. The image is rendered once per position.
+
+        Returns
+        -------
+        bytes | None
+            The rendered PNG, or None if the board is to be displayed as text.
+        """
+        board = self.game.board
+
+        if self.image_ply != board.ply():
+            if self.game.text_board or shogi.is_renderer_overloaded():
+                return None
+
+            ply = board.ply()
+            image = await shogi.render_board(**self.board_kwargs())
+
+            self.image, self.image_ply = image, ply
+
+        return self.image
+
+    @asynccontextmanager
+    async def display(self, image: bytes | None) -> dict:
+        """
+        Display the board to a spectator.
+
+        Parameters
+        ----------
+        image : bytes | None
+            The board as rendered by :meth:`render`.
+
+        Yields
+        ------
+        dict
+            Keyword arguments to send (or edit) the spectator's message with.
+        """
+        embed = self.embed()
+
+        async with shogi.get_board_display(
+            embed, text=image is None, image=image, **self.board_kwargs()
+        ) as board_display:
+            yield {"embed": embed, **board_display}
+
+    def embed(self) -> discord.Embed:
+        if not self.game.retrieve_game(self.game.thread.id):
+            description = "This game is over."
+        elif self.game.current_player:
+            description = f"It's {posessive(self.game.current_player.user.name)} turn."
+        else:
+            description = "This game hasn't started yet."
+
+        embed = discord.Embed(
+            title=f"Spectating {self.game.thread.name}",
+            description=description,
+            color=support.Color.mint(),
+        )
+
+        embed.set_footer(
+            text="This board updates live for 15 minutes. Use /chess spectate again to keep watching."
+        )
+
+        return embed
+
+
 class ChessPiece(chess.Piece):
     def name(self) -> str:
         return chess.PIECE_NAMES[self.piece_type]
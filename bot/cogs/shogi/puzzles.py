@@ -0,0 +1,318 @@
+########################################################################################################################
+#                         Copyright (C) 2023-present celsius narhwal <hello@celsiusnarhwal.dev>                        #
+#  This notice may not be altered or removed except by or with the express written permission of the copyright holder. #
+#                                      For more information, see the COPYING file.                                     #
+########################################################################################################################
+
+"""
+Chess puzzles are shipped as a single packed, memory-mapped file (``assets/puzzles.bin``) so that picking one is a
+constant-time lookup with no database or network involved. This module deliberately doesn't depend on Discord or the
+rest of the bot so that Kurisu can build the file without loading it.
+
+The file is laid out as follows. All integers are little-endian.
+
+=============  ================================================================================================
+Header         ``<8sHHHI``: the magic bytes ``3515PZL1``, the format version, the number of rating bands (B), the
+               number of themes (T), and the number of puzzles (N).
+Bands          ``B`` unsigned shorts: the lowest rating in each band, in ascending order.
+Themes         ``T`` 32-byte, NUL-padded ASCII theme names. A puzzle's theme bitmask refers to these by position.
+Buckets        ``B * (T + 1)`` pairs of unsigned ints (``<II``): the start and length of each (band, theme) bucket
+               within the ID table. The final bucket in each band holds every puzzle in that band, regardless of
+               theme.
+ID table       Unsigned ints, each the index of a puzzle record.
+Records        ``N`` records of ``<HQIH``: the puzzle's rating, theme bitmask, and the offset and length of its
+               entry in the data section.
+Data           UTF-8 entries of the form ``<FEN>;<UCI moves, space-separated>``.
+=============  ================================================================================================
+
+The FEN is the position the solver has to move from, and the moves alternate between the solver and their opponent,
+starting with the solver.
+"""
+
+from __future__ import annotations
+
+import csv
+import mmap
+import random
+import struct
+from collections import Counter
+from functools import cache, cached_property
+
+from attrs import define
+from elysia import Fields
+from path import Path
+
+from keyboard import *
+
+__all__ = ["ChessPuzzle", "ChessPuzzleIndex"]
+
+
+@define(frozen=True)
+class ChessPuzzle:
+    """
+    A chess puzzle.
+
+    Parameters
+    ----------
+    id : int
+        The puzzle's position in the puzzle file.
+    fen : str
+        The position the solver moves from.
+    solution : list[str]
+        The solution in UCI notation, alternating between the solver's moves and their opponent's replies.
+    rating : int
+        The puzzle's difficulty rating.
+    themes : list[str]
+        The puzzle's themes.
+    """
+
+    id: int
+    fen: str
+    solution: list[str]
+    rating: int
+    themes: list[str]
+
+
+@define(slots=False)
+class ChessPuzzleIndex:
+    """
+    A memory-mapped view of a packed puzzle file.
+
+    Parameters
+    ----------
+    path : str
+        The path to the puzzle file.
+    """
+
+    MAGIC: ClassVar[bytes] = b"3515PZL1"
+    VERSION: ClassVar[int] = 1
+
+    HEADER: ClassVar[struct.Struct] = struct.Struct("<8sHHHI")
+    THEME: ClassVar[struct.Struct] = struct.Struct("<32s")
+    BUCKET: ClassVar[struct.Struct] = struct.Struct("<II")
+    ID: ClassVar[struct.Struct] = struct.Struct("<I")
+    RECORD: ClassVar[struct.Struct] = struct.Struct("<HQIH")
+
+    BANDS: ClassVar[tuple[int, ...]] = (0, 1000, 1500, 2000)
+
+    path: str = Fields.field(frozen=True)
+
+    def __attrs_post_init__(self):
+        with open(self.path, "rb") as file:
+            self.buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, band_count, theme_count, self.count = self.HEADER.unpack_from(
+            self.buffer
+        )
+
+        if magic != self.MAGIC or version != self.VERSION:
+            raise ValueError(f"{self.path} is not a version {self.VERSION} puzzle file")
+
+        offset = self.HEADER.size
+
+        self.bands = struct.unpack_from(f"<{band_count}H", self.buffer, offset)
+        offset += 2 * band_count
+
+        self.themes = [
+            self.THEME.unpack_from(self.buffer, offset + i * self.THEME.size)[0]
+            .rstrip(b"\0")
+            .decode()
+            for i in range(theme_count)
+        ]
+        offset += theme_count * self.THEME.size
+
+        self._buckets_offset = offset
+        offset += band_count * (theme_count + 1) * self.BUCKET.size
+
+        # bucket starts are cumulative, so the last bucket ends where the ID table does
+        start, length = self.BUCKET.unpack_from(
+            self.buffer, self._bucket_offset(band_count - 1, None)
+        )
+
+        self._ids_offset = offset
+        offset += (start + length) * self.ID.size
+
+        self._records_offset = offset
+        self._data_offset = offset + self.count * self.RECORD.size
+
+    @classmethod
+    @cache
+    def bundled(cls) -> Self:
+        """
+        The puzzle file that ships with 3515.games. It's only mapped once.
+        """
+        return cls(Path(__file__).parent / "assets" / "puzzles.bin")
+
+    @cached_property
+    def theme_bits(self) -> dict[str, int]:
+        return {theme: index for index, theme in enumerate(self.themes)}
+
+    def band_of(self, rating: int) -> int:
+        """
+        Get the index of the rating band a rating falls into.
+        """
+        return max(i for i, low in enumerate(self.bands) if rating >= low)
+
+    def random(self, *, band: int, theme: str = None) -> ChessPuzzle | None:
+        """
+        Pick a random puzzle in constant time.
+
+        Parameters
+        ----------
+        band : int
+            The index of the rating band to pick from.
+        theme : str
+            The theme the puzzle must have. If None, puzzles of any theme can be picked.
+
+        Returns
+        -------
+        ChessPuzzle | None
+            A puzzle matching the criteria, or None if there are none.
+        """
+        theme_bit = self.theme_bits.get(theme) if theme else None
+
+        if theme and theme_bit is None:
+            return None
+
+        start, length = self.BUCKET.unpack_from(
+            self.buffer, self._bucket_offset(band, theme_bit)
+        )
+
+        if not length:
+            return None
+
+        (puzzle_id,) = self.ID.unpack_from(
+            self.buffer,
+            self._ids_offset + (start + random.randrange(length)) * self.ID.size,
+        )
+
+        return self.get(puzzle_id)
+
+    def get(self, puzzle_id: int) -> ChessPuzzle:
+        """
+        Get a puzzle by its position in the file.
+        """
+        rating, bitmask, offset, length = self.RECORD.unpack_from(
+            self.buffer, self._records_offset + puzzle_id * self.RECORD.size
+        )
+
+        start = self._data_offset + offset
+        fen, moves = self.buffer[start : start + length].decode().split(";")
+
+        return ChessPuzzle(
+            id=puzzle_id,
+            fen=fen,
+            solution=moves.split(),
+            rating=rating,
+            themes=[theme for i, theme in enumerate(self.themes) if bitmask >> i & 1],
+        )
+
+    def _bucket_offset(self, band: int, theme_bit: int | None) -> int:
+        theme_count = len(self.themes)
+        column = theme_count if theme_bit is None else theme_bit
+
+        return (
+            self._buckets_offset
+            + (band * (theme_count + 1) + column) * self.BUCKET.size
+        )
+
+    @classmethod
+    def pack(cls, puzzles: Iterable[tuple[str, list[str], int, list[str]]], path: str):
+        """
+        Write a puzzle file.
+
+        Parameters
+        ----------
+        puzzles : Iterable[tuple[str, list[str], int, list[str]]]
+            Tuples of each puzzle's FEN, solution, rating, and themes, in the sense described in this module's
+            docstring.
+        path : str
+            The path to write the file to.
+        """
+        puzzles = list(puzzles)
+
+        # theme bitmasks are 64 bits wide, so only the 64 most common themes make the cut
+        theme_counts = Counter(
+            theme for *_, puzzle_themes in puzzles for theme in set(puzzle_themes)
+        )
+        themes = sorted(theme for theme, _ in theme_counts.most_common(64))
+
+        theme_bits = {theme: index for index, theme in enumerate(themes)}
+
+        band_count, theme_count = len(cls.BANDS), len(themes)
+        buckets = [[[] for _ in range(theme_count + 1)] for _ in range(band_count)]
+
+        records, data = [], bytearray()
+
+        for puzzle_id, (fen, solution, rating, puzzle_themes) in enumerate(puzzles):
+            entry = f"{fen};{' '.join(solution)}".encode()
+            puzzle_themes = set(puzzle_themes) & theme_bits.keys()
+            bitmask = sum(1 << theme_bits[theme] for theme in puzzle_themes)
+
+            records.append(cls.RECORD.pack(rating, bitmask, len(data), len(entry)))
+            data += entry
+
+            band = max(i for i, low in enumerate(cls.BANDS) if rating >= low)
+            buckets[band][theme_count].append(puzzle_id)
+
+            for theme in puzzle_themes:
+                buckets[band][theme_bits[theme]].append(puzzle_id)
+
+        with open(path, "wb") as file:
+            file.write(
+                cls.HEADER.pack(
+                    cls.MAGIC, cls.VERSION, band_count, theme_count, len(puzzles)
+                )
+            )
+            file.write(struct.pack(f"<{band_count}H", *cls.BANDS))
+
+            for theme in themes:
+                file.write(cls.THEME.pack(theme.encode()))
+
+            ids, start = [], 0
+
+            for band in buckets:
+                for bucket in band:
+                    file.write(cls.BUCKET.pack(start, len(bucket)))
+                    ids += bucket
+                    start += len(bucket)
+
+            file.write(struct.pack(f"<{len(ids)}I", *ids))
+            file.writelines(records)
+            file.write(data)
+
+    @classmethod
+    def pack_lichess(cls, csv_path: str, path: str, *, limit: int = None):
+        """
+        Write a puzzle file from a copy of the Lichess puzzle database
+        (https://database.lichess.org/#puzzles).
+
+        Lichess puzzles begin one move early, with the move that sets up the tactic, so that move is applied to the
+        FEN here and dropped from the solution.
+
+        Parameters
+        ----------
+        csv_path : str
+            The path to the Lichess puzzle CSV.
+        path : str
+            The path to write the puzzle file to.
+        limit : int
+            The maximum number of puzzles to include.
+        """
+        import chess
+
+        def puzzles():
+            with open(csv_path, newline="") as file:
+                for count, row in enumerate(csv.DictReader(file)):
+                    if limit is not None and count >= limit:
+                        return
+
+                    board = chess.Board(row["FEN"])
+                    setup, *solution = row["Moves"].split()
+                    board.push_uci(setup)
+
+                    yield board.fen(), solution, int(row["Rating"]), row[
+                        "Themes"
+                    ].split()
+
+        cls.pack(puzzles(), path)
@@ -434,8 +434,11 @@ class ChessMoveView(View):
             self.clear_items()
 
             select_menu = await stages[self.current_stage]()
-            async with shogi.get_board_image(**self.image_data) as board_png:
-                select_menu.embed.set_image(url=f"attachment://{board_png.filename}")
+            async with shogi.get_board_display(
+                select_menu.embed,
+                text=self.player.game.text_board,
+                **self.image_data,
+            ) as board_display:
                 self.add_item(select_menu)
 
                 self.configure_buttons()
@@ -444,17 +447,17 @@ class ChessMoveView(View):
                     await interaction.response.defer()
                     await interaction.edit_original_response(
                         embed=select_menu.embed,
-                        file=board_png,
                         attachments=[],
                         view=self,
+                        **board_display,
                     )
                 else:
                     await self.ctx.defer(ephemeral=True)
                     await self.ctx.respond(
                         embed=select_menu.embed,
-                        file=board_png,
                         view=self,
                         ephemeral=True,
+                        **board_display,
                     )
         else:
             piece = self.move_data["piece"]
@@ -485,11 +488,12 @@ class ChessMoveView(View):
             self.image_data["lastmove"] = self.get_move()
             self.image_data["arrows"] = [(origin_square, destination_square)]
 
-            async with shogi.get_board_image(**self.image_data) as board_png:
-                embed.set_image(url=f"attachment://{board_png.filename}")
+            async with shogi.get_board_display(
+                embed, text=self.player.game.text_board, **self.image_data
+            ) as board_display:
                 await interaction.response.defer()
                 await interaction.edit_original_response(
-                    embed=embed, file=board_png, attachments=[], view=self
+                    embed=embed, attachments=[], view=self, **board_display
                 )
 
     async def start(self):
@@ -764,15 +768,17 @@ class ChessBoardView(View):
         next_button.disabled = last_button.disabled = not self.history.has_next()
 
     async def present(self, interaction: Interaction = None):
-        async with shogi.get_board_image(**self.image_data) as board_png:
+        async with shogi.get_board_display(
+            text=self.game.text_board, **self.image_data
+        ) as board_display:
             if interaction:
                 await interaction.response.defer()
                 await interaction.edit_original_response(
-                    file=board_png, attachments=[], view=self
+                    attachments=[], view=self, **board_display
                 )
             else:
                 await self.ctx.defer(ephemeral=True)
-                await self.ctx.respond(file=board_png, view=self, ephemeral=True)
+                await self.ctx.respond(view=self, ephemeral=True, **board_display)
 
     async def initiate_view(self):
         if len(self.history) > 0:
@@ -797,6 +803,201 @@ class ChessBoardView(View):
         await self.present()
 
 
+class ChessPuzzleView(View):
+    """
+    Provides a user interface for solving a chess puzzle.
+    """
+
+    def __init__(
+        self, puzzle: shogi.ChessPuzzle, band: int, theme: str = None, **kwargs
+    ):
+        super().__init__(**kwargs)
+        self.puzzle = puzzle
+        self.band = band
+        self.theme = theme
+        self.board = shogi.ChessBoard(puzzle.fen)
+        self.progress = 0
+        self.status = None
+
+        self.image_data = {
+            "board": self.board,
+            "orientation": self.board.turn,
+            "lastmove": None,
+            "squares": None,
+        }
+
+    @property
+    def is_finished(self) -> bool:
+        return self.progress >= len(self.puzzle.solution)
+
+    def embed(self) -> discord.Embed:
+        side = "White" if self.image_data["orientation"] == chess.WHITE else "Black"
+
+        embed = discord.Embed(
+            title=f"Puzzle #{self.puzzle.id}",
+            description=f"**{side} to move.**\n\n{self.status or 'Find the best move.'}",
+            color=support.Color.mint() if self.is_finished else support.Color.caution(),
+        )
+
+        embed.add_field(name="Rating", value=str(self.puzzle.rating))
+        embed.add_field(
+            name="Themes",
+            value=", ".join(
+                shogi.humanize_theme(theme) for theme in self.puzzle.themes
+            ),
+        )
+
+        return embed
+
+    def advance(self):
+        """
+        Play the next move of the solution.
+        """
+        move = chess.Move.from_uci(self.puzzle.solution[self.progress])
+        self.board.push(move)
+        self.progress += 1
+
+        self.image_data["lastmove"] = move
+        self.image_data["squares"] = None
+
+    async def submit(self, interaction: Interaction, notation: str):
+        move = self.board.parse_notation(notation)
+        solution = chess.Move.from_uci(self.puzzle.solution[self.progress])
+
+        if not move:
+            self.status = (
+                f"**{discord.utils.escape_markdown(notation)}** isn't a legal move. Enter moves in either "
+                f"algebraic or UCI notation."
+            )
+        # on the final move, any mate is as good as the one in the solution
+        elif move == solution or (
+            self.progress == len(self.puzzle.solution) - 1 and self._is_mate(move)
+        ):
+            self.board.push(move)
+            self.progress += 1
+            self.image_data["lastmove"] = move
+            self.image_data["squares"] = None
+
+            if self.is_finished:
+                self.status = "**Correct!** You solved the puzzle."
+                self.finish()
+            else:
+                san = self.board.san(
+                    chess.Move.from_uci(self.puzzle.solution[self.progress])
+                )
+                self.advance()
+                self.status = (
+                    f"**Correct!** Your opponent replies **{san}**. Keep going."
+                )
+        else:
+            self.status = "That's not it. Try again."
+
+        await self.present(interaction)
+
+    def _is_mate(self, move: chess.Move) -> bool:
+        board = self.board.copy(stack=False)
+        board.push(move)
+        return board.is_checkmate()
+
+    def finish(self):
+        for button in [
+            child for child in self.children if child.custom_id != "new_puzzle"
+        ]:
+            button.disabled = True
+
+        discord.utils.find(
+            lambda b: b.custom_id == "new_puzzle", self.children
+        ).disabled = False
+
+    @discord_button(label="Answer", custom_id="answer", style=ButtonStyle.green)
+    async def answer(self, _, interaction: Interaction):
+        view = self
+
+        class PuzzleAnswerModal(Modal):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+
+                self.add_item(
+                    InputText(
+                        label="Your Move",
+                        custom_id="move_input",
+                        min_length=2,
+                        max_length=10,
+                        placeholder="e.g. Qxf7# or d1f7",
+                    )
+                )
+
+            async def callback(self, interaction: Interaction):
+                await view.submit(interaction, self.children[0].value.strip())
+
+        await interaction.response.send_modal(
+            PuzzleAnswerModal(title="Solve the Puzzle", custom_id="answer_modal")
+        )
+
+    @discord_button(label="Hint", custom_id="hint", style=ButtonStyle.gray)
+    async def hint(self, _, interaction: Interaction):
+        move = chess.Move.from_uci(self.puzzle.solution[self.progress])
+        piece = self.board.piece_at(move.from_square)
+
+        self.image_data["squares"] = chess.SquareSet([move.from_square])
+        self.status = f"Look at your {piece.name()} on {square_name(move.from_square).capitalize()}."
+
+        await self.present(interaction)
+
+    @discord_button(label="Show Solution", custom_id="solution", style=ButtonStyle.red)
+    async def show_solution(self, _, interaction: Interaction):
+        line = self.board.variation_san(
+            [
+                chess.Move.from_uci(move)
+                for move in self.puzzle.solution[self.progress :]
+            ]
+        )
+
+        while not self.is_finished:
+            self.advance()
+
+        self.status = f"The solution was **{line}**."
+        self.finish()
+
+        await self.present(interaction)
+
+    @discord_button(
+        label="New Puzzle",
+        custom_id="new_puzzle",
+        style=ButtonStyle.blurple,
+        disabled=True,
+    )
+    async def new_puzzle(self, _, interaction: Interaction):
+        puzzle = shogi.ChessPuzzleIndex.bundled().random(
+            band=self.band, theme=self.theme
+        )
+
+        view = ChessPuzzleView(
+            ctx=self.ctx, puzzle=puzzle, band=self.band, theme=self.theme
+        )
+        await view.present(interaction)
+
+    async def present(self, interaction: Interaction = None):
+        # rendering can take longer than Discord gives us to respond to an interaction, so we defer first
+        if interaction:
+            await interaction.response.defer()
+        else:
+            await self.ctx.defer(ephemeral=True)
+
+        async with shogi.get_board_image(**self.image_data) as board_png:
+            embed = self.embed()
+            embed.set_image(url=f"attachment://{board_png.filename}")
+
+            if interaction:
+                await interaction.edit_original_response(
+                    embed=embed, file=board_png, attachments=[], view=self
+                )
+            else:
+                await self.ctx.respond(
+                    embed=embed, file=board_png, view=self, ephemeral=True
+                )
+
+
 class ChessEndgameView(View):
     def __init__(self, game: shogi.ChessGame):
         super().__init__()
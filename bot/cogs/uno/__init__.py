@@ -4,6 +4,7 @@
 #                                      For more information, see the COPYING file.                                     #
 ########################################################################################################################
 
+from cogs.uno.engine import *
 from cogs.uno.helpers import *
 from cogs.uno.models import *
 from cogs.uno.views import *
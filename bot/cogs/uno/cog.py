@@ -580,6 +580,17 @@ class UnoCog(Cog):
 
         await uno_game.transfer_host(player.user)
 
+    @commands.Cog.listener()
+    async def on_ready(self):
+        """
+        A listener that runs whenever the bot connects to Discord.
+
+        Notes
+        -----
+        The purpose of this listener is to restore UNO games that were in progress when the bot last shut down.
+        """
+        await support.GameSnapshots.rehydrate(self.bot, uno.UnoGame)
+
     @commands.Cog.listener()
     async def on_raw_thread_delete(self, thread: discord.RawThreadDeleteEvent):
         """
@@ -616,11 +627,8 @@ class UnoCog(Cog):
         The purpose of this listener is to enable the automatic closure of UNO games whose associated game
         threads' parent channels are deleted.
         """
-        # call force_close_channel_deletion() for all channel threads associated with UNO games
-        for thread in [
-            thread
-            for thread in channel.threads
-            if thread.id in uno.UnoGame.retrieve_game(thread.id)
-        ]:
-            uno_game = uno.UnoGame.retrieve_game(thread.id)
+        # call force_close() for all UNO games whose threads belong to the deleted channel
+        for uno_game in support.GameRegistry.in_channel(
+            channel.id, game_class=uno.UnoGame
+        ):
             await uno_game.force_close(reason="channel_deletion")
@@ -0,0 +1,760 @@
+########################################################################################################################
+#                         Copyright (C) 2023-present celsius narhwal <hello@celsiusnarhwal.dev>                        #
+#  This notice may not be altered or removed except by or with the express written permission of the copyright holder. #
+#                                      For more information, see the COPYING file.                                     #
+########################################################################################################################
+
+"""
+The rules of UNO, without Discord.
+
+:class:`UnoEngine` holds the state of a game and changes it in response to commands (``play``, ``draw``,
+``callout``, and so on), each of which returns the events that resulted. Nothing here awaits, sends a message, or
+sleeps; :class:`uno.UnoGame` turns the events into messages, and :class:`UnoSimulator` plays games out as fast as the
+rules allow.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+
+from attrs import define
+from elysia import Fields
+
+import support
+from cogs.uno.models.card import UnoCard, UnoCardColor, UnoCardSuit, UnoHand
+from keyboard import *
+
+__all__ = [
+    "UnoEvent",
+    "RoundStarted",
+    "TurnStarted",
+    "CardPlayed",
+    "CardsDrawn",
+    "PlayerSkipped",
+    "TurnOrderReversed",
+    "UnoSaid",
+    "CalledOut",
+    "PlayerTimedOut",
+    "TurnEnded",
+    "RoundWon",
+    "GameWon",
+    "PlayerRemoved",
+    "GameClosed",
+    "UnoSeat",
+    "UnoEngine",
+    "UnoSimulation",
+    "UnoSimulator",
+]
+
+
+# events
+
+
+@define(frozen=True)
+class UnoEvent:
+    """
+    Something that happened in a game.
+    """
+
+
+@define(frozen=True)
+class RoundStarted(UnoEvent):
+    number: int
+
+
+@define(frozen=True)
+class TurnStarted(UnoEvent):
+    player: Any
+
+
+@define(frozen=True)
+class CardPlayed(UnoEvent):
+    player: Any
+    card: UnoCard
+    with_draw: bool
+
+
+@define(frozen=True)
+class CardsDrawn(UnoEvent):
+    """
+    A player drew cards. ``reason`` is one of "deal", "draw", "autoplay" (drawn and then played right away),
+    "penalty" (from a +2 or +4), "callout", or "timeout".
+    """
+
+    player: Any
+    cards: tuple[UnoCard, ...]
+    reason: str
+
+
+@define(frozen=True)
+class PlayerSkipped(UnoEvent):
+    player: Any
+
+
+@define(frozen=True)
+class TurnOrderReversed(UnoEvent):
+    pass
+
+
+@define(frozen=True)
+class UnoSaid(UnoEvent):
+    player: Any
+
+
+@define(frozen=True)
+class CalledOut(UnoEvent):
+    challenger: Any
+    target: Any
+    success: bool
+
+
+@define(frozen=True)
+class PlayerTimedOut(UnoEvent):
+    player: Any
+    timeouts: int
+
+
+@define(frozen=True)
+class TurnEnded(UnoEvent):
+    player: Any
+
+
+@define(frozen=True)
+class RoundWon(UnoEvent):
+    player: Any
+    points: int
+
+
+@define(frozen=True)
+class GameWon(UnoEvent):
+    player: Any
+
+
+@define(frozen=True)
+class PlayerRemoved(UnoEvent):
+    player: Any
+    reason: str
+
+
+@define(frozen=True)
+class GameClosed(UnoEvent):
+    reason: str
+
+
+# state
+
+
+@define(eq=False)
+class UnoSeat:
+    """
+    A player with nothing but the state :class:`UnoEngine` needs.
+
+    The engine accepts any player object with these attributes, such as :class:`uno.UnoPlayer`. Players are compared
+    by identity.
+    """
+
+    name: str
+
+    hand: UnoHand = Fields.attr(factory=UnoHand)
+    points: int = Fields.attr(default=0)
+    can_say_uno: bool = Fields.attr(default=False)
+    has_said_uno: bool = Fields.attr(default=False)
+    timeout_counter: int = Fields.attr(default=0)
+
+    def __str__(self):
+        return self.name
+
+
+@define
+class UnoEngine:
+    """
+    An UNO game, reduced to its rules.
+
+    Each command checks that it's allowed, raising ``ValueError`` if it isn't, and returns the events that resulted
+    from it. Commands never wait on anyone: it's up to the caller to start each round (see :meth:`start_round`) and to
+    call :meth:`time_out` when a turn's time runs out. A :class:`TurnStarted` event, if there is one, always comes last.
+
+    Parameters
+    ----------
+    points_to_win : int
+        The number of points required to win.
+    min_players : int, default=2
+        The number of players below which a game that's started is closed.
+    rng : random.Random, optional
+        The random number generator cards are drawn with.
+    """
+
+    HAND_SIZE: ClassVar[int] = 7
+    MAX_TIMEOUTS: ClassVar[int] = 3
+    PENALTIES: ClassVar[dict[UnoCardSuit, int]] = {
+        UnoCardSuit.DRAW_TWO: 2,
+        UnoCardSuit.DRAW_FOUR: 4,
+    }
+
+    points_to_win: int
+    min_players: int = 2
+    rng: random.Random = Fields.field(factory=random.Random)
+
+    players: list = Fields.attr(factory=list)
+    host: Any = Fields.attr(default=None)
+    leaderboard: support.Leaderboard = Fields.attr(factory=support.Leaderboard)
+
+    # lobby, playing, between (rounds), or over
+    phase: str = Fields.attr(default="lobby")
+    current_round: int = Fields.attr(default=0)
+    current_player: Any = Fields.attr(default=None)
+    skip_next_player: bool = Fields.attr(default=False)
+    reverse_turn_order: bool = Fields.attr(default=False)
+    card_in_play: UnoCard = Fields.attr(default=None)
+
+    def join(self, player: Any) -> list[UnoEvent]:
+        """
+        Add a player to the game's lobby. The first player to join is the host.
+        """
+        self.require("lobby")
+
+        if self.seated(player):
+            raise ValueError(f"{player} is already in the game")
+
+        self.players.append(player)
+        self.leaderboard.add(player, player.points)
+        self.host = self.host if self.host is not None else player
+
+        return []
+
+    def start(self, order: Iterable = None) -> list[UnoEvent]:
+        """
+        Start the game and its first round.
+
+        Parameters
+        ----------
+        order : Iterable, optional
+            The players in turn order. Defaults to the order they joined in.
+        """
+        self.require("lobby")
+
+        if order is not None:
+            order = list(order)
+
+            if sorted(map(id, order)) != sorted(map(id, self.players)):
+                raise ValueError("The turn order must include every player once")
+
+            self.players = order
+
+        if len(self.players) < self.min_players:
+            raise ValueError(f"At least {self.min_players} players are needed")
+
+        self.phase = "between"
+
+        return self.start_round()
+
+    def start_round(self) -> list[UnoEvent]:
+        """
+        Start a new round: every player's hand is replaced with a fresh one, and the first player's turn begins.
+        """
+        self.require("between")
+
+        self.phase = "playing"
+        self.current_round += 1
+        self.current_player = None
+        self.skip_next_player = False
+        self.reverse_turn_order = False
+        self.card_in_play = None
+
+        events = [RoundStarted(self.current_round)]
+
+        for player in self.players:
+            player.hand.clear()
+            events.append(self.deal(player, self.HAND_SIZE, reason="deal"))
+
+        return events + self.start_turn()
+
+    def is_playable(self, card: UnoCard) -> bool:
+        """
+        Whether a card can be played against the card in play.
+        """
+        return (
+            self.card_in_play is None
+            or card.versus_color is self.card_in_play.versus_color
+            or card.versus_suit is self.card_in_play.versus_suit
+            or card.color is UnoCardColor.WILD
+        )
+
+    def playable(self, player: Any) -> list[UnoCard]:
+        """
+        The cards in a player's hand that can be played against the card in play.
+        """
+        return player.hand.playable(self.card_in_play)
+
+    def play(
+        self,
+        player: Any,
+        card: UnoCard,
+        color: UnoCardColor = None,
+        *,
+        with_draw: bool = False,
+    ) -> list[UnoEvent]:
+        """
+        Play a card from a player's hand, ending their turn.
+
+        Parameters
+        ----------
+        player : Any
+            The player.
+        card : UnoCard
+            The card.
+        color : UnoCardColor, optional
+            The color a Wild card changes the color in play to. Required for Wild cards unless they're the player's
+            last card.
+        with_draw : bool, default=False
+            Whether the card was drawn this turn.
+        """
+        self.require_turn(player)
+
+        if card not in player.hand:
+            raise ValueError(f"{player} doesn't have that card")
+
+        if not self.is_playable(card):
+            raise ValueError(f"A {card} can't be played on a {self.card_in_play}")
+
+        if card.color is UnoCardColor.WILD:
+            if color is UnoCardColor.WILD or (color is None and len(player.hand) > 1):
+                raise ValueError("Wild cards need a color")
+
+            card.transformation = color
+
+        player.hand.remove(card)
+        player.timeout_counter = 0
+        self.card_in_play = card
+
+        events = [CardPlayed(player, card, with_draw)]
+
+        if penalty := self.PENALTIES.get(card.suit):
+            victim = self.walk(player, 1)
+            events.append(self.deal(victim, penalty, reason="penalty"))
+            events.append(self.skip(victim))
+        elif card.suit is UnoCardSuit.SKIP:
+            events.append(self.skip(self.walk(player, 1)))
+        elif card.suit is UnoCardSuit.REVERSE:
+            self.reverse_turn_order = not self.reverse_turn_order
+            events.append(TurnOrderReversed())
+
+            # with two players, a Reverse card acts like a Skip card
+            if len(self.players) == 2:
+                events.append(self.skip(self.walk(player, 1)))
+
+        return events + self.end_turn()
+
+    def draw(self, player: Any, autoplay: bool = False) -> list[UnoEvent]:
+        """
+        Draw a card, ending the player's turn.
+
+        Parameters
+        ----------
+        player : Any
+            The player.
+        autoplay : bool, default=False
+            Whether to play the card right away if it's playable and isn't a Wild card.
+        """
+        self.require_turn(player)
+        player.timeout_counter = 0
+
+        [card] = UnoCard.generate_cards(1, rng=self.rng)
+
+        if autoplay and self.is_playable(card) and card.color is not UnoCardColor.WILD:
+            return [self.give(player, [card], reason="autoplay")] + self.play(
+                player, card, with_draw=True
+            )
+
+        return [self.give(player, [card], reason="draw")] + self.end_turn()
+
+    def say_uno(self, player: Any) -> list[UnoEvent]:
+        """
+        Say "UNO!". Players can say it whenever they have one card left, not just on their turn.
+        """
+        self.require("playing")
+
+        if len(player.hand) != 1:
+            raise ValueError("Players can only say UNO with one card left")
+
+        if player.has_said_uno:
+            raise ValueError(f"{player} has already said UNO")
+
+        player.can_say_uno = False
+        player.has_said_uno = True
+
+        return [UnoSaid(player)]
+
+    def callout(self, challenger: Any, target: Any) -> list[UnoEvent]:
+        """
+        Call out a player for having one card left without having said "UNO!".
+
+        If the callout succeeds, the target draws two cards and the challenger's turn continues. If it fails, the
+        challenger draws a card and their turn ends.
+        """
+        self.require_turn(challenger)
+
+        if target is challenger or not self.seated(target):
+            raise ValueError(f"{challenger} can't call out {target}")
+
+        if target.can_say_uno and not target.has_said_uno:
+            return [
+                CalledOut(challenger, target, True),
+                self.deal(target, 2, reason="callout"),
+            ]
+
+        return [
+            CalledOut(challenger, target, False),
+            self.deal(challenger, 1, reason="callout"),
+        ] + self.end_turn()
+
+    def time_out(self) -> list[UnoEvent]:
+        """
+        End the current player's turn because their time ran out.
+
+        The game is closed if every player has timed out on their latest turn. Otherwise, players on their third
+        consecutive timeout are removed, and the others draw a card.
+        """
+        self.require("playing")
+
+        player = self.current_player
+        player.timeout_counter += 1
+
+        events = [PlayerTimedOut(player, player.timeout_counter)]
+
+        if sum(p.timeout_counter for p in self.players) >= len(self.players):
+            return events + self.close("inactivity")
+
+        if player.timeout_counter >= self.MAX_TIMEOUTS:
+            return events + self.remove(player, reason="inactive")
+
+        return events + [self.deal(player, 1, reason="timeout")] + self.end_turn()
+
+    def remove(self, player: Any, reason: str = "left") -> list[UnoEvent]:
+        """
+        Remove a player from the game.
+
+        If it's the player's turn, the next player's turn begins. The game is closed if the host leaves or if too few
+        players are left.
+
+        Parameters
+        ----------
+        player : Any
+            The player.
+        reason : str, default="left"
+            Why the player is being removed (e.g. "left", "kicked", or "inactive").
+        """
+        if not self.seated(player):
+            raise ValueError(f"{player} isn't in the game")
+
+        if self.phase == "over":
+            raise ValueError("The game is over")
+
+        events = [PlayerRemoved(player, reason)]
+
+        if player is self.host:
+            self.unseat(player)
+            return events + self.close("host_left")
+
+        if self.phase != "lobby" and len(self.players) - 1 < self.min_players:
+            self.unseat(player)
+            return events + self.close("insufficient_players")
+
+        if self.phase == "playing" and player is self.current_player:
+            self.skip_next_player = False
+            following = self.walk(player, 1)
+            self.unseat(player)
+            self.current_player = following
+
+            return events + [TurnEnded(player), TurnStarted(following)]
+
+        self.unseat(player)
+
+        return events
+
+    def turn_order(self) -> list:
+        """
+        The players in the order they'll take their turns, starting with the current player.
+        """
+        if self.current_player is None:
+            return list(self.players)
+
+        order = [self.current_player]
+
+        for _ in range(len(self.players) - 1):
+            order.append(self.walk(order[-1], 1))
+
+        return order
+
+    def standings(self) -> list[list]:
+        """
+        The players grouped by their point totals, from most points to fewest.
+        """
+        return self.leaderboard.groups()
+
+    def check(self):
+        """
+        Check that the game's state is consistent.
+
+        Raises
+        ------
+        AssertionError
+            If it isn't.
+        """
+        problems = []
+
+        if len(set(map(id, self.players))) != len(self.players):
+            problems.append("a player is seated twice")
+
+        if self.phase == "playing":
+            if not self.seated(self.current_player):
+                problems.append("the current player isn't playing")
+
+            if any(not player.hand for player in self.players):
+                problems.append("a player has an empty hand mid-round")
+
+            for player in self.players:
+                if (player.can_say_uno or player.has_said_uno) and len(
+                    player.hand
+                ) != 1:
+                    problems.append(
+                        f"{player} can say UNO without having one card left"
+                    )
+
+        if len(self.leaderboard) != len(self.players) or any(
+            player not in self.leaderboard
+            or self.leaderboard.points(player) != player.points
+            for player in self.players
+        ):
+            problems.append("the leaderboard is out of date")
+
+        for player in self.players:
+            if player.timeout_counter >= self.MAX_TIMEOUTS:
+                problems.append(f"{player} should have been removed for inactivity")
+
+        if problems:
+            raise AssertionError("; ".join(problems))
+
+    # internals
+
+    def require(self, *phases: str):
+        if self.phase not in phases:
+            raise ValueError(f"That can't be done while the game is {self.phase}")
+
+    def require_turn(self, player: Any):
+        self.require("playing")
+
+        if player is not self.current_player:
+            raise ValueError(f"It isn't {player}'s turn")
+
+    def seated(self, player: Any) -> bool:
+        return any(p is player for p in self.players)
+
+    def unseat(self, player: Any):
+        del self.players[next(i for i, p in enumerate(self.players) if p is player)]
+        self.leaderboard.remove(player)
+
+    def walk(self, player: Any, steps: int) -> Any:
+        index = next(i for i, p in enumerate(self.players) if p is player)
+        step = -steps if self.reverse_turn_order else steps
+
+        return self.players[(index + step) % len(self.players)]
+
+    def deal(self, player: Any, num_cards: int, reason: str) -> CardsDrawn:
+        return self.give(
+            player, UnoCard.generate_cards(num_cards, rng=self.rng), reason
+        )
+
+    def give(self, player: Any, cards: list[UnoCard], reason: str) -> CardsDrawn:
+        player.hand.update(cards)
+
+        player.can_say_uno = False
+        player.has_said_uno = False
+
+        return CardsDrawn(player, tuple(cards), reason)
+
+    def skip(self, player: Any) -> PlayerSkipped:
+        self.skip_next_player = True
+        return PlayerSkipped(player)
+
+    def start_turn(self) -> list[UnoEvent]:
+        if self.current_player is None:
+            self.current_player = self.players[0]
+        else:
+            self.current_player = self.walk(
+                self.current_player, 2 if self.skip_next_player else 1
+            )
+            self.skip_next_player = False
+
+        return [TurnStarted(self.current_player)]
+
+    def end_turn(self) -> list[UnoEvent]:
+        player = self.current_player
+
+        if len(player.hand) == 1 and not player.has_said_uno:
+            player.can_say_uno = True
+
+        events = [TurnEnded(player)]
+
+        if player.hand:
+            return events + self.start_turn()
+
+        return events + self.win_round(player)
+
+    def win_round(self, player: Any) -> list[UnoEvent]:
+        # the winner is awarded the value of every other player's hand, and always at least one point
+        awarded = sum(card.point_value for p in self.players for card in p.hand) or 1
+        player.points += awarded
+        self.leaderboard.update(player, player.points)
+
+        self.current_player = None
+        events = [RoundWon(player, awarded)]
+
+        if player.points >= self.points_to_win:
+            self.phase = "over"
+            events.append(GameWon(player))
+        else:
+            self.phase = "between"
+
+        return events
+
+    def close(self, reason: str) -> list[UnoEvent]:
+        self.phase = "over"
+        self.current_player = None
+
+        return [GameClosed(reason)]
+
+
+# simulation
+
+
+@define(frozen=True)
+class UnoSimulation:
+    """
+    The results of a simulation run by :class:`UnoSimulator`.
+    """
+
+    games: int
+    rounds: int
+    turns: int
+    cards_played: int
+    cards_drawn: int
+    callouts: int
+    elapsed: float
+
+    @property
+    def turns_per_second(self) -> float:
+        return self.turns / self.elapsed if self.elapsed else 0
+
+    @property
+    def games_per_minute(self) -> float:
+        return self.games / self.elapsed * 60 if self.elapsed else 0
+
+
+@define
+class UnoSimulator:
+    """
+    Plays UNO games against itself with :class:`UnoEngine`.
+
+    Players play a random playable card when they have one and draw otherwise. They sometimes forget to say "UNO!",
+    call each other out, time out, and leave, with the game's state checked (see :meth:`UnoEngine.check`) after every
+    command. A simulation with the same seed always plays out the same way.
+
+    Parameters
+    ----------
+    players : int, default=4
+        The number of players in each game.
+    points_to_win : int, default=500
+        The number of points required to win each game.
+    uno_rate : float, default=0.8
+        The probability that a player says "UNO!" when they can.
+    callout_rate : float, default=0.5
+        The probability that a player calls out someone who can be called out.
+    timeout_rate : float, default=0.01
+        The probability that a player doesn't act before their turn's time runs out.
+    leave_rate : float, default=0.0005
+        The probability that a player leaves the game instead of acting.
+    """
+
+    players: int = 4
+    points_to_win: int = 500
+    uno_rate: float = 0.8
+    callout_rate: float = 0.5
+    timeout_rate: float = 0.01
+    leave_rate: float = 0.0005
+
+    def run(self, games: int, seed: int = 0) -> UnoSimulation:
+        """
+        Play some games.
+
+        Parameters
+        ----------
+        games : int
+            The number of games to play.
+        seed : int, default=0
+            The seed for every random choice made during the simulation.
+        """
+        rng = random.Random(seed)
+        colors = list(UnoCardColor)
+        counts = dict.fromkeys(
+            [RoundWon, TurnStarted, CardPlayed, CardsDrawn, CalledOut], 0
+        )
+        start = time.perf_counter()
+
+        def count(events: list[UnoEvent]):
+            for event in events:
+                if type(event) in counts:
+                    counts[type(event)] += (
+                        len(event.cards) if type(event) is CardsDrawn else 1
+                    )
+
+        for _ in range(games):
+            engine = UnoEngine(self.points_to_win, rng=rng)
+
+            for i in range(self.players):
+                engine.join(UnoSeat(f"Player {i + 1}"))
+
+            count(engine.start())
+
+            while engine.phase != "over":
+                if engine.phase == "between":
+                    count(engine.start_round())
+                    continue
+
+                player = engine.current_player
+
+                for other in engine.players:
+                    if other.can_say_uno and rng.random() < self.uno_rate:
+                        count(engine.say_uno(other))
+
+                targets = [
+                    p for p in engine.players if p.can_say_uno and p is not player
+                ]
+
+                if rng.random() < self.timeout_rate:
+                    count(engine.time_out())
+                elif rng.random() < self.leave_rate:
+                    count(engine.remove(rng.choice(engine.players)))
+                elif targets and rng.random() < self.callout_rate:
+                    count(engine.callout(player, rng.choice(targets)))
+                elif playable := engine.playable(player):
+                    card = rng.choice(playable)
+                    color = (
+                        rng.choice(colors) if card.color is UnoCardColor.WILD else None
+                    )
+                    count(engine.play(player, card, color))
+                else:
+                    count(engine.draw(player, autoplay=True))
+
+                engine.check()
+
+        return UnoSimulation(
+            games,
+            counts[RoundWon],
+            counts[TurnStarted],
+            counts[CardPlayed],
+            counts[CardsDrawn],
+            counts[CalledOut],
+            time.perf_counter() - start,
+        )
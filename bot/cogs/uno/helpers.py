@@ -72,11 +72,7 @@ def verify_context(
         async def is_player():
             game = uno.UnoGame.retrieve_game(ctx.channel_id)
 
-            if any(
-                player
-                for player in game.players.itervalues()
-                if player.user == ctx.user
-            ):
+            if game.retrieve_player(ctx.user):
                 return True
             else:
                 message = f"Only players in this UNO game can use {command_name}."
@@ -9,18 +9,21 @@ from __future__ import annotations
 import random
 import string
 import uuid
+from collections import defaultdict
 from enum import Enum, EnumMeta
+from functools import cache
 
 import discord
 import tomlkit as toml
 from attrs import define
 from dict_deep import deep_get
 from elysia import Fields
+from sortedcontainers import SortedKeyList
 
 import support
 from keyboard import *
 
-__all__ = ["UnoCard", "UnoCardColor", "UnoCardSuit"]
+__all__ = ["UnoCard", "UnoCardColor", "UnoCardSuit", "UnoHand"]
 
 
 class UnoCardAttrMeta(EnumMeta):
@@ -54,6 +57,8 @@ class UnoCardAttrMeta(EnumMeta):
         """
         return super().__iter__()
 
+    # sort codes are looked up every time a card is added to a hand, so indices are only worked out once
+    @cache
     def index(cls, value):
         """
         Get the index of the given attribute within its enumeration.
@@ -172,6 +177,7 @@ class UnoCard:
         ),
     )
     uuid: str = Fields.attr(factory=lambda: uuid.uuid4().hex)
+    sortcode: int = Fields.attr(eq=False)
 
     # noinspection PyUnresolvedReferences
     @transformation.validator
@@ -179,8 +185,29 @@ class UnoCard:
         if self.color is not UnoCardColor.WILD and value is not None:
             raise ValueError("transformation can only be set on Wild cards")
 
+    @sortcode.default
+    def _sortcode(self) -> int:
+        """
+        An integer to be used as a key when sorting this card among others.
+
+        Enforces sorting by color in order of:
+            RED, BLUE, GREEN, YELLOW, WILD
+        and then by suit in order of:
+            ZERO, ONE, TWO, THREE, FOUR, FIVE, SIX, SEVEN, EIGHT, NINE, REVERSE, SKIP, DRAW_TWO, NONE, DRAW_FOUR
+        where each color and suit corresponds to a member of :class:`UnoCardColor` and :class:`UnoCardSuit`,
+        respectively.
+
+        Sort codes are looked up whenever a hand is sorted, so each card's is only worked out once.
+
+        Returns
+        -------
+        :class:`int`
+            The card's sort code.
+        """
+        return self.color.sortcode * 100 + self.suit.sortcode
+
     @classmethod
-    def generate_cards(cls, num_cards) -> list[UnoCard]:
+    def generate_cards(cls, num_cards, rng: random.Random = random) -> list[UnoCard]:
         """
         Generate UNO cards of random canonical color-suit combinations.
 
@@ -188,13 +215,15 @@ class UnoCard:
         ----------
         num_cards
             The number of cards to generate.
+        rng : random.Random, optional
+            The random number generator to choose the cards with.
 
         Returns
         -------
         :class:`list` of :class:`UnoCard`
             The generated cards.
         """
-        return [cls(*card) for card in random.choices(cls.canonical, k=num_cards)]
+        return [cls(*card) for card in rng.choices(cls.canonical, k=num_cards)]
 
     @property
     def versus_color(self) -> UnoCardColor:
@@ -273,24 +302,118 @@ class UnoCard:
 
         return self.transformation.embed_color
 
-    @property
-    def sortcode(self) -> int:
+    def snapshot(self) -> list[str | None]:
         """
-        An integer to be used as a key when sorting this card among others.
-
-        Enforces sorting by color in order of:
-            RED, BLUE, GREEN, YELLOW, WILD
-        and then by suit in order of:
-            ZERO, ONE, TWO, THREE, FOUR, FIVE, SIX, SEVEN, EIGHT, NINE, REVERSE, SKIP, DRAW_TWO, NONE, DRAW_FOUR
-        where each color and suit corresponds to a member of :class:`UnoCardColor` and :class:`UnoCardSuit`,
-        respectively.
+        Serialize the card to a compact list of its color, suit, and transformation.
+        """
+        return [
+            self.color.value,
+            self.suit.value,
+            self.transformation.value if self.transformation else None,
+        ]
 
-        Returns
-        -------
-        :class:`int`
-            The card's sort code.
+    @classmethod
+    def from_snapshot(cls, data: list[str | None]) -> UnoCard:
         """
-        return self.color.sortcode * 100 + self.suit.sortcode
+        Recreate a card from a snapshot made by :meth:`snapshot`.
+        """
+        color, suit, transformation = data
+        card = cls(UnoCardColor(color), UnoCardSuit(suit))
+
+        if transformation:
+            card.transformation = UnoCardColor(transformation)
+
+        return card
 
     def __str__(self):
         return f"{self.color} {self.suit}" if self.suit else str(self.color)
+
+
+@define
+class UnoHand:
+    """
+    The cards in a player's hand.
+
+    Cards are kept sorted (see :attr:`UnoCard.sortcode`) and are also sorted into buckets by color and by suit, so
+    the cards that can be played against the card in play are just the cards in its color's bucket, its suit's bucket,
+    and the Wild bucket.
+    """
+
+    cards: SortedKeyList[UnoCard] = Fields.attr(
+        factory=lambda: SortedKeyList(key=lambda card: card.sortcode)
+    )
+
+    # buckets map each card's UUID to the card
+    colors: defaultdict[UnoCardColor, dict[str, UnoCard]] = Fields.attr(
+        factory=lambda: defaultdict(dict)
+    )
+    suits: defaultdict[UnoCardSuit, dict[str, UnoCard]] = Fields.attr(
+        factory=lambda: defaultdict(dict)
+    )
+
+    @property
+    def num_wilds(self) -> int:
+        """
+        The number of Wild and Wild +4 cards in the hand.
+        """
+        return len(self.colors[UnoCardColor.WILD])
+
+    def add(self, card: UnoCard):
+        self.cards.add(card)
+        self.colors[card.color][card.uuid] = card
+        self.suits[card.suit][card.uuid] = card
+
+    def update(self, cards: Iterable[UnoCard]):
+        for card in cards:
+            self.add(card)
+
+    def remove(self, card: UnoCard):
+        """
+        Remove a card from the hand.
+
+        Raises
+        ------
+        ValueError
+            If the card isn't in the hand.
+        """
+        self.cards.remove(card)
+        del self.colors[card.color][card.uuid]
+        del self.suits[card.suit][card.uuid]
+
+    def clear(self):
+        self.cards.clear()
+        self.colors.clear()
+        self.suits.clear()
+
+    def playable(self, card_in_play: UnoCard | None) -> list[UnoCard]:
+        """
+        The cards in the hand that can be played against a card, in sorted order.
+
+        Parameters
+        ----------
+        card_in_play : UnoCard | None
+            The card in play. If None, every card is playable.
+        """
+        if card_in_play is None:
+            return list(self.cards)
+
+        # a card can be in both the color and suit buckets, so the buckets are merged by UUID
+        playable = {
+            **self.colors[card_in_play.versus_color],
+            **self.suits[card_in_play.versus_suit],
+            **self.colors[UnoCardColor.WILD],
+        }
+
+        return sorted(playable.values(), key=lambda card: card.sortcode)
+
+    def __iter__(self):
+        return iter(self.cards)
+
+    def __len__(self):
+        return len(self.cards)
+
+    def __contains__(self, card: UnoCard):
+        return card in self.cards
+
+    def __getitem__(self, index):
+        return self.cards[index]
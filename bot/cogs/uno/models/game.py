@@ -8,8 +8,10 @@ from __future__ import annotations
 
 import asyncio
 import random
+import time
 import uuid
 
+import attrs
 import discord
 import inflect as ifl
 from attr import define
@@ -47,22 +49,39 @@ class UnoGame(HostedGame):
 
     name: ClassVar = "UNO"
     min_players: ClassVar = 2
+    snapshot_kind: ClassVar = "uno"
 
     settings: UnoGameSettings
 
-    current_round: int = Fields.attr(default=0)
-    current_player: dllistnode = Fields.attr(default=None)
-    skip_next_player: bool = Fields.attr(default=False)
-    reverse_turn_order: bool = Fields.attr(default=False)
+    engine: uno.UnoEngine = Fields.attr()
     turn_uuid: uuid.UUID = Fields.attr(default=None)
-    card_in_play: uno.UnoCard = Fields.attr(default=None)
     turn_record: list[discord.Embed] = Fields.attr(factory=list)
 
+    @engine.default
+    def _engine(self):
+        return uno.UnoEngine(self.settings.points_to_win, min_players=self.min_players)
+
     def __attrs_post_init__(self):
         super().__attrs_post_init__()
         self.status = uno.UnoStatusTracker(self)
         self.processor = uno.UnoEventProcessor(self)
 
+    @property
+    def current_round(self) -> int:
+        return self.engine.current_round
+
+    @property
+    def current_player(self) -> dllistnode | None:
+        """
+        The node of the player whose turn it is, if it's anyone's.
+        """
+        if self.engine.current_player:
+            return self.player_nodes.get(self.engine.current_player.user.id)
+
+    @property
+    def card_in_play(self) -> uno.UnoCard | None:
+        return self.engine.card_in_play
+
     @property
     def last_move_str(self):
         """
@@ -80,35 +99,83 @@ class UnoGame(HostedGame):
         else:
             return ""
 
-    def retrieve_player(
-        self, user: discord.Member, *, return_node=False
-    ) -> uno.UnoPlayer | dllistnode:
-        """
-        Retrieve a player from the game given their corresponding :class:`discord.Member` object.
+    def snapshot(self) -> dict:
+        positions = self.player_positions()
+
+        return {
+            **super().snapshot(),
+            "settings": attrs.asdict(self.settings),
+            "players": [player.snapshot() for player in self.players.itervalues()],
+            "current_round": self.engine.current_round,
+            "current_player": positions[self.engine.current_player.user.id]
+            if self.engine.current_player
+            else None,
+            "skip_next_player": self.engine.skip_next_player,
+            "reverse_turn_order": self.engine.reverse_turn_order,
+            "card_in_play": self.card_in_play.snapshot() if self.card_in_play else None,
+            "status": [
+                self.status.num_turns,
+                self.status.total_cards_played,
+                self.status.total_cards_drawn,
+            ],
+        }
 
-        Parameters
-        ----------
-        user : discord.Member
+    @classmethod
+    async def from_snapshot(cls, thread: discord.Thread, data: dict) -> Self:
+        game = cls(
+            guild=thread.guild,
+            thread=thread,
+            host=await support.fetch_member(thread.guild, data["host"]),
+            settings=UnoGameSettings(**data["settings"]),
+        )
 
-        return_node : bool
-            Whether to return the player's :class:`llist.dllistnode` object rather than their
-            :class:`uno.UnoPlayer` object.
+        await game.load_snapshot(data)
 
-        Returns
-        -------
-        uno.UnoPlayer | llist.dllistnode
-            The player's :class:`uno.UnoPlayer` object, or their :class:`llist.dllistnode`
-            object if ``return_node`` is True.
-        """
+        return game
 
-        if return_node:
-            return discord.utils.find(
-                lambda node: node.value.user.id == user.id, self.players.iternodes()
-            )
-        else:
-            return discord.utils.find(
-                lambda player: player.user.id == user.id, self.players.itervalues()
-            )
+    async def load_snapshot(self, data: dict):
+        await super().load_snapshot(data)
+
+        for player_data in data["players"]:
+            user = await support.fetch_member(self.guild, player_data["id"])
+            player = uno.UnoPlayer(user=user, game=self)
+            player.load_snapshot(player_data)
+            self.seat_player(player)
+
+        self.engine.players = list(self.players.itervalues())
+
+        for player in self.engine.players:
+            self.engine.leaderboard.add(player, player.points)
+
+        self.engine.host = self.retrieve_player(self.host)
+        self.engine.current_round = data["current_round"]
+        self.engine.skip_next_player = data["skip_next_player"]
+        self.engine.reverse_turn_order = data["reverse_turn_order"]
+
+        if data["current_player"] is not None:
+            self.engine.phase = "playing"
+            self.engine.current_player = self.players.nodeat(
+                data["current_player"]
+            ).value
+            self.turn_uuid = uuid.uuid4()
+        elif self.has_started:
+            self.engine.phase = "between"
+
+        if data["card_in_play"]:
+            self.engine.card_in_play = uno.UnoCard.from_snapshot(data["card_in_play"])
+
+        (
+            self.status.num_turns,
+            self.status.total_cards_played,
+            self.status.total_cards_drawn,
+        ) = data["status"]
+
+    def resume(self):
+        super().resume()
+
+        # a game snapshotted between rounds picks up with the next one
+        if self.has_started and not self.current_player:
+            asyncio.create_task(self.start_round())
 
     async def open_lobby(self):
         """
@@ -146,7 +213,9 @@ class UnoGame(HostedGame):
         self.is_joinable = False
         await self.thread.edit(name=f"{self.short_name} with {self.host.name}!")
 
-        random.shuffle(self.players)
+        self.shuffle_players()
+        events = self.engine.start(order=self.players.itervalues())
+        support.PronounResolver.prefetch(*self.player_nodes)
 
         if self.settings.points_to_win == 0:
             rules = (
@@ -175,7 +244,7 @@ class UnoGame(HostedGame):
 
         await asyncio.sleep(3)
 
-        await self.start_round()
+        await self.processor.process(events)
 
     async def add_player(
         self, ctx: discord.ApplicationContext, user: discord.User, *, is_host=False
@@ -195,7 +264,9 @@ class UnoGame(HostedGame):
             await self.thread.add_user(user)
 
         player = uno.UnoPlayer(user=user, game=self)
-        self.players.append(player)
+        self.seat_player(player)
+        self.engine.join(player)
+        self.checkpoint()
 
         join_message_embed = discord.Embed(
             title="A new player has joined the game!",
@@ -230,7 +301,7 @@ class UnoGame(HostedGame):
 
             await ctx.respond(embed=embed, ephemeral=True)
 
-    async def remove_player(self, player_node: dllistnode):
+    async def remove_player(self, player_node: dllistnode, reason: str = "left"):
         """
         Remove a player from the game.
 
@@ -238,199 +309,16 @@ class UnoGame(HostedGame):
         ----------
         player_node : dllistnode
             The node of the player to remove.
+        reason : str, default="left"
+            Why the player is being removed. See :meth:`uno.UnoEngine.remove`.
         """
-
-        player: uno.UnoPlayer = player_node.value
-
-        embed = discord.Embed(
-            title="A player has left the game.",
-            description=f"{player.user.mention} has left the game.",
-            color=support.Color.error(),
-        )
-
-        await self.thread.send(embed=embed)
-
-        # if the host leaves, the game is force closed
-        if player.user == self.host:
-            await self.force_close(reason="host_left")
-
-        # if there are fewer than two players remaining in the game and the game has started, the game is force closed
-        elif len(self.players) - 1 < self.min_players and not self.is_joinable:
-            await self.force_close(reason="insufficient_players")
-
-        elif not self.current_player == player_node and not self.is_joinable:
-            await player.end_turn()
-
-        self.players.remove(player_node)
-
-        if self.voice_channel and player.user in self.voice_channel.members:
-            await player.user.move_to(None)
-            await self.voice_channel.set_permissions(target=player.user, overwrite=None)
-
-    def walk_players(
-        self, player_node: dllistnode, steps: int, *, use_value=False
-    ) -> dllistnode | uno.UnoPlayer:
-        """
-        Circularly traverse the list of a game's players.
-
-        Parameters
-        ----------
-        player_node : dllistnode
-            The node of the player to start traversing from.
-        steps : int
-            The number of steps to traverse.
-        use_value : bool
-            Whether to return the node or its value.
-
-        Returns
-        -------
-        dllistnode | uno.UnoPlayer
-            The node or value of the player at the end of the traversal.
-        """
-        for step in range(steps):
-            if self.reverse_turn_order:
-                # we traverse backwards if a reverse card is in effect
-                player_node = player_node.prev or self.players.last
-            else:
-                player_node = player_node.next or self.players.first
-
-        if use_value:
-            return player_node.value
-        else:
-            return player_node
+        await self.processor.process(self.engine.remove(player_node.value, reason))
 
     async def start_round(self):
         """
         Start a new round of an UNO game.
         """
-        self.current_round += 1
-        self.reverse_turn_order = False
-        self.card_in_play = None
-        self.status.previous_turn_record.clear()
-
-        for player in self.players.itervalues():
-            player.hand.clear()  # clear that motherfucker out
-            await player.add_cards(2)
-
-        msg = f"Round {self.current_round} has begun!"
-        if self.current_round == 1:
-            msg += " Seven cards have been dealt to each player. Check them out with `/uno play > View Hand`."
-        else:
-            msg += (
-                " Any cards you had at the end of the previous round have been taken, and seven new cards have "
-                "been dealt to each player. Check them out with `/uno play > View Hand`."
-            )
-
-        embed = discord.Embed(
-            title=f"Round {self.current_round}: Start!",
-            description=msg,
-            color=support.Color.mint(),
-        )
-
-        await self.thread.send(embed=embed)
-        await self.start_next_turn()
-
-    async def end_round(self, round_winner: uno.UnoPlayer):
-        """
-        End the current round of an UNO game.
-
-        Parameters
-        ----------
-        round_winner : uno.UnoPlayer
-            The winner of the round.
-        """
-        self.current_player = None
-
-        # the number of points awarded to a round's winner is based on the point values of all cards held
-        # by the other players at the end of the round. the winner of a round will always be awarded at least
-        # one point, even if the cumulative value of every other player's hand is zero.
-        awarded_points = (
-            sum([player.hand_value for player in self.players.itervalues()]) or 1
-        )
-
-        round_winner.points += awarded_points
-
-        winner_rank = self.status.get_player_ranking(round_winner)
-
-        msg = (
-            f"Congratulations, {round_winner.mention}! You won Round {self.current_round}!\n"
-            f"\n"
-            f"Based on the cards everyone else is holding, {round_winner.name} has been awarded "
-            f"**{awarded_points} points**.\n"
-            f"\n"
-            f"{round_winner.name} currently has **{round_winner.points} points**, putting "
-            f"{round_winner.pronoun('them')} in **{winner_rank} place**"
-        )
-
-        if (point_gap := self.settings.points_to_win - round_winner.points) > 0:
-            msg += f"—{inflect.no('point', point_gap)} away from winning the game"
-
-        msg += ". To view the full leaderboard, use `/uno status`."
-
-        embed = discord.Embed(
-            title=f"Round {self.current_round}: Over! {round_winner.user.name} Wins!",
-            description=msg,
-            color=support.Color.mint(),
-        )
-
-        embed.set_thumbnail(url=round_winner.user.display_avatar.url)
-
-        await self.thread.send(content="@everyone", embed=embed)
-
-        if round_winner.points >= self.settings.points_to_win:
-            await self.end_game(game_winner=round_winner)
-        else:
-            await asyncio.sleep(5)
-            await self.start_round()
-
-    async def start_next_turn(self):
-        """
-        Starts the next player's turn.
-        """
-        self.status.num_turns += 1
-        self.turn_uuid = uuid.uuid4()
-
-        if self.current_player is None:
-            self.current_player = self.players.first
-        elif self.skip_next_player:
-            self.current_player = self.walk_players(self.current_player, 2)
-            self.skip_next_player = False
-        else:
-            self.current_player = self.walk_players(self.current_player, 1)
-
-        embed = discord.Embed(
-            title="New Turn",
-            description=f"It's {posessive(self.current_player.value.user.name)} turn. "
-            f"Make your move with `/uno play`.",
-            color=support.Color.white(),
-        )
-
-        embed.set_thumbnail(url=self.current_player.value.user.display_avatar.url)
-
-        await self.thread.send(
-            content=f"{self.current_player.value.user.mention}, it's your turn.",
-            embed=embed,
-        )
-        await self.turn_timer()
-
-    async def end_turn(self):
-        """
-        End the current player's turn.
-        """
-        if self.turn_record:
-            await self.thread.send(embeds=self.turn_record)
-
-        self.status.previous_turn_record = self.turn_record.copy()
-        self.turn_record.clear()
-
-        round_winner = discord.utils.find(
-            lambda player: len(player.hand) == 0, self.players.itervalues()
-        )
-
-        if round_winner:
-            await self.end_round(round_winner=round_winner)
-        else:
-            await self.start_next_turn()
+        await self.processor.process(self.engine.start_round())
 
     async def end_game(self, game_winner: uno.UnoPlayer):
         """
@@ -458,14 +346,24 @@ class UnoGame(HostedGame):
         await asyncio.sleep(60)
         await self.thread.delete()
 
-    async def turn_timer(self):
+    async def turn_timer(self, *, resume: bool = False):
         """
         Enforces a time limit on how long players can take to move.
+
+        Parameters
+        ----------
+        resume : bool
+            Whether to count down to the existing :attr:`turn_deadline` rather than setting a new one, as when a game
+            is restored from a snapshot.
         """
         # before the timer is set, the turn's unique identifier is recorded
         turn_uuid = self.turn_uuid
 
-        await asyncio.sleep(support.fuzz(self.settings.timeout))
+        if not resume:
+            self.turn_deadline = time.time() + support.fuzz(self.settings.timeout)
+            self.checkpoint()
+
+        await asyncio.sleep(max(self.turn_deadline - time.time(), 0))
 
         # if, after the timer is up, the uuid of the current turn is still the same as the one recorded
         # by the timer, the player times out
@@ -474,52 +372,19 @@ class UnoGame(HostedGame):
             and self.retrieve_game(self.thread.id)
             and self.current_player
         ):
-            player: uno.UnoPlayer = self.current_player.value
-            player.timeout_counter += 1
-
-            # if *every* player times out consecutively, the game is force closed for inactivity
-            if sum(
-                player.timeout_counter for player in self.players.itervalues()
-            ) >= len(self.players):
-                await self.force_close(reason="inactivity")
-
-            # if the player has timed out for three turns in a row, they are removed from the game for inactivity
-            elif player.timeout_counter == 3:
-                embed = discord.Embed(
-                    title=f"{player.user.name} timed out.",
-                    description=f"{player.user.name} was removed from the game for inactivity.",
-                    color=support.Color.error(),
-                )
-                await self.thread.send(embed=embed)
-
-                embed = discord.Embed(
-                    title=f"You timed out of {posessive(self.host.name)} UNO game.",
-                    description=f"You were removed from {self.host.name}'s UNO game in "
-                    f"{self.guild.name} for inactivity.",
-                    color=support.Color.error(),
-                )
-                await player.user.send(embed=embed)
-
-                await self.remove_player(self.current_player)
-
-            # if neither of the above conditions are met, the player is forced to draw a card and forfeit their turn
-            else:
-                await self.processor.turn_timeout_event(player=player)
-                await player.end_turn()
+            # the engine decides whether the player draws a card, is removed for inactivity, or takes the whole game
+            # down with them
+            await self.processor.process(self.engine.time_out())
 
     def is_card_playable(self, card: uno.UnoCard):
         """
         Determine whether an :class:`uno.UnoCard` can be played on the current turn.
         """
-        return (
-            self.card_in_play is None
-            or card.versus_color is self.card_in_play.versus_color
-            or card.versus_suit is self.card_in_play.versus_suit
-            or card.color is uno.UnoCardColor.WILD
-        )
+        return self.engine.is_playable(card)
 
     async def transfer_host(self, new_host: discord.User):
         old_host = self.host
+        self.engine.host = self.retrieve_player(new_host)
         await super().transfer_host(new_host)
 
         if self.voice_channel:
@@ -549,7 +414,7 @@ class UnoGame(HostedGame):
         )
 
         await self.thread.send(embed=embed)
-        await self.remove_player(player_node)
+        await self.remove_player(player_node, "kicked")
 
         embed = discord.Embed(
             title=f"You were kicked from {posessive(self.host.name)} UNO game.",
@@ -608,7 +473,7 @@ class UnoGameSettings:
 @define
 class UnoEventProcessor:
     """
-    Processes game events.
+    Turns the events returned by :class:`uno.UnoEngine` into messages.
 
     Parameters
     ----------
@@ -617,26 +482,102 @@ class UnoEventProcessor:
 
     game: uno.UnoGame
 
-    async def card_played_event(
-        self, player: uno.UnoPlayer, card: uno.UnoCard, with_draw: bool = False
-    ):
+    async def process(self, events: list[uno.UnoEvent]):
         """
-        The handler for the event of playing a card.
+        Handle events in the order they happened.
 
         Parameters
         ----------
-        player: :class:`uno.UnoPlayer`
-            The player who played the card.
-        card: :class:`uno.UnoCard`
-            The card that was played.
-        with_draw: :class:`bool`
-            Whether the card was played in conjunction with a draw.
+        events : list[uno.UnoEvent]
+            The events.
+        """
+        for event in events:
+            match event:
+                case uno.RoundStarted():
+                    await self.round_started_event(event)
+                case uno.TurnStarted():
+                    await self.turn_started_event(event)
+                case uno.CardPlayed():
+                    await self.card_played_event(event)
+                case uno.CardsDrawn():
+                    await self.cards_drawn_event(event)
+                case uno.PlayerSkipped():
+                    await self.skip_event(event)
+                case uno.TurnOrderReversed():
+                    await self.reverse_event(event)
+                case uno.UnoSaid():
+                    await self.say_uno_event(event)
+                case uno.CalledOut():
+                    await self.callout_event(event)
+                case uno.TurnEnded():
+                    await self.turn_ended_event(event)
+                case uno.RoundWon():
+                    await self.round_won_event(event)
+                case uno.GameWon():
+                    await self.game.end_game(game_winner=event.player)
+                case uno.PlayerRemoved():
+                    await self.player_removed_event(event)
+                case uno.GameClosed():
+                    await self.game.force_close(reason=event.reason)
+
+    async def round_started_event(self, event: uno.RoundStarted):
+        """
+        The handler for the event of a round starting.
+        """
+        self.game.status.previous_turn_record.clear()
+
+        msg = f"Round {event.number} has begun!"
+        if event.number == 1:
+            msg += " Seven cards have been dealt to each player. Check them out with `/uno play > View Hand`."
+        else:
+            msg += (
+                " Any cards you had at the end of the previous round have been taken, and seven new cards have "
+                "been dealt to each player. Check them out with `/uno play > View Hand`."
+            )
+
+        embed = discord.Embed(
+            title=f"Round {event.number}: Start!",
+            description=msg,
+            color=support.Color.mint(),
+        )
+
+        await self.game.thread.send(embed=embed)
+
+    async def turn_started_event(self, event: uno.TurnStarted):
+        """
+        The handler for the event of a player's turn starting.
+        """
+        player: uno.UnoPlayer = event.player
+
+        self.game.status.num_turns += 1
+        self.game.turn_uuid = uuid.uuid4()
+
+        embed = discord.Embed(
+            title="New Turn",
+            description=f"It's {posessive(player.user.name)} turn. "
+            f"Make your move with `/uno play`.",
+            color=support.Color.white(),
+        )
+
+        embed.set_thumbnail(url=player.user.display_avatar.url)
+
+        await self.game.thread.send(
+            content=f"{player.user.mention}, it's your turn.",
+            embed=embed,
+        )
+        await self.game.turn_timer()
+
+    async def card_played_event(self, event: uno.CardPlayed):
         """
-        self.game.card_in_play = card
+        The handler for the event of playing a card.
+        """
+        player: uno.UnoPlayer = event.player
+        card = event.card
+        player.num_cards_played += 1
 
         embed = discord.Embed(
-            title=f"Card {'Drawn and ' if with_draw else ''}Played",
-            description=f"**{player.user.name}** {'draws and' if with_draw else ''} "
+            title=f"Card {'Drawn and ' if event.with_draw else ''}Played",
+            description=f"**{player.user.name}** {'draws and' if event.with_draw else ''} "
             f"plays a **{str(card)}**.",
             color=card.embed_color,
         )
@@ -649,18 +590,24 @@ class UnoEventProcessor:
 
         self.game.turn_record.append(embed)
 
-        if card.color is uno.UnoCardColor.WILD:
-            await self.wild_event(player=player)
+        # a Wild card played as a player's last card doesn't change the color in play
+        if card.color is uno.UnoCardColor.WILD and card.transformation:
+            await self.wild_event(player=player, card=card)
+
+    async def cards_drawn_event(self, event: uno.CardsDrawn):
+        """
+        The handler for the event of a player drawing cards, for whatever reason.
+        """
+        player: uno.UnoPlayer = event.player
+        player.count_cards_drawn(len(event.cards))
 
-        match card.suit:
-            case uno.UnoCardSuit.DRAW_TWO:
-                await self.draw_two_event()
-            case uno.UnoCardSuit.DRAW_FOUR:
-                await self.draw_four_event()
-            case uno.UnoCardSuit.SKIP:
-                await self.skip_event()
-            case uno.UnoCardSuit.REVERSE:
-                await self.reverse_event()
+        match event.reason:
+            case "draw":
+                await self.card_drawn_event(player=player)
+            case "penalty":
+                await self.penalty_event(player=player, num_cards=len(event.cards))
+            case "timeout":
+                await self.turn_timeout_event(player=player)
 
     async def card_drawn_event(self, player: uno.UnoPlayer):
         """
@@ -685,74 +632,54 @@ class UnoEventProcessor:
 
         self.game.turn_record.append(embed)
 
-    async def draw_two_event(self):
-        """
-        The handler for the event of a +2 card being played.
+    async def penalty_event(self, player: uno.UnoPlayer, num_cards: int):
         """
-        self.game.skip_next_player = True
-
-        next_player: uno.UnoPlayer = self.game.walk_players(
-            self.game.current_player, 1, use_value=True
-        )
-        await next_player.add_cards(2)
-
-        self.game.turn_record[-1].add_field(
-            name="🎬 Take Two!",
-            value=f"**{next_player.name}** draws two cards and "
-            f"forfeits {next_player.pronoun('their')} turn.",
-            inline=False,
-        )
+        The handler for the event of a player drawing cards because of a +2 or +4 card.
 
-    async def draw_four_event(self):
-        """
-        The handler for the event of a +4 card being played.
+        Parameters
+        ----------
+        player: :class:`uno.UnoPlayer`
+            The player who drew the cards.
+        num_cards: :class:`int`
+            The number of cards they drew.
         """
-        self.game.skip_next_player = True
-
-        next_player: uno.UnoPlayer = self.game.walk_players(
-            self.game.current_player, 1, use_value=True
-        )
-        await next_player.add_cards(4)
+        if num_cards == 4:
+            name, count = "🍀 Four Score!", "four"
+        else:
+            name, count = "🎬 Take Two!", "two"
 
         self.game.turn_record[-1].add_field(
-            name="🍀 Four Score!",
-            value=f"**{next_player.name}** draws four cards and "
-            f"forfeits {next_player.pronoun('their')} turn.",
+            name=name,
+            value=f"**{player.name}** draws {count} cards and "
+            f"forfeits {player.pronoun('their')} turn.",
             inline=False,
         )
 
-    async def skip_event(self):
+    async def skip_event(self, event: uno.PlayerSkipped):
         """
-        The handler for the event of a Skip card being played.
+        The handler for the event of a player's turn being skipped.
         """
-        self.game.skip_next_player = True
-
-        skipped_player = self.game.walk_players(
-            self.game.current_player, 1, use_value=True
-        )
+        # +2 and +4 cards skip the next player too, but their handler already says so
+        if self.game.card_in_play.suit is not uno.UnoCardSuit.SKIP:
+            return
 
         self.game.turn_record[-1].add_field(
             name="⏩ Fast Forward!",
-            value=f"**{posessive(skipped_player.user.name)}** turn is skipped.",
+            value=f"**{posessive(event.player.user.name)}** turn is skipped.",
             inline=False,
         )
 
-    async def reverse_event(self):
+    async def reverse_event(self, event: uno.TurnOrderReversed):
         """
         The handler for the event of a Reverse card being played.
         """
-        self.game.reverse_turn_order = not self.game.reverse_turn_order
-
-        if len(self.game.players) == 2:
-            self.game.skip_next_player = True
-
         self.game.turn_record[-1].add_field(
             name="🔄 Reverse, Reverse!",
             value="The turn order is reversed.",
             inline=False,
         )
 
-    async def wild_event(self, player: uno.UnoPlayer):
+    async def wild_event(self, player: uno.UnoPlayer, card: uno.UnoCard):
         """
         The handler for the event of a Wild card being played.
 
@@ -760,10 +687,9 @@ class UnoEventProcessor:
         ----------
         player: :class:`uno.UnoPlayer`
             The player who played the Wild card.
+        card: :class:`uno.UnoCard`
+            The Wild card.
         """
-
-        card = self.game.card_in_play
-
         color_emoji = {
             uno.UnoCardColor.RED: "🔴",
             uno.UnoCardColor.BLUE: "🔵",
@@ -777,17 +703,12 @@ class UnoEventProcessor:
             inline=False,
         )
 
-    async def say_uno_event(self, player: uno.UnoPlayer):
+    async def say_uno_event(self, event: uno.UnoSaid):
         """
         The handler for the event of a a player saying 'UNO!'.
-
-        Parameters
-        ----------
-        player: :class:`uno.UnoPlayer`
-            The player who said 'UNO!'.
         """
-        player.can_say_uno = False
-        player.has_said_uno = True
+        player: uno.UnoPlayer = event.player
+        self.game.checkpoint()
 
         embed = discord.Embed(
             title=f"{player.name} says UNO!",
@@ -803,8 +724,6 @@ class UnoEventProcessor:
 
         :param player: The player whose turn timed out.
         """
-        await player.add_cards(1)
-
         embed = discord.Embed(
             title=f"{player.name} timed out.",
             description=f"{player.mention} took too long to move and was forced to draw a card.",
@@ -813,24 +732,12 @@ class UnoEventProcessor:
 
         self.game.turn_record.append(embed)
 
-    async def callout_event(
-        self,
-        challenger: uno.UnoPlayer,
-        target: uno.UnoPlayer,
-        callout_success: bool,
-    ):
+    async def callout_event(self, event: uno.CalledOut):
         """
         The handler for the event of a player calling out another player.
-
-        Parameters
-        ----------
-        challenger: :class:`uno.UnoPlayer`
-            The player making the callout.
-        target: :class:`uno.UnoPlayer`
-            The player being called out.
-        callout_success: :class:`bool`
-            Whether or not the callout was successful.
         """
+        challenger: uno.UnoPlayer = event.challenger
+        target: uno.UnoPlayer = event.target
 
         msg = (
             f"{challenger} calls out {target} for having one card left and failing to say "
@@ -843,9 +750,7 @@ class UnoEventProcessor:
             color=support.Color.violet(),
         )
 
-        if callout_success:
-            await target.add_cards(2)
-
+        if event.success:
             field = (
                 f"{target} draws two cards.\n"
                 f"\n"
@@ -854,10 +759,9 @@ class UnoEventProcessor:
 
             embed.add_field(name="The callout succeeds!", value=field)
 
+            self.game.checkpoint()
             await self.game.thread.send(embed=embed)
         else:
-            await challenger.add_cards(1)
-
             field = (
                 f"{challenger} draws a card and "
                 f"forfeits {challenger.pronoun('their')} turn."
@@ -866,3 +770,96 @@ class UnoEventProcessor:
             embed.add_field(name="The callout fails!", value=field)
 
             self.game.turn_record.append(embed)
+
+    async def turn_ended_event(self, event: uno.TurnEnded):
+        """
+        The handler for the event of a player's turn ending.
+        """
+        await event.player.terminate_views()
+
+        if self.game.turn_record:
+            await self.game.thread.send(embeds=self.game.turn_record)
+
+        self.game.status.previous_turn_record = self.game.turn_record.copy()
+        self.game.turn_record.clear()
+
+    async def round_won_event(self, event: uno.RoundWon):
+        """
+        The handler for the event of a player winning a round.
+        """
+        round_winner: uno.UnoPlayer = event.player
+        self.game.turn_deadline = None
+
+        winner_rank = self.game.status.get_player_ranking(round_winner)
+
+        msg = (
+            f"Congratulations, {round_winner.mention}! You won Round {self.game.current_round}!\n"
+            f"\n"
+            f"Based on the cards everyone else is holding, {round_winner.name} has been awarded "
+            f"**{event.points} points**.\n"
+            f"\n"
+            f"{round_winner.name} currently has **{round_winner.points} points**, putting "
+            f"{round_winner.pronoun('them')} in **{winner_rank} place**"
+        )
+
+        if (point_gap := self.game.settings.points_to_win - round_winner.points) > 0:
+            msg += f"—{inflect.no('point', point_gap)} away from winning the game"
+
+        msg += ". To view the full leaderboard, use `/uno status`."
+
+        embed = discord.Embed(
+            title=f"Round {self.game.current_round}: Over! {round_winner.user.name} Wins!",
+            description=msg,
+            color=support.Color.mint(),
+        )
+
+        embed.set_thumbnail(url=round_winner.user.display_avatar.url)
+
+        await self.game.thread.send(content="@everyone", embed=embed)
+
+        # a round that wins the game is followed by a GameWon event instead of another round
+        if self.game.engine.phase == "between":
+            self.game.checkpoint()
+            await asyncio.sleep(5)
+            await self.game.start_round()
+
+    async def player_removed_event(self, event: uno.PlayerRemoved):
+        """
+        The handler for the event of a player leaving the game, for whatever reason.
+        """
+        player: uno.UnoPlayer = event.player
+
+        if event.reason == "inactive":
+            embed = discord.Embed(
+                title=f"{player.user.name} timed out.",
+                description=f"{player.user.name} was removed from the game for inactivity.",
+                color=support.Color.error(),
+            )
+            await self.game.thread.send(embed=embed)
+
+            embed = discord.Embed(
+                title=f"You timed out of {posessive(self.game.host.name)} UNO game.",
+                description=f"You were removed from {self.game.host.name}'s UNO game in "
+                f"{self.game.guild.name} for inactivity.",
+                color=support.Color.error(),
+            )
+            await player.user.send(embed=embed)
+
+        embed = discord.Embed(
+            title="A player has left the game.",
+            description=f"{player.user.mention} has left the game.",
+            color=support.Color.error(),
+        )
+
+        await self.game.thread.send(embed=embed)
+
+        self.game.unseat_player(
+            self.game.retrieve_player(player.user, return_node=True)
+        )
+        self.game.checkpoint()
+
+        if self.game.voice_channel and player.user in self.game.voice_channel.members:
+            await player.user.move_to(None)
+            await self.game.voice_channel.set_permissions(
+                target=player.user, overwrite=None
+            )
@@ -9,7 +9,6 @@ from __future__ import annotations
 import discord
 from attr import define
 from discord.ext import pages as discord_pages
-from sortedcontainers import SortedKeyList
 
 import support
 from cogs import uno
@@ -32,7 +31,7 @@ class UnoPlayer(PlayerVoiceMixin, BasePlayer):
     ----------
     points: :class:`int`
         The number of points the player has.
-    hand : :class:`SortedKeyList[UnoCard]`
+    hand : :class:`UnoHand`
         The cards in the player's posession.
     can_say_uno: :class:`bool`
         Whether the player can say "UNO!".
@@ -51,9 +50,7 @@ class UnoPlayer(PlayerVoiceMixin, BasePlayer):
         super().__attrs_post_init__()
 
         self.points: int = 0
-        self.hand: SortedKeyList[uno.UnoCard] = SortedKeyList(
-            key=lambda card: card.sortcode
-        )
+        self.hand = uno.UnoHand()
         self.can_say_uno = False
         self.has_said_uno = False
         self.terminable_views: list[uno.UnoTerminableView] = []
@@ -150,29 +147,19 @@ class UnoPlayer(PlayerVoiceMixin, BasePlayer):
             else:
                 await self.play_card(selected_card)
 
-    async def play_card(self, card: uno.UnoCard, with_draw: bool = False):
+    async def play_card(self, card: uno.UnoCard):
         """
         Play an UNO card.
 
         Parameters
         ----------
         card: :class:`UnoCard`
-            The card to play.
-        with_draw: :class:`bool`
-            Whether the card is being played automatically after being drawn.
+            The card to play. Wild cards change the color in play to their :attr:`UnoCard.transformation`.
         """
-        await self.reset_timeouts()
-
-        # remove the card from the player's hand
-        self.hand.remove(card)
-        self.num_cards_played += 1
-
-        await self.game.processor.card_played_event(
-            player=self, card=card, with_draw=with_draw
+        await self.game.processor.process(
+            self.game.engine.play(self, card, card.transformation)
         )
 
-        await self.end_turn()
-
     async def draw_card(self, ctx: discord.ApplicationContext):
         """
         Draws an UNO card.
@@ -186,18 +173,12 @@ class UnoPlayer(PlayerVoiceMixin, BasePlayer):
         await view.draw_card()
 
         if view.success:
-            await self.reset_timeouts()
+            events = self.game.engine.draw(self, autoplay=view.autoplay)
+            drawn: uno.CardsDrawn = events[0]
+            card = drawn.cards[0]
 
-            drawn_card = await self.add_cards(1)
-
-            card = drawn_card[0]
-
-            if (
-                view.autoplay
-                and self.game.is_card_playable(card)
-                and card.color is not uno.UnoCardColor.WILD
-            ):
-                # play the card if it can be played on the current turn and isn't a wild or wild draw four
+            if drawn.reason == "autoplay":
+                # the card was playable on the current turn and wasn't a wild or wild draw four, so it was played
                 embed = discord.Embed(
                     title="Card Drawn and Played",
                     description=f"You drew and played a **{str(card)}**.",
@@ -207,7 +188,7 @@ class UnoPlayer(PlayerVoiceMixin, BasePlayer):
 
                 await ctx.interaction.edit_original_response(embeds=[embed], view=None)
 
-                if len(self.hand) - 1 == 1:
+                if len(self.hand) == 1:
                     embed = discord.Embed(
                         title="One Card Remaining",
                         description="You'll need to say 'UNO!' or risk being called out by "
@@ -216,8 +197,6 @@ class UnoPlayer(PlayerVoiceMixin, BasePlayer):
                     )
 
                     await ctx.interaction.followup.send(embed=embed, ephemeral=True)
-
-                await self.play_card(card, with_draw=True)
             else:
                 embed = discord.Embed(
                     title="Card Drawn",
@@ -228,9 +207,7 @@ class UnoPlayer(PlayerVoiceMixin, BasePlayer):
 
                 await ctx.interaction.edit_original_response(embeds=[embed], view=None)
 
-                await self.game.processor.card_drawn_event(player=self)
-
-                await self.end_turn()
+            await self.game.processor.process(events)
         elif view.success is False:
             msg = "Okay! Make your move whenever you're ready."
             await ctx.interaction.edit_original_response(
@@ -241,7 +218,7 @@ class UnoPlayer(PlayerVoiceMixin, BasePlayer):
         """
         Say 'UNO!'.
         """
-        await self.game.processor.say_uno_event(player=self)
+        await self.game.processor.process(self.game.engine.say_uno(self))
 
     async def callout(self, ctx: discord.ApplicationContext):
         """
@@ -252,18 +229,15 @@ class UnoPlayer(PlayerVoiceMixin, BasePlayer):
         ctx: :class:`discord.ApplicationContext`
         """
         target = await uno.UnoCalloutView(ctx=ctx).present()
+        events = self.game.engine.callout(self, target)
+        callout: uno.CalledOut = events[0]
 
-        if target.can_say_uno and not target.has_said_uno:
+        if callout.success:
             embed = discord.Embed(
                 title="The callout succeeds!",
                 description=f"{target.user.name} draws two cards.",
                 color=support.Color.green(),
             )
-
-            await ctx.interaction.edit_original_response(embeds=[embed], view=None)
-            await self.game.processor.callout_event(
-                challenger=self, target=target, callout_success=True
-            )
         else:
             embed = discord.Embed(
                 title="The callout fails.",
@@ -271,53 +245,57 @@ class UnoPlayer(PlayerVoiceMixin, BasePlayer):
                 color=support.Color.brand_red(),
             )
 
-            await ctx.interaction.edit_original_response(embeds=[embed], view=None)
-            await self.game.processor.callout_event(
-                challenger=self, target=target, callout_success=False
-            )
-            await self.end_turn()
+        await ctx.interaction.edit_original_response(embeds=[embed], view=None)
+        await self.game.processor.process(events)
 
-    async def add_cards(self, num_cards):
+    def count_cards_drawn(self, num_cards: int):
         """
-        Add cards to the player's hand.
+        Add to the number of cards the player has drawn.
 
         Parameters
         ----------
         num_cards: :class:`int`
-            The number of cards to add.
-        """
-        new_cards = uno.UnoCard.generate_cards(num_cards)
-
-        self.num_cards_drawn += num_cards
-
-        self.hand.update(new_cards)
-
-        self.can_say_uno = False
-        self.has_said_uno = False
-
-        return new_cards
-
-    async def reset_timeouts(self):
-        """
-        Resets the player's timeout counter to 0.
+            The number of cards drawn.
         """
-        self.timeout_counter = 0
+        self._num_cards_drawn += num_cards
 
-    async def end_turn(self):
+    async def terminate_views(self):
         """
-        Ends the player's turn.
+        Stop any views the player has open, as when their turn ends.
         """
         for view in self.terminable_views:
             if not view.is_finished():
                 await view.full_stop()
 
-        if len(self.hand) == 1 and not self.has_said_uno:
-            self.can_say_uno = True
-
-        await self.game.end_turn()
-
         self.terminable_views.clear()
 
+    def snapshot(self) -> dict:
+        """
+        Serialize the player's state for :meth:`uno.UnoGame.snapshot`.
+        """
+        return {
+            "id": self.user.id,
+            "points": self.points,
+            "hand": [card.snapshot() for card in self.hand],
+            "can_say_uno": self.can_say_uno,
+            "has_said_uno": self.has_said_uno,
+            "timeout_counter": self.timeout_counter,
+            "num_cards_played": self.num_cards_played,
+            "num_cards_drawn": self._num_cards_drawn,
+        }
+
+    def load_snapshot(self, data: dict):
+        """
+        Restore the player's state from a snapshot made by :meth:`snapshot`.
+        """
+        self.points = data["points"]
+        self.hand.update(uno.UnoCard.from_snapshot(card) for card in data["hand"])
+        self.can_say_uno = data["can_say_uno"]
+        self.has_said_uno = data["has_said_uno"]
+        self.timeout_counter = data["timeout_counter"]
+        self.num_cards_played = data["num_cards_played"]
+        self._num_cards_drawn = data["num_cards_drawn"]
+
     @property
     def hand_value(self):
         """
@@ -343,9 +321,5 @@ class UnoPlayer(PlayerVoiceMixin, BasePlayer):
         # d2 = d1 - (7 * round_number) OR d2 = 0, whichever is higher
         return max(self._num_cards_drawn - (7 * self.game.current_round), 0)
 
-    @num_cards_drawn.setter
-    def num_cards_drawn(self, value):
-        self._num_cards_drawn += value
-
     def __str__(self):
         return self.user.name
@@ -9,7 +9,6 @@ from __future__ import annotations
 import discord
 from attr import define
 from elysia import Fields
-from sortedcontainers import SortedKeyList
 
 from cogs import uno
 from cogs.uno.models import inflect
@@ -49,12 +48,7 @@ class UnoStatusTracker:
         -----
         This method's output is affected by whether the turn order is currently reversed.
         """
-        turn_order = [self.game.current_player]
-
-        for _ in range(len(self.game.players) - 1):
-            turn_order.append(self.game.walk_players(turn_order[-1], 1))
-
-        return [player.value for player in turn_order]
+        return self.game.engine.turn_order()
 
     def get_last_turn(self) -> list[discord.Embed]:
         """
@@ -72,20 +66,7 @@ class UnoStatusTracker:
         this method returns a list of lists of :class:`uno.UnoPlayer` objects - players who have the same score
         are grouped together in the same sub-list.
         """
-        point_order = reversed(
-            SortedKeyList(self.game.players.itervalues(), key=lambda p: p.points)
-        )
-
-        leaderboard = []
-        determinant = 0
-        for player in point_order:
-            if not leaderboard or player.points < determinant:
-                determinant = player.points
-                leaderboard.append([player])
-            else:
-                leaderboard[-1].append(player)
-
-        return leaderboard
+        return self.game.engine.standings()
 
     def get_player_ranking(self, player, *, with_desc=False) -> str:
         """
@@ -98,14 +79,12 @@ class UnoStatusTracker:
         with_desc: :class:`bool`
             If True, this function returns an extended description of the player's ranking.
         """
-        leaderboard_group = discord.utils.find(
-            lambda group: player in group, self.get_leaderboard()
-        )
-        ranking = inflect.ordinal(self.get_leaderboard().index(leaderboard_group) + 1)
+        leaderboard = self.game.engine.leaderboard
+        ranking = inflect.ordinal(leaderboard.place(player))
 
         if with_desc:
             ranking += f" of {len(self.game.players)}"
-            ties = len(leaderboard_group) - 1
+            ties = len(leaderboard.tied(player)) - 1
 
             if ties:
                 ranking += f" (tied with {inflect.no('other', ties)})"
@@ -207,17 +207,11 @@ class UnoCardSelectView(UnoTerminableView):
         A callback for a button that switches the menu to only show cards that can played this round.
         """
 
-        playable_cards = [
-            card for card in self.cards if self.game.is_card_playable(card)
-        ]
+        playable_cards = self.game.engine.playable(self.player)
+
         if playable_cards:
             self.paginator = self.UnoCardSelectPaginator(
-                pages=dllist(
-                    [
-                        playable_cards[i : i + 23]
-                        for i in range(0, len(playable_cards), 23)
-                    ]
-                )
+                pages=dllist(support.split_list(playable_cards, 23))
             )
 
             card_menu = self.get_menu()
@@ -30,3 +30,29 @@ class ChessGame(db.Entity):
         return cls.select(lambda g: g.user_id == str(user.id)).order_by(
             lambda g: desc(g.date_saved)
         )
+
+
+class ChessCorrespondence(db.Entity):
+    thread_id = PrimaryKey(str)
+    guild_id = Required(str)
+    white_id = Required(str)
+    black_id = Required(str)
+    saving_enabled = Required(bool)
+    text_board = Required(bool, default=False)
+    fen = Required(str)
+    moves = Optional(str, default="")
+    draw_proposer_id = Optional(str, nullable=True)
+    deadline = Required(datetime)
+    date_started = Required(datetime, default=datetime.utcnow)
+
+    @classmethod
+    def get_overdue_games(cls, now: datetime):
+        return cls.select(lambda g: g.deadline < now)
+
+
+class GameSnapshot(db.Entity):
+    thread_id = PrimaryKey(str)
+    kind = Required(str, index=True)
+    version = Required(int)
+    data = Required(LongStr)
+    date_saved = Required(datetime, default=datetime.utcnow)
@@ -12,8 +12,10 @@ A shortcut to certain names from the typing module.
 from typing import (
     Annotated,
     Any,
+    AsyncIterator,
     Callable,
     ClassVar,
+    Hashable,
     Iterable,
     Iterator,
     Optional,
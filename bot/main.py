@@ -8,13 +8,15 @@
 The program entrypoint.
 """
 import logging
+import sys
+import threading
 import warnings
 
-import nest_asyncio as nest
 import nltk
 from click import secho as print
 
 import clockworks
+import support
 from bot import bot
 from database.models import db
 from gps import Routes
@@ -39,8 +41,20 @@ def suppress_warnings():
 
 
 def configure_nltk():
-    for corpus in settings.nltk_corpora:
-        nltk.download(corpus, quiet=True)
+    def load_tagger():
+        # the Docker image comes with NLTK's data preinstalled, so this is only necessary outside of it
+        if not support.Tagger.installed():
+            for corpus in settings.nltk_corpora:
+                nltk.download(corpus, quiet=True)
+
+        try:
+            support.Tagger.load()
+        except LookupError:
+            sys.excepthook(*sys.exc_info())
+        else:
+            print(f"NLTK's tagger loaded in {support.Tagger.load_time:.2f} seconds.")
+
+    threading.Thread(target=load_tagger, name="nltk", daemon=True).start()
 
 
 def configure_database():
@@ -66,6 +80,5 @@ if __name__ == "__main__":
     print(f"Hello! {settings.bot_name} will be ready in just a moment.")
     setup()
 
-    nest.apply()
     clockworks.start_clock()
     bot.run(settings.token)
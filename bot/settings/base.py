@@ -29,12 +29,16 @@ class Settings(BaseSettings):
         Extensions to load on startup.
     disabled_cogs : list[discord.Cog], optional, default: []
         Cogs to *not* register on startup.
-    nltk_corpora : list[str], optional, default: ["averaged_perceptron_tagger"]
-        NLTK corpora[3]_ to download on startup.
+    nltk_corpora : list[str], optional, default: ["averaged_perceptron_tagger_eng"]
+        NLTK corpora[3]_ to download on startup if NLTK's part-of-speech tagger isn't already installed. The Docker
+        image installs them at build time.
     token : str, optional, default: BOT_TOKEN environment variable
         3515.games' bot token.
     suppressed_warnings: list[Warning], optional, default: [RuntimeWarning]
         Warnings to suppress[4]_.
+    cah_refresh_hours: int, optional, default: 0
+        How often, in hours, to rebuild the bundled Cards Against Humanity card file from REST Against Humanity. If
+        this is 0, the card file is never rebuilt while 3515.games is running.
 
     References
     ----------
@@ -54,6 +58,7 @@ class Settings(BaseSettings):
     debug_guilds: list[int] = []
     extensions: list[str] = []
     disabled_cogs: list[discord.Cog] = []
-    nltk_corpora: list[str] = ["averaged_perceptron_tagger"]
+    nltk_corpora: list[str] = ["averaged_perceptron_tagger_eng"]
     token: str = Field(..., env="BOT_TOKEN")
     suppressed_warnings: list[type[Warning]] = [RuntimeWarning]
+    cah_refresh_hours: int = 0
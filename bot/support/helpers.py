@@ -183,6 +183,25 @@ def pagimoji(
     ]
 
 
+async def fetch_member(guild: discord.Guild, user_id: int) -> discord.Member:
+    """
+    Get a member of a server from the cache, falling back to the API if they aren't cached.
+
+    Parameters
+    ----------
+    guild : discord.Guild
+        The server.
+    user_id : int
+        The unique identifier of the member.
+
+    Returns
+    -------
+    discord.Member
+        The member.
+    """
+    return guild.get_member(user_id) or await guild.fetch_member(user_id)
+
+
 def split_list(seq: list, size: int) -> list[list]:
     """
     Split a list into smaller lists of the specified size.
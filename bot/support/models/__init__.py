@@ -6,5 +6,10 @@
 
 from support.models.commands import *
 from support.models.games import *
+from support.models.http import *
+from support.models.leaderboard import *
 from support.models.pronouns import *
+from support.models.registry import *
+from support.models.snapshots import *
+from support.models.tagger import *
 from support.models.utils import *
@@ -8,15 +8,15 @@ from __future__ import annotations
 
 import asyncio
 import random
+import time
 from abc import ABC, abstractmethod
 
-import aiohttp
 import discord
 import inflect as ifl
 from attrs import define
 from discord.ext import commands
 from elysia import Fields
-from llist import dllist
+from llist import dllist, dllistnode
 from ordered_set import OrderedSet
 from pydantic import validate_arguments
 
@@ -34,14 +34,23 @@ class ThreadedGame(ABC):
     name: ClassVar[str] = None
     short_name: ClassVar[str] = None
 
+    # games with a snapshot kind are snapshotted as they're played and restored after restarts, and must define a
+    # from_snapshot(thread, data) classmethod that recreates the game from a snapshot made by snapshot(). bumping a
+    # game's snapshot version causes existing snapshots of that game to be discarded rather than restored
+    snapshot_kind: ClassVar[str] = None
+    snapshot_version: ClassVar[int] = 1
+
     guild: discord.Guild = Fields.field(frozen=True)
     thread: discord.Thread = Fields.field(frozen=True)
 
+    expires_at: float = Fields.attr(default=None)
+    turn_deadline: float = Fields.attr(default=None)
+
     # noinspection PyClassVar
     def __attrs_post_init__(self):
         self.short_name = self.short_name or self.name
 
-        self.__games__[self.thread.id] = self
+        support.GameRegistry.register(self)
 
     @classmethod
     def retrieve_game(cls, thread_id) -> Self | None:
@@ -64,10 +73,52 @@ class ThreadedGame(ABC):
         """
         Remove the game from :attr:`__games__`.
         """
-        type(self).__games__.pop(self.thread.id)
+        support.GameRegistry.unregister(self.thread.id)
+
+        if self.snapshot_kind:
+            support.GameSnapshots.discard(self.thread.id)
 
     async def game_timer(self, *, hours: int = 4):
-        await asyncio.sleep(60 * 60 * hours)
+        if not self.expires_at:
+            self.expires_at = time.time() + 60 * 60 * hours
+            self.checkpoint()
+
+        await asyncio.sleep(max(self.expires_at - time.time(), 0))
+
+    def checkpoint(self):
+        """
+        Record that the game's state has changed so that it's included in the next batch of snapshots.
+        """
+        if self.snapshot_kind and self.retrieve_game(self.thread.id):
+            support.GameSnapshots.mark(self)
+
+    def snapshot(self) -> dict:
+        """
+        Serialize the game's state to a dictionary of JSON-compatible values.
+        """
+        return {"expires_at": self.expires_at, "turn_deadline": self.turn_deadline}
+
+    async def load_snapshot(self, data: dict):
+        """
+        Restore the parts of a game's state that ``from_snapshot`` doesn't need to construct it.
+
+        Parameters
+        ----------
+        data : dict
+            The snapshot.
+        """
+        self.expires_at = data["expires_at"]
+        self.turn_deadline = data["turn_deadline"]
+
+    def resume(self):
+        """
+        Re-arm a restored game's timers from the deadlines stored in its snapshot.
+        """
+        if self.expires_at:
+            asyncio.create_task(self.game_timer())
+
+        if self.turn_deadline:
+            asyncio.create_task(self.turn_timer(resume=True))
 
     @abstractmethod
     async def force_close(self, *args, **kwargs):
@@ -114,6 +165,7 @@ class HostedGame(ThreadedGame, ABC):
     host: discord.Member
 
     players: dllist = Fields.attr(factory=dllist)
+    player_nodes: dict[int, dllistnode] = Fields.attr(factory=dict)
     is_joinable: bool = Fields.attr(default=True)
     lobby_intro_msg: discord.Message = Fields.attr(default=None)
     voice_channel: discord.VoiceChannel = Fields.attr(default=None)
@@ -137,9 +189,9 @@ class HostedGame(ThreadedGame, ABC):
             The game where the Game Host is the specified user and that is taking place in the specified server if one
             exists; otherwise None.
         """
-        return discord.utils.find(
-            lambda g: g.host == user and g.guild.id == guild_id,
-            cls.__games__.values(),
+        return next(
+            iter(support.GameRegistry.hosted_by(user.id, guild_id, game_class=cls)),
+            None,
         )
 
     @classmethod
@@ -185,6 +237,110 @@ class HostedGame(ThreadedGame, ABC):
 
         await super().kill()
 
+    def retrieve_player(
+        self, user: discord.User, *, return_node: bool = False
+    ) -> BasePlayer | dllistnode | None:
+        """
+        Retrieve a player from the game given their corresponding :class:`discord.User` object.
+
+        Parameters
+        ----------
+        user : discord.User
+            The player's user object.
+        return_node : bool
+            Whether to return the player's :class:`llist.dllistnode` object rather than the player object itself.
+
+        Returns
+        -------
+        BasePlayer | llist.dllistnode | None
+            The player object, or the node containing it if ``return_node`` is True, if the user is playing in the
+            game; otherwise None.
+        """
+        node = self.player_nodes.get(user.id)
+
+        if return_node or not node:
+            return node
+
+        return node.value
+
+    def seat_player(self, player: BasePlayer) -> dllistnode:
+        """
+        Add a player to the end of :attr:`players`.
+
+        This, :meth:`unseat_player`, and :meth:`shuffle_players` are the only ways :attr:`players` should be changed,
+        since they keep :attr:`player_nodes` and :class:`GameRegistry` in step with it.
+
+        Parameters
+        ----------
+        player : BasePlayer
+            The player.
+
+        Returns
+        -------
+        llist.dllistnode
+            The player's node.
+        """
+        node = self.players.append(player)
+        self.player_nodes[player.user.id] = node
+        support.GameRegistry.join(self, player.user.id)
+
+        return node
+
+    def unseat_player(self, player_node: dllistnode):
+        """
+        Remove a player from :attr:`players`.
+
+        Parameters
+        ----------
+        player_node : llist.dllistnode
+            The player's node.
+        """
+        player = player_node.value
+
+        self.players.remove(player_node)
+        self.player_nodes.pop(player.user.id, None)
+        support.GameRegistry.leave(self, player.user.id)
+
+    def shuffle_players(self):
+        """
+        Shuffle the order of :attr:`players`.
+        """
+        # the players are shuffled between the existing nodes so that references to those nodes stay valid
+        players = list(self.players.itervalues())
+        random.shuffle(players)
+
+        for node, player in zip(self.players.iternodes(), players):
+            node.value = player
+            self.player_nodes[player.user.id] = node
+
+    def player_positions(self) -> dict[int, int]:
+        """
+        Map the user ID of each player to their position in :attr:`players`.
+        """
+        return {player.user.id: i for i, player in enumerate(self.players.itervalues())}
+
+    def snapshot(self) -> dict:
+        return {
+            **super().snapshot(),
+            "host": self.host.id,
+            "is_joinable": self.is_joinable,
+            "lobby_intro_msg": self.lobby_intro_msg.id
+            if self.lobby_intro_msg
+            else None,
+            "voice_channel": self.voice_channel.id if self.voice_channel else None,
+        }
+
+    async def load_snapshot(self, data: dict):
+        await super().load_snapshot(data)
+
+        self.is_joinable = data["is_joinable"]
+        self.voice_channel = self.guild.get_channel(data["voice_channel"] or 0)
+
+        if data["lobby_intro_msg"]:
+            self.lobby_intro_msg = await self.thread.fetch_message(
+                data["lobby_intro_msg"]
+            )
+
     async def game_timer(self, *, hours: int = 4):
         await super().game_timer(hours=hours)
 
@@ -199,6 +355,8 @@ class HostedGame(ThreadedGame, ABC):
         """
         old_host = self.host
         self.host = new_host
+        support.GameRegistry.transfer(self)
+        self.checkpoint()
 
         embed = discord.Embed(
             title="The Game Host has changed!",
@@ -499,18 +657,26 @@ class HostedGame(ThreadedGame, ABC):
         return not self.is_joinable
 
 
-@define
+@define(eq=False)
 class BasePlayer:
     """
     Base class for objects representing players in a game.
+
+    Players are compared by identity, so a player that doesn't define its own equality (see :class:`cah.CAHPlayer`)
+    is hashable.
     """
 
     user: discord.Member = Fields.field(frozen=True)
 
-    genders: OrderedSet[Gender] = Fields.attr()
-
     def __attrs_post_init__(self):
-        self.genders = asyncio.run(self._identeitei_meltdown())
+        support.PronounResolver.prefetch(self.id)
+
+    @property
+    def genders(self) -> OrderedSet[Gender]:
+        """
+        The genders of the pronouns the player's associated user has set on PronounDB.
+        """
+        return support.PronounResolver.get(self.id)
 
     @property
     def name(self) -> str:
@@ -552,17 +718,6 @@ class BasePlayer:
     def pronoun(self, pronoun: Pronoun) -> str:
         return pronoun.transform(random.choice(self.genders))
 
-    async def _identeitei_meltdown(self) -> OrderedSet[Gender]:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                "https://pronoundb.org/api/v1/lookup",
-                params={"platform": "discord", "id": self.id},
-            ) as resp:
-                if resp.status != 200:
-                    return [Gender.NEUTRAL]
-
-                return Gender.decode((await resp.json())["pronouns"])
-
     def __str__(self):
         return self.name
 
@@ -0,0 +1,256 @@
+########################################################################################################################
+#                         Copyright (C) 2023-present celsius narhwal <hello@celsiusnarhwal.dev>                        #
+#  This notice may not be altered or removed except by or with the express written permission of the copyright holder. #
+#                                      For more information, see the COPYING file.                                     #
+########################################################################################################################
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from collections import defaultdict
+
+import aiohttp
+import orjson
+from attrs import define
+from elysia import Fields
+from yarl import URL
+
+from keyboard import *
+
+__all__ = ["HTTPClient", "HostMetrics"]
+
+
+@define
+class HostMetrics:
+    """
+    Request statistics for a single host.
+    """
+
+    requests: int = Fields.attr(default=0)
+    failures: int = Fields.attr(default=0)
+    retries: int = Fields.attr(default=0)
+    total_latency: float = Fields.attr(default=0)
+    max_latency: float = Fields.attr(default=0)
+
+    @property
+    def mean_latency(self) -> float:
+        """
+        The mean latency of requests to the host, in seconds.
+        """
+        return self.total_latency / self.requests if self.requests else 0
+
+    def record(self, latency: float):
+        self.requests += 1
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+
+
+class HTTPClient:
+    """
+    The HTTP client through which all of 3515.games' outbound requests (other than Discord's own) are made.
+
+    Every request shares one connection pool, so connections to the same host are kept alive and reused rather than
+    opened anew for each request. On top of the pool, requests to any single host are limited to ``host_limit`` at
+    a time. Requests that fail because of a connection problem, a timeout, or a 429 or 5xx response are retried up
+    to ``retries`` times, backing off exponentially with full jitter between attempts.
+
+    The client is opened on first use and closed when the bot shuts down.
+    """
+
+    timeout: ClassVar[float] = 10
+    retries: ClassVar[int] = 2
+    backoff: ClassVar[float] = 0.5
+    host_limit: ClassVar[int] = 8
+    pool_limit: ClassVar[int] = 64
+    keepalive: ClassVar[float] = 30
+
+    session: ClassVar[aiohttp.ClientSession] = None
+    limits: ClassVar[dict[str, asyncio.Semaphore]] = {}
+    metrics: ClassVar[defaultdict[str, HostMetrics]] = defaultdict(HostMetrics)
+
+    @classmethod
+    def open(cls) -> aiohttp.ClientSession:
+        """
+        Return the client's session, opening it if necessary.
+        """
+        if not cls.session or cls.session.closed:
+            cls.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=cls.pool_limit, keepalive_timeout=cls.keepalive
+                ),
+                timeout=aiohttp.ClientTimeout(total=cls.timeout),
+                json_serialize=lambda obj: orjson.dumps(obj).decode(),
+            )
+            cls.limits.clear()
+
+        return cls.session
+
+    @classmethod
+    async def close(cls):
+        """
+        Close the client's session and every connection in its pool.
+        """
+        if cls.session and not cls.session.closed:
+            await cls.session.close()
+
+    @classmethod
+    async def request(
+        cls,
+        method: str,
+        url: str,
+        *,
+        timeout: float = None,
+        retries: int = None,
+        **kwargs,
+    ) -> tuple[int, bytes]:
+        """
+        Make a request.
+
+        Parameters
+        ----------
+        method : str
+            The HTTP method.
+        url : str
+            The URL.
+        timeout : float, optional
+            The maximum number of seconds each attempt may take. Defaults to ``timeout``.
+        retries : int, optional
+            The maximum number of times to retry the request. Defaults to ``retries``.
+        **kwargs
+            Keyword arguments to pass to :meth:`aiohttp.ClientSession.request`.
+
+        Returns
+        -------
+        tuple[int, bytes]
+            The status code and body of the response.
+
+        Raises
+        ------
+        ConnectionError
+            If the request could not be completed, even after retrying it.
+        """
+        session = cls.open()
+        host = URL(url).host
+        limit = cls.limits.setdefault(host, asyncio.Semaphore(cls.host_limit))
+        metrics = cls.metrics[host]
+        retries = cls.retries if retries is None else retries
+
+        for attempt in range(retries + 1):
+            if attempt:
+                metrics.retries += 1
+                await asyncio.sleep(random.uniform(0, cls.backoff * 2 ** (attempt - 1)))
+
+            async with limit:
+                start = time.perf_counter()
+
+                try:
+                    async with session.request(
+                        method,
+                        url,
+                        timeout=aiohttp.ClientTimeout(total=timeout or cls.timeout),
+                        **kwargs,
+                    ) as resp:
+                        body = await resp.read()
+                except (aiohttp.ClientError, asyncio.TimeoutError):
+                    metrics.failures += 1
+                    continue
+                finally:
+                    metrics.record(time.perf_counter() - start)
+
+            if resp.status == 429 or resp.status >= 500:
+                metrics.failures += 1
+                continue
+
+            return resp.status, body
+
+        raise ConnectionError(f"{method} {url} failed after {retries + 1} attempts")
+
+    @classmethod
+    async def get_json(cls, url: str, **kwargs) -> Any:
+        """
+        Make a GET request and return its parsed JSON response.
+
+        Parameters
+        ----------
+        url : str
+            The URL.
+        **kwargs
+            Keyword arguments to pass to :meth:`request`.
+
+        Raises
+        ------
+        ConnectionError
+            If the request could not be completed or its response wasn't a successful one.
+        """
+        status, body = await cls.request("GET", url, **kwargs)
+
+        if status != 200:
+            raise ConnectionError(f"GET {url} returned {status}")
+
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError as e:
+            raise ConnectionError(f"GET {url} returned invalid JSON") from e
+
+    @classmethod
+    async def stream(
+        cls, url: str, *, chunk_size: int = 64 * 1024, timeout: float = None, **kwargs
+    ) -> AsyncIterator[bytes]:
+        """
+        Make a GET request and yield its response's body in chunks as they arrive.
+
+        Unlike other requests, streamed requests aren't retried, since the caller may already have consumed part of
+        the body by the time one fails.
+
+        The request holds its host's concurrency slot, and its connection, until the stream is exhausted or closed.
+        Callers that might stop reading early (including by raising an exception) must close the stream themselves,
+        e.g. with :func:`contextlib.aclosing`; otherwise both stay held until the stream is garbage-collected.
+
+        .. code-block:: python
+
+            async with contextlib.aclosing(HTTPClient.stream(url)) as chunks:
+                async for chunk in chunks:
+                    ...
+
+        Parameters
+        ----------
+        url : str
+            The URL.
+        chunk_size : int, default=65536
+            The maximum size of each chunk, in bytes.
+        timeout : float, optional
+            The maximum number of seconds the request may take. Defaults to ``timeout``.
+        **kwargs
+            Keyword arguments to pass to :meth:`aiohttp.ClientSession.get`.
+
+        Raises
+        ------
+        ConnectionError
+            If the request could not be completed or its response wasn't a successful one.
+        """
+        session = cls.open()
+        host = URL(url).host
+        limit = cls.limits.setdefault(host, asyncio.Semaphore(cls.host_limit))
+        metrics = cls.metrics[host]
+
+        async with limit:
+            start = time.perf_counter()
+
+            try:
+                async with session.get(
+                    url,
+                    timeout=aiohttp.ClientTimeout(total=timeout or cls.timeout),
+                    **kwargs,
+                ) as resp:
+                    if resp.status != 200:
+                        raise ConnectionError(f"GET {url} returned {resp.status}")
+
+                    async for chunk in resp.content.iter_chunked(chunk_size):
+                        yield chunk
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                metrics.failures += 1
+                raise ConnectionError(f"GET {url} failed") from e
+            finally:
+                metrics.record(time.perf_counter() - start)
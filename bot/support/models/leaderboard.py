@@ -0,0 +1,103 @@
+########################################################################################################################
+#                         Copyright (C) 2023-present celsius narhwal <hello@celsiusnarhwal.dev>                        #
+#  This notice may not be altered or removed except by or with the express written permission of the copyright holder. #
+#                                      For more information, see the COPYING file.                                     #
+########################################################################################################################
+
+from __future__ import annotations
+
+from attrs import define
+from elysia import Fields
+from sortedcontainers import SortedList
+
+from keyboard import *
+
+__all__ = ["Leaderboard"]
+
+
+@define
+class Leaderboard:
+    """
+    Players ranked by their points.
+
+    The leaderboard is updated whenever a player's points change (see :meth:`update`) rather than being rebuilt
+    whenever it's looked at. Players with the same number of points are tied: they share a place, and the next place
+    goes to whoever has the next-highest number of points. Looking up a player's place takes logarithmic time.
+
+    Players are compared by identity, so they needn't be hashable.
+    """
+
+    # each player's points, by the player's id()
+    entries: dict[int, tuple[Any, int]] = Fields.attr(factory=dict)
+
+    # the players with each point total, in the order they reached it
+    tiers: dict[int, dict[int, Any]] = Fields.attr(factory=dict)
+
+    # every point total that at least one player has, negated so that the highest comes first
+    totals: SortedList[int] = Fields.attr(factory=SortedList)
+
+    def add(self, player: Any, points: int = 0):
+        """
+        Add a player to the leaderboard. If they're already on it, their points are updated.
+        """
+        self.update(player, points)
+
+    def update(self, player: Any, points: int):
+        """
+        Set a player's points, adding them to the leaderboard if they aren't on it.
+        """
+        if id(player) in self.entries:
+            if self.points(player) == points:
+                return
+
+            self.remove(player)
+
+        self.entries[id(player)] = (player, points)
+
+        if points not in self.tiers:
+            self.tiers[points] = {}
+            self.totals.add(-points)
+
+        self.tiers[points][id(player)] = player
+
+    def remove(self, player: Any):
+        """
+        Remove a player from the leaderboard. Nothing happens if they aren't on it.
+        """
+        if not (entry := self.entries.pop(id(player), None)):
+            return
+
+        _, points = entry
+        tier = self.tiers[points]
+        del tier[id(player)]
+
+        if not tier:
+            del self.tiers[points]
+            self.totals.remove(-points)
+
+    def points(self, player: Any) -> int:
+        return self.entries[id(player)][1]
+
+    def place(self, player: Any) -> int:
+        """
+        The player's place on the leaderboard, starting from 1.
+        """
+        return self.totals.index(-self.points(player)) + 1
+
+    def tied(self, player: Any) -> list:
+        """
+        The players with as many points as the player, including the player themselves.
+        """
+        return list(self.tiers[self.points(player)].values())
+
+    def groups(self) -> list[list]:
+        """
+        Every player on the leaderboard, grouped by their point totals, from most points to fewest.
+        """
+        return [list(self.tiers[-total].values()) for total in self.totals]
+
+    def __contains__(self, player: Any):
+        return id(player) in self.entries
+
+    def __len__(self):
+        return len(self.entries)
@@ -4,12 +4,15 @@
 #                                      For more information, see the COPYING file.                                     #
 ########################################################################################################################
 
+import asyncio
+import time
 from enum import StrEnum, auto
 
 import inflect as ifl
 from ordered_set import OrderedSet
 from pydantic import validate_arguments
 
+import support
 from keyboard import *
 
 inflect = ifl.engine()
@@ -63,3 +66,147 @@ class Pronoun(StrEnum):
                 return self.value
             case _:
                 return inflect.singular_noun(self.value, gender=gender.value)
+
+
+class PronounResolver:
+    """
+    Looks up users' pronouns on PronounDB.
+
+    Lookups never block the game that needs them. :meth:`prefetch` queues users to be looked up in the background;
+    users queued around the same time are looked up together in a single bulk request, and a user who is already
+    being looked up is never looked up twice at once. Until a user's pronouns arrive, :meth:`get` refers to them
+    with gender-neutral pronouns.
+
+    Results are cached for ``ttl`` seconds. Users who haven't set their pronouns on PronounDB, or whose lookups
+    failed, are cached for the much shorter ``negative_ttl``.
+    """
+
+    endpoint: ClassVar[str] = "https://pronoundb.org/api/v1/lookup-bulk"
+
+    ttl: ClassVar[float] = 60 * 60 * 6
+    negative_ttl: ClassVar[float] = 60 * 10
+    timeout: ClassVar[float] = 2
+    batch_window: ClassVar[float] = 0.05
+    batch_size: ClassVar[int] = 50
+
+    cache: ClassVar[dict[int, tuple[float, OrderedSet[Gender]]]] = {}
+    pending: ClassVar[dict[int, asyncio.Future]] = {}
+    queued: ClassVar[set[int]] = set()
+    batch_task: ClassVar[asyncio.Task] = None
+
+    @classmethod
+    def peek(cls, user_id: int) -> OrderedSet[Gender] | None:
+        """
+        Return a user's cached pronouns, or None if they aren't cached.
+
+        Parameters
+        ----------
+        user_id : int
+            The unique identifier of the user.
+        """
+        if (entry := cls.cache.get(user_id)) and entry[0] > time.monotonic():
+            return entry[1]
+
+    @classmethod
+    def get(cls, user_id: int) -> OrderedSet[Gender]:
+        """
+        Return a user's cached pronouns. If they aren't cached, they're looked up in the background and gender-neutral
+        pronouns are returned in the meantime.
+
+        Parameters
+        ----------
+        user_id : int
+            The unique identifier of the user.
+        """
+        if (genders := cls.peek(user_id)) is not None:
+            return genders
+
+        cls.prefetch(user_id)
+
+        return OrderedSet([Gender.NEUTRAL])
+
+    @classmethod
+    async def resolve(cls, user_id: int) -> OrderedSet[Gender]:
+        """
+        Return a user's pronouns, waiting for them to be looked up if they aren't cached.
+
+        Parameters
+        ----------
+        user_id : int
+            The unique identifier of the user.
+        """
+        if (genders := cls.peek(user_id)) is not None:
+            return genders
+
+        cls.prefetch(user_id)
+
+        return await asyncio.shield(cls.pending[user_id])
+
+    @classmethod
+    def prefetch(cls, *user_ids: int):
+        """
+        Queue users to be looked up in the background. Users whose pronouns are cached, or who are already being
+        looked up, are skipped.
+
+        Parameters
+        ----------
+        *user_ids : int
+            The unique identifiers of the users.
+        """
+        loop = asyncio.get_running_loop()
+
+        for user_id in user_ids:
+            if user_id not in cls.pending and cls.peek(user_id) is None:
+                cls.pending[user_id] = loop.create_future()
+                cls.queued.add(user_id)
+
+        if cls.queued and not (cls.batch_task and not cls.batch_task.done()):
+            cls.batch_task = asyncio.create_task(cls._drain())
+
+    @classmethod
+    async def _drain(cls):
+        try:
+            await asyncio.sleep(cls.batch_window)
+
+            while cls.queued:
+                batch = [
+                    cls.queued.pop()
+                    for _ in range(min(len(cls.queued), cls.batch_size))
+                ]
+                codes = await cls._lookup(batch)
+                now = time.monotonic()
+
+                for user_id in batch:
+                    code = codes.get(str(user_id), "unspecified")
+                    ttl = cls.negative_ttl if code == "unspecified" else cls.ttl
+                    genders = Gender.decode(code)
+
+                    cls.cache[user_id] = (now + ttl, genders)
+                    cls.pending.pop(user_id).set_result(genders)
+        finally:
+            # if the drain dies unexpectedly, everyone still waiting on it is treated as though their lookup failed,
+            # rather than being left waiting forever
+            expires = time.monotonic() + cls.negative_ttl
+
+            for user_id, future in cls.pending.items():
+                genders = OrderedSet([Gender.NEUTRAL])
+                cls.cache[user_id] = (expires, genders)
+
+                if not future.done():
+                    future.set_result(genders)
+
+            cls.pending.clear()
+            cls.queued.clear()
+
+    @staticmethod
+    async def _lookup(user_ids: list[int]) -> dict[str, str]:
+        # lookups aren't retried, since /pronouns has to respond within Discord's interaction deadline
+        try:
+            return await support.HTTPClient.get_json(
+                PronounResolver.endpoint,
+                params={"platform": "discord", "ids": ",".join(map(str, user_ids))},
+                timeout=PronounResolver.timeout,
+                retries=0,
+            )
+        except ConnectionError:
+            return {}
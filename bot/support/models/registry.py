@@ -0,0 +1,195 @@
+########################################################################################################################
+#                         Copyright (C) 2023-present celsius narhwal <hello@celsiusnarhwal.dev>                        #
+#  This notice may not be altered or removed except by or with the express written permission of the copyright holder. #
+#                                      For more information, see the COPYING file.                                     #
+########################################################################################################################
+
+from __future__ import annotations
+
+from collections import defaultdict
+
+from keyboard import *
+
+__all__ = ["GameRegistry"]
+
+
+class GameRegistry:
+    """
+    Every game in progress, across all game types, keyed by the unique identifier of its thread.
+
+    Alongside the games themselves, the registry keeps secondary indexes of games by server and Game Host, by
+    participating user, and by the parent channel of their threads, so that none of those lookups has to scan every
+    game in progress. Each game's :attr:`ThreadedGame.__games__` is kept in step with the registry.
+
+    Games are registered when they're created and unregistered when they're killed; changes to a game's host or
+    participants must be reported with :meth:`transfer`, :meth:`join`, and :meth:`leave`.
+    """
+
+    games: ClassVar[dict[int, Any]] = {}
+
+    by_host: ClassVar[defaultdict[tuple[int, int], set[int]]] = defaultdict(set)
+    by_user: ClassVar[defaultdict[int, set[int]]] = defaultdict(set)
+    by_channel: ClassVar[defaultdict[int, set[int]]] = defaultdict(set)
+
+    # the keys each game is indexed under, so that it can be unindexed even if the game itself has changed since
+    hosts: ClassVar[dict[int, tuple[int, int]]] = {}
+    participants: ClassVar[dict[int, set[int]]] = {}
+    parents: ClassVar[dict[int, int]] = {}
+
+    @classmethod
+    def register(cls, game):
+        """
+        Add a game to the registry.
+
+        Parameters
+        ----------
+        game : ThreadedGame
+            The game.
+        """
+        thread_id = game.thread.id
+
+        cls.games[thread_id] = game
+        game.__games__[thread_id] = game
+
+        cls.participants[thread_id] = set()
+
+        cls.parents[thread_id] = game.thread.parent_id
+        cls.by_channel[game.thread.parent_id].add(thread_id)
+
+        if host := getattr(game, "host", None):
+            cls._index_host(thread_id, game.guild.id, host.id)
+
+    @classmethod
+    def unregister(cls, thread_id: int):
+        """
+        Remove a game from the registry. Nothing happens if there is no game in the specified thread.
+
+        Parameters
+        ----------
+        thread_id : int
+            The unique identifier of the game's thread.
+        """
+        if not (game := cls.games.pop(thread_id, None)):
+            return
+
+        game.__games__.pop(thread_id, None)
+
+        for user_id in cls.participants.pop(thread_id):
+            cls._unindex(cls.by_user, user_id, thread_id)
+
+        cls._unindex(cls.by_channel, cls.parents.pop(thread_id), thread_id)
+
+        if key := cls.hosts.pop(thread_id, None):
+            cls._unindex(cls.by_host, key, thread_id)
+
+    @classmethod
+    def join(cls, game, user_id: int):
+        """
+        Record that a user has joined a game.
+
+        Parameters
+        ----------
+        game : ThreadedGame
+            The game.
+        user_id : int
+            The unique identifier of the user.
+        """
+        if game.thread.id in cls.participants:
+            cls.participants[game.thread.id].add(user_id)
+            cls.by_user[user_id].add(game.thread.id)
+
+    @classmethod
+    def leave(cls, game, user_id: int):
+        """
+        Record that a user has left a game.
+
+        Parameters
+        ----------
+        game : ThreadedGame
+            The game.
+        user_id : int
+            The unique identifier of the user.
+        """
+        if game.thread.id in cls.participants:
+            cls.participants[game.thread.id].discard(user_id)
+            cls._unindex(cls.by_user, user_id, game.thread.id)
+
+    @classmethod
+    def transfer(cls, game):
+        """
+        Reindex a game under its current Game Host.
+
+        Parameters
+        ----------
+        game : HostedGame
+            The game.
+        """
+        if key := cls.hosts.pop(game.thread.id, None):
+            cls._unindex(cls.by_host, key, game.thread.id)
+            cls._index_host(game.thread.id, game.guild.id, game.host.id)
+
+    @classmethod
+    def hosted_by(cls, user_id: int, guild_id: int, game_class: type = object) -> list:
+        """
+        Return the games of a particular type hosted by a user in a server.
+
+        Parameters
+        ----------
+        user_id : int
+            The unique identifier of the user.
+        guild_id : int
+            The unique identifier of the server.
+        game_class : type[ThreadedGame], optional
+            The type of game to return. Games of any type are returned if this isn't specified.
+        """
+        return cls._select(cls.by_host.get((guild_id, user_id), ()), game_class)
+
+    @classmethod
+    def joined_by(cls, user_id: int, game_class: type = object) -> list:
+        """
+        Return the games of a particular type a user is participating in.
+
+        Parameters
+        ----------
+        user_id : int
+            The unique identifier of the user.
+        game_class : type[ThreadedGame], optional
+            The type of game to return. Games of any type are returned if this isn't specified.
+        """
+        return cls._select(cls.by_user.get(user_id, ()), game_class)
+
+    @classmethod
+    def in_channel(cls, channel_id: int, game_class: type = object) -> list:
+        """
+        Return the games of a particular type whose threads belong to a channel.
+
+        Parameters
+        ----------
+        channel_id : int
+            The unique identifier of the channel.
+        game_class : type[ThreadedGame], optional
+            The type of game to return. Games of any type are returned if this isn't specified.
+        """
+        return cls._select(cls.by_channel.get(channel_id, ()), game_class)
+
+    @classmethod
+    def _select(cls, thread_ids: Iterable[int], game_class: type) -> list:
+        # copied into a list so that callers can kill the games they get back while iterating over them
+        return [
+            cls.games[thread_id]
+            for thread_id in list(thread_ids)
+            if isinstance(cls.games[thread_id], game_class)
+        ]
+
+    @classmethod
+    def _index_host(cls, thread_id: int, guild_id: int, host_id: int):
+        cls.hosts[thread_id] = (guild_id, host_id)
+        cls.by_host[(guild_id, host_id)].add(thread_id)
+
+    @staticmethod
+    def _unindex(index: defaultdict, key, thread_id: int):
+        index[key].discard(thread_id)
+
+        # empty buckets are dropped so that the indexes don't grow with every user and channel ever seen
+        if not index[key]:
+            del index[key]
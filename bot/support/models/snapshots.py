@@ -0,0 +1,190 @@
+########################################################################################################################
+#                         Copyright (C) 2023-present celsius narhwal <hello@celsiusnarhwal.dev>                        #
+#  This notice may not be altered or removed except by or with the express written permission of the copyright holder. #
+#                                      For more information, see the COPYING file.                                     #
+########################################################################################################################
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from datetime import datetime
+
+import discord
+import orjson
+
+import database.models as orm
+import support
+from keyboard import *
+
+__all__ = ["GameSnapshots"]
+
+
+class GameSnapshots:
+    """
+    Keeps snapshots of games in progress in the database so that they survive restarts.
+
+    Games mark themselves as changed with :meth:`ThreadedGame.checkpoint`, which is cheap enough to call after every
+    state change. Changed games are serialized in batches at most once every ``interval`` seconds, however many times
+    they were marked in between, and the batch is written to the database in a worker thread.
+
+    Snapshots are versioned by their game's ``snapshot_version``. A snapshot whose version doesn't match its game's
+    is discarded at startup rather than restored.
+    """
+
+    interval: ClassVar[float] = 2
+
+    dirty: ClassVar[dict[int, Any]] = {}
+    discarded: ClassVar[set[int]] = set()
+    rehydrated: ClassVar[set[str]] = set()
+    flush_task: ClassVar[asyncio.Task] = None
+    lock: ClassVar[asyncio.Lock] = None
+
+    @classmethod
+    def mark(cls, game):
+        """
+        Queue a game to be snapshotted in the next batch.
+
+        Parameters
+        ----------
+        game : ThreadedGame
+            The game.
+        """
+        cls.discarded.discard(game.thread.id)
+        cls.dirty[game.thread.id] = game
+        cls.schedule()
+
+    @classmethod
+    def discard(cls, thread_id: int):
+        """
+        Queue a game's snapshot to be deleted in the next batch.
+
+        Parameters
+        ----------
+        thread_id : int
+            The unique identifier of the game's thread.
+        """
+        cls.dirty.pop(thread_id, None)
+        cls.discarded.add(thread_id)
+        cls.schedule()
+
+    @classmethod
+    def schedule(cls):
+        if not (cls.flush_task and not cls.flush_task.done()):
+            cls.flush_task = asyncio.create_task(cls.flush_later())
+
+    @classmethod
+    async def flush_later(cls):
+        while cls.dirty or cls.discarded:
+            await asyncio.sleep(cls.interval)
+            await cls.flush()
+
+    @classmethod
+    async def flush(cls):
+        """
+        Write every queued snapshot to the database immediately.
+        """
+        cls.lock = cls.lock or asyncio.Lock()
+
+        async with cls.lock:
+            dirty, cls.dirty = cls.dirty, {}
+            discarded, cls.discarded = cls.discarded, set()
+
+            # games are serialized here, on the event loop, so that they can't change mid-snapshot; only encoding and
+            # writing happen in the worker thread
+            rows = []
+
+            for thread_id, game in dirty.items():
+                try:
+                    rows.append(
+                        (
+                            str(thread_id),
+                            game.snapshot_kind,
+                            game.snapshot_version,
+                            game.snapshot(),
+                        )
+                    )
+                except Exception:
+                    sys.excepthook(*sys.exc_info())
+
+            if rows or discarded:
+                await asyncio.to_thread(cls._write, rows, discarded)
+
+    @staticmethod
+    def _write(rows: list[tuple[str, str, int, dict]], discarded: set[int]):
+        with orm.db_session:
+            for thread_id in discarded:
+                orm.GameSnapshot.select(thread_id=str(thread_id)).delete(bulk=True)
+
+            for thread_id, kind, version, data in rows:
+                state = {
+                    "kind": kind,
+                    "version": version,
+                    "data": orjson.dumps(data).decode(),
+                    "date_saved": datetime.utcnow(),
+                }
+
+                if record := orm.GameSnapshot.get(thread_id=thread_id):
+                    record.set(**state)
+                else:
+                    orm.GameSnapshot(thread_id=thread_id, **state)
+
+    @staticmethod
+    def _read(kind: str) -> list[tuple[str, int, str]]:
+        with orm.db_session:
+            return [
+                (record.thread_id, record.version, record.data)
+                for record in orm.GameSnapshot.select(kind=kind)
+            ]
+
+    @classmethod
+    async def rehydrate(cls, bot: discord.Bot, game_class: type) -> list:
+        """
+        Restore every snapshotted game of a particular type and re-arm its timers. This only happens once per type
+        per session, no matter how many times it's called. Types of games that aren't snapshotted (i.e., that have no
+        snapshot kind) are skipped.
+
+        Parameters
+        ----------
+        bot : discord.Bot
+            The bot.
+        game_class : type[ThreadedGame]
+            The type of game to restore.
+
+        Returns
+        -------
+        list[ThreadedGame]
+            The restored games.
+        """
+        if not game_class.snapshot_kind or game_class.snapshot_kind in cls.rehydrated:
+            return []
+
+        cls.rehydrated.add(game_class.snapshot_kind)
+
+        games = []
+
+        for thread_id, version, data in await asyncio.to_thread(
+            cls._read, game_class.snapshot_kind
+        ):
+            game = None
+
+            # the thread, or anyone in the game, may have disappeared while we were away, and a snapshot may not
+            # restore cleanly for reasons we can't anticipate. either way, the error is logged and the game is
+            # dropped rather than holding up every other game of its type
+            if version == game_class.snapshot_version:
+                try:
+                    thread = bot.get_channel(int(thread_id)) or await bot.fetch_channel(
+                        int(thread_id)
+                    )
+                    game = await game_class.from_snapshot(thread, orjson.loads(data))
+                except Exception:
+                    sys.excepthook(*sys.exc_info())
+                    support.GameRegistry.unregister(int(thread_id))
+
+            if game:
+                game.resume()
+                games.append(game)
+            else:
+                cls.discard(int(thread_id))
+
+        return games
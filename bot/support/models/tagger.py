@@ -0,0 +1,105 @@
+########################################################################################################################
+#                         Copyright (C) 2023-present celsius narhwal <hello@celsiusnarhwal.dev>                        #
+#  This notice may not be altered or removed except by or with the express written permission of the copyright holder. #
+#                                      For more information, see the COPYING file.                                     #
+########################################################################################################################
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import nltk
+from nltk.tag.perceptron import PerceptronTagger
+
+from keyboard import *
+
+__all__ = ["Tagger"]
+
+
+class Tagger:
+    """
+    NLTK's part-of-speech tagger, loaded once and shared.
+
+    :func:`nltk.pos_tag` loads the tagger's model from disk every time it's called, which takes far longer than the
+    tagging itself. This class loads it once — during startup, in a worker thread — and keeps it.
+
+    Until the tagger has loaded, :meth:`ready` is False. Code that needs the tagger should :meth:`wait` for it and be
+    prepared to do without it if it doesn't load in time.
+    """
+
+    resource: ClassVar[str] = "taggers/averaged_perceptron_tagger_eng/"
+
+    tagger: ClassVar[PerceptronTagger] = None
+    load_time: ClassVar[float] = None
+    loaded: ClassVar[threading.Event] = threading.Event()
+
+    @classmethod
+    def installed(cls) -> bool:
+        """
+        Whether the tagger's model is installed.
+        """
+        try:
+            nltk.data.find(cls.resource)
+        except LookupError:
+            return False
+        else:
+            return True
+
+    @classmethod
+    def load(cls):
+        """
+        Load the tagger. This blocks, so it should be run in a worker thread.
+
+        Raises
+        ------
+        LookupError
+            If the tagger's model isn't installed.
+        """
+        start = time.perf_counter()
+
+        try:
+            cls.tagger = PerceptronTagger()
+            cls.load_time = time.perf_counter() - start
+        finally:
+            cls.loaded.set()
+
+    @classmethod
+    def ready(cls) -> bool:
+        """
+        Whether the tagger has loaded.
+        """
+        return cls.tagger is not None
+
+    @classmethod
+    async def wait(cls, timeout: float) -> bool:
+        """
+        Wait for the tagger to finish loading.
+
+        Parameters
+        ----------
+        timeout : float
+            The maximum number of seconds to wait.
+
+        Returns
+        -------
+        bool
+            Whether the tagger is ready.
+        """
+        if not cls.loaded.is_set():
+            await asyncio.to_thread(cls.loaded.wait, timeout)
+
+        return cls.ready()
+
+    @classmethod
+    def tag_sents(cls, sentences: Iterable[list[str]]) -> list[list[tuple[str, str]]]:
+        """
+        Tag the words in each of several sentences with their parts of speech.
+
+        Parameters
+        ----------
+        sentences : Iterable[list[str]]
+            The sentences, as lists of words.
+        """
+        return [cls.tagger.tag(sentence) for sentence in sentences]
@@ -7,14 +7,20 @@
 """
 Kurisu, 3515.games' development CLI, provides command-line shortcuts for common development tasks.
 """
+import asyncio
 import builtins
+import copy
+import importlib.util
 import json
 import os
 import pathlib
 import platform
 import re
+import statistics
 import subprocess
 import textwrap
+import time
+import uuid
 from difflib import SequenceMatcher
 from enum import StrEnum, auto
 from importlib import metadata
@@ -24,7 +30,9 @@ import discord.utils
 import git
 import inflect as ifl
 import marko
+import orjson
 import pendulum
+import pydantic
 import pyperclip
 import requests
 import semver
@@ -82,6 +90,178 @@ class DocSite(StrEnum):
         }[self]
 
 
+@app.command(name="bench")
+def bench(
+    tasks: int = typer.Option(
+        1000, "--tasks", "-t", help="The number of tasks to run concurrently."
+    ),
+    switches: int = typer.Option(
+        100,
+        "--switches",
+        "-s",
+        help="The number of times each task yields to the event loop.",
+    ),
+    nested: bool = typer.Option(
+        False,
+        "--nested",
+        help="Patch the event loop with nest_asyncio first, as 3515.games once did.",
+    ),
+):
+    """
+    Measure how many task switches per second the event loop can make.
+    """
+
+    async def worker():
+        for _ in range(switches):
+            await asyncio.sleep(0)
+
+    async def run() -> float:
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(tasks)))
+        return time.perf_counter() - start
+
+    if nested:
+        import nest_asyncio
+
+        nest_asyncio.apply(loop := asyncio.new_event_loop())
+        elapsed = loop.run_until_complete(run())
+        loop.close()
+    else:
+        elapsed = asyncio.run(run())
+
+    print(
+        f"{LogSymbols.INFO} {tasks * switches:,} task switches in {elapsed:.3f} seconds "
+        f"([bold]{tasks * switches / elapsed:,.0f}[/] per second)"
+    )
+
+
+@app.command(name="bench-cards")
+def bench_cards(
+    rounds: int = typer.Option(
+        5, "--rounds", "-r", help="The number of times to run each ingestion path."
+    ),
+):
+    """
+    Compare how long it takes to ingest every selectable Cards Against Humanity pack columnarly versus card by card.
+    """
+    from ordered_set import OrderedSet
+    from pydantic import BaseModel, validator
+
+    spec = importlib.util.spec_from_file_location(
+        "corpus", Routes.bot() / "cogs" / "cah" / "corpus.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    corpus = module.CAHCorpus
+
+    # these are the per-card models that decks were built from before cards were stored columnarly
+    class BlackCard(BaseModel):
+        class Config:
+            frozen = True
+
+        text: str
+        pick: int
+
+        @validator("text")
+        def normalize_text(cls, v):
+            if "_" not in v:
+                v += " _"
+
+            return discord.utils.escape_markdown(v.replace("_", "_" * 5))
+
+    class WhiteCard(BaseModel):
+        class Config:
+            frozen = True
+
+        text: Optional[str]
+        uuid: str = pydantic.Field(default_factory=lambda: uuid.uuid4().hex)
+
+        @validator("text", pre=True)
+        def normalize(cls, v):
+            if len(normalized := re.sub(r"\b$", ".", v[0].upper() + v[1:])) <= 60:
+                return normalized
+
+    def per_card(body: bytes):
+        data = json.loads(body)
+        black = OrderedSet(BlackCard(**card) for card in data["black"])
+        white = OrderedSet(filter(None, (WhiteCard(**card) for card in data["white"])))
+        return black, white, copy.deepcopy((black, white))
+
+    with Halo(text="Loading cards...", spinner="dots") as spinner:
+        if bundled := corpus.bundled():
+            bodies = [
+                orjson.dumps(
+                    {
+                        "black": [
+                            {"text": text, "pick": pick}
+                            for text, pick in bundled.black(pack)
+                        ],
+                        "white": [{"text": text} for text in bundled.white(pack)],
+                    }
+                )
+                for pack in bundled.packs
+            ]
+        else:
+            bodies = []
+
+            for pack in corpus.pack_names():
+                spinner.text = f"Downloading {pack}..."
+                resp = requests.get(corpus.API_URL, params={"packs": pack}, timeout=30)
+                resp.raise_for_status()
+                bodies.append(resp.content)
+
+        spinner.stop()
+
+    def measure(ingest: Callable[[bytes], Any]) -> float:
+        times = []
+
+        for _ in range(rounds):
+            start = time.perf_counter()
+
+            for body in bodies:
+                ingest(body)
+
+            times.append(time.perf_counter() - start)
+
+        return statistics.median(times)
+
+    cards = sum(
+        len(data["black"]) + len(data["white"]) for data in map(orjson.loads, bodies)
+    )
+    legacy = measure(per_card)
+    columnar = measure(module.CAHPack.from_json)
+
+    print(
+        f"{LogSymbols.INFO} {cards:,} cards from {len(bodies)} packs (median of {rounds} rounds)\n"
+        f"  Card by card: {legacy:.3f} seconds\n"
+        f"  Columnar: {columnar:.3f} seconds ([bold]{legacy / columnar:.1f}x[/] faster)"
+    )
+
+
+@app.command(name="cards")
+def cards():
+    """
+    Build the Cards Against Humanity card file from every pack in REST Against Humanity's catalog.
+    """
+    # loading the module straight from its file keeps the rest of the bot from being imported along with it
+    spec = importlib.util.spec_from_file_location(
+        "corpus", Routes.bot() / "cogs" / "cah" / "corpus.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    corpus = module.CAHCorpus
+
+    with Halo(text="Downloading cards...", spinner="dots") as spinner:
+
+        def progress(pack: str):
+            spinner.text = f"Downloading {pack}..."
+
+        corpus.build(progress=progress)
+        spinner.succeed(f"Cards saved to {corpus.bundled_path()}")
+
+
 @app.command(name="check")
 def check():
     """
@@ -507,6 +687,124 @@ def portal():
     )
 
 
+@app.command(name="puzzles", no_args_is_help=True)
+def puzzles(
+    source: pathlib.Path = typer.Argument(
+        ...,
+        exists=True,
+        dir_okay=False,
+        help="A decompressed copy of the Lichess puzzle database (https://database.lichess.org/#puzzles).",
+        show_default=False,
+    ),
+    limit: int = typer.Option(
+        None, "--limit", "-l", help="The maximum number of puzzles to include."
+    ),
+):
+    """
+    Build the chess puzzle file from the Lichess puzzle database.
+    """
+    # loading the module straight from its file keeps the rest of the bot from being imported along with it
+    spec = importlib.util.spec_from_file_location(
+        "puzzles", Routes.bot() / "cogs" / "shogi" / "puzzles.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    output = Routes.bot() / "cogs" / "shogi" / "assets" / "puzzles.bin"
+
+    with Halo(text="Packing puzzles...", spinner="dots") as spinner:
+        module.ChessPuzzleIndex.pack_lichess(source, output, limit=limit)
+        spinner.succeed(f"Puzzles saved to {output}")
+
+
+@app.command(name="simulate-cah")
+def simulate_cah(
+    games: int = typer.Option(
+        1000, "--games", "-g", help="The number of games to play."
+    ),
+    players: int = typer.Option(
+        6, "--players", "-p", help="The number of players in each game."
+    ),
+    points: int = typer.Option(
+        10, "--points", help="The number of points required to win each game."
+    ),
+    popular: bool = typer.Option(
+        None, "--popular", help="Decide rounds by popular vote instead of by Card Czar."
+    ),
+    seed: int = typer.Option(0, "--seed", "-s", help="The seed for the simulation."),
+    timeouts: float = typer.Option(
+        0.05,
+        "--timeouts",
+        "-t",
+        help="The probability that a player doesn't act before their time runs out.",
+    ),
+):
+    """
+    Play Cards Against Humanity games against itself, without Discord, and report how fast it went.
+    """
+    from cogs.cah.engine import CAHSimulator
+
+    simulator = CAHSimulator.bundled(
+        players=players,
+        points_to_win=points,
+        use_czar=not popular,
+        timeout_rate=timeouts,
+    )
+
+    with Halo(text="Simulating...", spinner="dots") as spinner:
+        results = simulator.run(games, seed=seed)
+        spinner.stop()
+
+    print(
+        f"{LogSymbols.INFO} {results.games:,} games, {results.rounds:,} rounds, and {results.events:,} events in "
+        f"{results.elapsed:.3f} seconds ([bold]{results.rounds_per_second:,.0f}[/] rounds per second)\n"
+        f"  White cards drawn: {results.draws:,}\n"
+        f"  Submissions composed: {results.compositions:,}"
+    )
+
+
+@app.command(name="simulate-uno")
+def simulate_uno(
+    games: int = typer.Option(
+        1000, "--games", "-g", help="The number of games to play."
+    ),
+    players: int = typer.Option(
+        4, "--players", "-p", help="The number of players in each game."
+    ),
+    points: int = typer.Option(
+        500, "--points", help="The number of points required to win each game."
+    ),
+    seed: int = typer.Option(0, "--seed", "-s", help="The seed for the simulation."),
+    timeouts: float = typer.Option(
+        0.01,
+        "--timeouts",
+        "-t",
+        help="The probability that a player doesn't act before their time runs out.",
+    ),
+):
+    """
+    Play UNO games against itself, without Discord, and report how fast it went.
+    """
+    from cogs.uno.engine import UnoSimulator
+
+    simulator = UnoSimulator(
+        players=players, points_to_win=points, timeout_rate=timeouts
+    )
+
+    with Halo(text="Simulating...", spinner="dots") as spinner:
+        results = simulator.run(games, seed=seed)
+        spinner.stop()
+
+    print(
+        f"{LogSymbols.INFO} {results.games:,} games, {results.rounds:,} rounds, and {results.turns:,} turns in "
+        f"{results.elapsed:.3f} seconds ([bold]{results.turns_per_second:,.0f}[/] turns per second, "
+        f"{results.games_per_minute:,.0f} games per minute)\n"
+        f"  Cards played: {results.cards_played:,}\n"
+        f"  Cards drawn: {results.cards_drawn:,}\n"
+        f"  Callouts: {results.callouts:,}"
+    )
+
+
 @app.command(name="sync")
 def sync():
     """